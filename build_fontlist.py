@@ -0,0 +1,23 @@
+import os
+import sys
+
+from PySide6.QtWidgets import QApplication
+
+import main_codex1
+
+
+def build_fontlist():
+    # QFontDatabase 사용을 위해 QApplication이 먼저 필요
+    app = QApplication.instance() or QApplication(sys.argv)
+
+    font_manager = main_codex1.SystemFontManager()
+    main_codex1._wait_for_font_scan(app, font_manager)
+
+    static_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'static')
+    os.makedirs(static_dir, exist_ok=True)
+    out_path = os.path.join(static_dir, main_codex1._precomputed_fontlist_name())
+    font_manager.export_font_list(out_path)
+    print(f"Font list written to {out_path} ({len(font_manager.font_map)} names)")
+
+if __name__ == "__main__":
+    build_fontlist()
@@ -3,12 +3,14 @@ import os
 import re
 import copy
 import difflib
+import functools
 import importlib
 import builtins
 import uuid
 import math
 import webbrowser
-from collections import Counter
+import threading
+from collections import Counter, OrderedDict, namedtuple
 from typing import Optional, Tuple
 
 # Editor build marker for sync/debug
@@ -16,24 +18,27 @@ __EDITOR_BUILD__ = "main_codex1.py patched for font embedding + hover @ 2025-09-
 from PySide6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, 
     QPushButton, QLabel, QFileDialog, QDialog, QLineEdit, 
-    QFontComboBox, QCheckBox, QDialogButtonBox, QFormLayout, QMessageBox,
+    QCheckBox, QDialogButtonBox, QFormLayout, QMessageBox,
     QScrollArea, QFrame, QSizePolicy, QListWidget, QListWidgetItem, QColorDialog,
-    QProgressDialog, QGraphicsColorizeEffect, QSplashScreen, QSpinBox, QTextEdit
+    QProgressDialog, QGraphicsColorizeEffect, QSplashScreen, QSpinBox, QTextEdit,
+    QGroupBox, QGridLayout, QComboBox, QCompleter
 )
 from PySide6.QtWidgets import QDoubleSpinBox
 from PySide6.QtGui import (
     QPixmap, QImage, QFont, QPainter, QPen, QColor, QBrush,
     QFontDatabase, QPalette, QIntValidator, QDragEnterEvent, QDropEvent, QFontMetrics,
-    QRawFont, QFontInfo, QFontMetricsF, QAction
+    QRawFont, QFontInfo, QFontMetricsF, QAction, QPainterPath, QStaticText
 )
 from PySide6.QtCore import (
     Qt, Signal, QPoint, QPointF, QTimer, QSize, QPropertyAnimation, 
-    QRect, QRectF, QEasingCurve, QObject, QBuffer, QByteArray, QSettings, QVariantAnimation
+    QRect, QRectF, QEasingCurve, QObject, QBuffer, QByteArray, QSettings, QVariantAnimation,
+    QThread, QStringListModel, QSignalBlocker
 )
 import fitz  # PyMuPDF
 from fontTools.ttLib import TTFont
 import json
 import zipfile
+from urllib.parse import quote_plus
 
 # Console encoding guard (ignore unsupported characters on stdout/stderr)
 def _configure_stream(stream):
@@ -50,6 +55,116 @@ _configure_stream(getattr(sys, 'stderr', None))
 _orig_print = builtins.print
 print = _orig_print  # type: ignore
 
+# 개발용 상세 로그 스위치 (YONGPDF_VERBOSE=1): 마우스/페인트 핫패스의 디버그 출력은 이 값으로만 활성화
+_VERBOSE = os.environ.get("YONGPDF_VERBOSE", "").strip() not in ("", "0")
+
+
+def _vlog(*args) -> None:
+    """YONGPDF_VERBOSE일 때만 출력하는 디버그 print (호버/방향키/미리보기 등 핫패스용)"""
+    if _VERBOSE:
+        print(*args)
+
+
+# --- Font name normalization patterns -----------------------------------
+
+_RE_BRACKETS = re.compile(r"[,\(\)\[\]]")
+_RE_SUFFIX = re.compile(r"\b(MT|PS|Std|Pro|LT|Roman)\b", re.I)
+_RE_WS = re.compile(r"\s+")
+_RE_ALNUM = re.compile(r'[^a-z0-9]+')
+_RE_ALNUM_HANGUL = re.compile(r'[^a-z0-9가-힣]')
+_RE_HANGUL = re.compile(r'[가-힣]')
+_RE_HANGUL_OR_JAMO = re.compile(r'[가-힣ㄱ-ㅣ]')
+# 폰트 설치 안내 검색어에서 굵기/스타일 어미 제거
+_RE_FONT_STYLE_SUFFIX = re.compile(
+    r'[\s\-_]*(Bold|Italic|Medium|Light|Regular|Thin|Black|Extra|Heavy|Semi|Demi|Static|Condensed|Narrow|ExtraBold|ExtraLight|UltraLight|SemiBold|DemiBold)+$',
+    re.IGNORECASE,
+)
+
+_TABLE_STRIP_SPACE = str.maketrans('', '', ' ')
+_TABLE_STRIP_DASH = str.maketrans('', '', '-')
+_TABLE_STRIP_UNDERSCORE = str.maketrans('', '', '_')
+_TABLE_STRIP_SPACE_DASH = str.maketrans('', '', ' -')
+_TABLE_DASH_TO_SPACE = str.maketrans('-', ' ')
+_TABLE_SPACE_TO_DASH = str.maketrans(' ', '-')
+
+
+def _name_variants(name: str, *, keep_hangul: bool = False) -> tuple[str, ...]:
+    """폰트명/파일명의 검색용 변형 키를 중복 없이 반환.
+    keep_hangul=True: 폰트명용 (공백/하이픈 치환, 한글 유지)
+    keep_hangul=False: 파일명용 (공백/하이픈/언더바 제거, 영숫자만)
+    """
+    lower = name.lower()
+    if keep_hangul:
+        variants = (
+            lower,
+            lower.translate(_TABLE_STRIP_SPACE),
+            lower.translate(_TABLE_DASH_TO_SPACE),
+            lower.translate(_TABLE_SPACE_TO_DASH),
+            _RE_ALNUM_HANGUL.sub('', lower),
+        )
+    else:
+        variants = (
+            lower,
+            lower.translate(_TABLE_STRIP_SPACE),
+            lower.translate(_TABLE_STRIP_DASH),
+            lower.translate(_TABLE_STRIP_UNDERSCORE),
+            _RE_ALNUM.sub('', lower),
+        )
+    return tuple(dict.fromkeys(v for v in variants if v))
+
+
+def _read_font_name_records(font_path: str) -> list:
+    """name 테이블만 지연 로드하여 레코드 목록 반환 (다른 테이블은 파싱하지 않음)"""
+    font = TTFont(
+        font_path,
+        fontNumber=0,
+        lazy=True,
+        recalcBBoxes=False,
+        recalcTimestamp=False,
+        ignoreDecompileErrors=True
+    )
+    try:
+        return list(font['name'].names)
+    finally:
+        font.close()
+
+
+_FONT_FILE_EXTENSIONS = ('.ttf', '.otf', '.ttc')
+
+
+def _iter_font_files(root: str, visited: Optional[set] = None):
+    """os.scandir 기반 반복 탐색으로 폰트 파일 경로를 생성 (숨김 디렉터리/심볼릭 링크 디렉터리 제외).
+    visited를 넘기면 (st_dev, st_ino) 기준으로 이미 탐색한 디렉터리는 건너뛴다."""
+    stack = [root]
+    while stack:
+        dir_path = stack.pop()
+        if visited is not None:
+            try:
+                st = os.stat(dir_path)
+            except OSError:
+                continue
+            if st.st_ino:
+                dir_key = (st.st_dev, st.st_ino)
+                if dir_key in visited:
+                    continue
+                visited.add(dir_key)
+        try:
+            with os.scandir(dir_path) as entries:
+                for entry in entries:
+                    name = entry.name
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            if not name.startswith('.'):
+                                stack.append(entry.path)
+                            continue
+                    except OSError:
+                        continue
+                    if name.lower().endswith(_FONT_FILE_EXTENSIONS):
+                        yield entry.path
+        except OSError:
+            # 접근 불가 하위 디렉터리는 os.walk와 동일하게 건너뜀
+            continue
+
 # --- Splash utilities ----------------------------------------------------
 
 def _rect_to_tuple(rect):
@@ -59,8 +174,13 @@ def _rect_to_tuple(rect):
         return (float(rect.x0), float(rect.y0), float(rect.x1), float(rect.y1))
     except Exception: return None
 
+@functools.lru_cache(maxsize=64)
 def _resolve_static_path(*relative_parts: str) -> str:
-    """Locate a static resource in both source and frozen bundles."""
+    """Locate a static resource in both source and frozen bundles.
+
+    Results are memoized; the directory walk only runs when no direct
+    candidate (bundle/module/Resources root, ``static``/``Assets``) exists.
+    """
     candidates: list[str] = []
     try:
         module_dir = os.path.dirname(os.path.abspath(__file__))
@@ -82,6 +202,7 @@ def _resolve_static_path(*relative_parts: str) -> str:
             continue
         candidates.append(root)
         candidates.append(os.path.join(root, 'static'))
+        candidates.append(os.path.join(root, 'Assets'))
 
     seen: set[str] = set()
     for base in candidates:
@@ -111,41 +232,52 @@ def _resolve_static_path(*relative_parts: str) -> str:
     return os.path.normpath(os.path.join(module_dir, *relative_parts))
 
 
+_SPLASH_PIXMAP: Optional[QPixmap] = None
+
+
+@functools.lru_cache(maxsize=1)
+def _splash_fonts() -> tuple[QFont, QFont, QFont]:
+    """스플래시용 (제목, 부제, 저작권) 폰트를 한 번만 생성"""
+    title_font = QFont('Arial', 17)
+    title_font.setBold(True)
+    return title_font, QFont('Arial', 8), QFont('Arial', 7)
+
+
 def _build_text_splash_pixmap() -> Optional[QPixmap]:
+    global _SPLASH_PIXMAP
+    if _SPLASH_PIXMAP is not None:
+        return _SPLASH_PIXMAP
+
     width, height = 448, 370
     pixmap = QPixmap(width, height)
     if pixmap.isNull():
         return None
 
     pixmap.fill(QColor('#080b10'))
+    title_font, subtitle_font, copyright_font = _splash_fonts()
 
     painter = QPainter(pixmap)
     try:
         painter.setRenderHint(QPainter.RenderHint.Antialiasing)
         painter.setRenderHint(QPainter.RenderHint.TextAntialiasing)
 
-        logo_path = _resolve_static_path('YongPDF_text_img.png')
-        if logo_path:
-            logo = QPixmap(logo_path)
-            if not logo.isNull():
-                target_size = min(int(220 * 0.8), width - 96)
-                scaled = logo.scaled(
-                    target_size,
-                    target_size,
-                    Qt.AspectRatioMode.KeepAspectRatio,
-                    Qt.TransformationMode.SmoothTransformation
-                )
-                logo_x = (width - scaled.width()) // 2
-                painter.drawPixmap(logo_x, 32, scaled)
+        logo = _load_static_pixmap('YongPDF_text_img.png')
+        if logo is not None:
+            target_size = min(int(220 * 0.8), width - 96)
+            scaled = logo.scaled(
+                target_size,
+                target_size,
+                Qt.AspectRatioMode.KeepAspectRatio,
+                Qt.TransformationMode.SmoothTransformation
+            )
+            logo_x = (width - scaled.width()) // 2
+            painter.drawPixmap(logo_x, 32, scaled)
 
         painter.setPen(QColor('#f4f4f4'))
-        title_font = QFont('Arial', 17)
-        title_font.setBold(True)
         painter.setFont(title_font)
         painter.drawText(QRect(0, 232, width, 28), Qt.AlignmentFlag.AlignHCenter, 'YongPDF')
 
         painter.setPen(QColor('#c0c7d1'))
-        subtitle_font = QFont('Arial', 8)
         painter.setFont(subtitle_font)
         lines = [
             '정교한 PDF 텍스트 편집기',
@@ -158,7 +290,6 @@ def _build_text_splash_pixmap() -> Optional[QPixmap]:
             top += 21
 
         painter.setPen(QColor('#8a94a3'))
-        copyright_font = QFont('Arial', 7)
         painter.setFont(copyright_font)
         painter.drawText(
             QRect(0, height - 30, width, 18),
@@ -168,6 +299,7 @@ def _build_text_splash_pixmap() -> Optional[QPixmap]:
     finally:
         painter.end()
     
+    _SPLASH_PIXMAP = pixmap
     return pixmap
 
 
@@ -184,7 +316,7 @@ def _show_startup_splash(app: QApplication) -> Optional[QSplashScreen]:
     splash = QSplashScreen(pixmap, Qt.WindowType.FramelessWindowHint | Qt.WindowType.WindowStaysOnTopHint)
     splash.setAttribute(Qt.WidgetAttribute.WA_TranslucentBackground, False)
     try:
-        splash.setFont(QFont('Arial', 8))
+        splash.setFont(_splash_fonts()[1])
     except Exception:
         pass
     splash.show()
@@ -199,6 +331,19 @@ def _show_startup_splash(app: QApplication) -> Optional[QSplashScreen]:
     return splash
 
 
+def _name_bigrams(text: str) -> set[str]:
+    """부분 매칭 후보 축소용 2글자 shingle 집합"""
+    return {text[i:i + 2] for i in range(len(text) - 1)}
+
+
+def _wait_for_font_scan(app: QApplication, font_manager) -> None:
+    """백그라운드 폰트 스캔이 끝날 때까지 이벤트를 처리하며 대기 (스플래시 응답성 유지)"""
+    while not font_manager.wait_ready(0.05):
+        app.processEvents()
+    # 스캔 중 addApplicationFont로 등록된 패밀리 반영 - 패밀리 캐시는 GUI 스레드 소유이므로 여기서 무효화
+    TextOverlay._invalidate_family_cache()
+
+
 def _load_static_pixmap(filename: str) -> Optional[QPixmap]:
     try:
         path = _resolve_static_path(filename)
@@ -212,37 +357,64 @@ def _load_static_pixmap(filename: str) -> Optional[QPixmap]:
     return pixmap
 
 # --- Enhanced Font Utilities ---
+@functools.lru_cache(maxsize=1)
+def _qt_font_families() -> tuple[str, ...]:
+    """QFontDatabase 패밀리 목록 (프로세스당 한 번 조회, 폰트 재스캔 시 cache_clear로 갱신)"""
+    return tuple(QFontDatabase.families())
+
+
+_FAMILY_NORM_RE = re.compile(r'[^0-9a-z가-힣]+')
+_HWP_SPACE_SPLIT_RE = re.compile(r'( +)')
+
+
+@functools.lru_cache(maxsize=512)
+def _normalize_family(name: str) -> str:
+    """패밀리명 비교용 정규화 (대소문자/공백/기호 무시)"""
+    return _FAMILY_NORM_RE.sub('', (name or '').lower())
+
+
 class FontMatcher:
-    def __init__(self):
-        # 시스템에 설치된 폰트 목록 수집 (matplotlib 방식)
-        self.system_fonts = []
-        fm_mod = None
-        try:
-            fm_mod = importlib.import_module('matplotlib.font_manager')
-        except Exception:
-            fm_mod = None
+    def __init__(self, extra_names=()):
+        # 시스템 폰트 목록: QFontDatabase 한 번 조회 + 디렉토리 스캔 결과(font_map) 병합
+        # (스캔 스레드에서 생성되므로 GUI 스레드 소유의 _qt_font_families 캐시는 건드리지 않음)
+        names = set(QFontDatabase.families())
+        names.update(extra_names)
+        # matplotlib 전용으로 등록된 폰트가 필요한 경우에만 설정으로 재활성화 (느림)
+        if self._matplotlib_scan_enabled():
+            names.update(self._matplotlib_font_names())
 
-        if fm_mod:
-            try:
-                font_paths = fm_mod.findSystemFonts()
-                for font_path in font_paths:
-                    try:
-                        font_prop = fm_mod.FontProperties(fname=font_path)
-                        font_name = font_prop.get_name()
-                        if font_name:
-                            self.system_fonts.append(font_name)
-                    except Exception:
-                        continue
-            except Exception:
-                pass
-        
-        # QFontDatabase로 추가 폰트 수집 (deprecation 해결)
-        qt_fonts = QFontDatabase.families()
-        self.system_fonts.extend(qt_fonts)
-        
         # 중복 제거 및 정렬
-        self.system_fonts = sorted(list(set(self.system_fonts)))
+        self.system_fonts = sorted(name for name in names if name)
         print(f"Found {len(self.system_fonts)} system fonts")
+
+    @staticmethod
+    def _matplotlib_scan_enabled() -> bool:
+        try:
+            value = QSettings('yongpdf', 'main-codex1').value('font_scan_matplotlib', False)
+        except Exception:
+            return False
+        if isinstance(value, str):
+            return value.strip().lower() in ('1', 'true', 'yes', 'on')
+        return bool(value)
+
+    @staticmethod
+    def _matplotlib_font_names() -> list:
+        try:
+            fm_mod = importlib.import_module('matplotlib.font_manager')
+        except Exception:
+            return []
+        font_names = []
+        try:
+            for font_path in fm_mod.findSystemFonts():
+                try:
+                    font_name = fm_mod.FontProperties(fname=font_path).get_name()
+                    if font_name:
+                        font_names.append(font_name)
+                except Exception:
+                    continue
+        except Exception:
+            pass
+        return font_names
     
     def find_best_match(self, pdf_font_name: str):
         """PDF 폰트명과 가장 유사한 시스템 폰트 찾기"""
@@ -254,11 +426,9 @@ class FontMatcher:
             return pdf_font_name
         
         # difflib를 사용한 유사도 매칭
-        best_match = difflib.get_close_matches(
-            pdf_font_name, self.system_fonts, n=1, cutoff=0.3
-        )
+        best_match = self._best_close_match(pdf_font_name, self.system_fonts, cutoff=0.3)
         if best_match:
-            return best_match[0]
+            return best_match
         
         # 부분 매칭
         pdf_lower = pdf_font_name.lower()
@@ -268,24 +438,220 @@ class FontMatcher:
         
         return None
 
+    @staticmethod
+    def _best_close_match(word: str, possibilities, cutoff: float = 0.3):
+        """difflib.get_close_matches(n=1)과 같은 결과를 반환하되,
+        현재 최고 점수를 하한으로 삼아 real_quick_ratio/quick_ratio 상한으로 조기 탈락시킨다."""
+        matcher = difflib.SequenceMatcher()
+        matcher.set_seq2(word)
+        best_score, best = cutoff, None
+        for candidate in possibilities:
+            matcher.set_seq1(candidate)
+            if matcher.real_quick_ratio() < best_score or matcher.quick_ratio() < best_score:
+                continue
+            score = matcher.ratio()
+            if score < best_score:
+                continue
+            if best is None or (score, candidate) > (best_score, best):
+                best_score, best = score, candidate
+        return best
+
+class FontIndex:
+    """폰트 이름 → 파일 경로 색인.
+    이름/소문자 이름/경로를 같은 인덱스의 병렬 리스트로 보관하고(SoA),
+    이름 → 인덱스 딕셔너리 하나로 조회한다. dict와 같은 방식으로 사용 가능."""
+
+    __slots__ = ('names', 'lower', 'paths', '_by_name')
+
+    def __init__(self):
+        self.names: list[str] = []
+        self.lower: list[str] = []
+        self.paths: list[str] = []
+        self._by_name: dict[str, int] = {}
+
+    def __len__(self):
+        return len(self.names)
+
+    def __contains__(self, name):
+        return name in self._by_name
+
+    def __iter__(self):
+        return iter(self.names)
+
+    def __getitem__(self, name):
+        return self.paths[self._by_name[name]]
+
+    def __setitem__(self, name, path):
+        idx = self._by_name.get(name)
+        if idx is None:
+            self._by_name[name] = len(self.names)
+            self.names.append(name)
+            self.lower.append(name.lower())
+            self.paths.append(path)
+        else:
+            self.paths[idx] = path
+
+    def get(self, name, default=None):
+        idx = self._by_name.get(name)
+        return default if idx is None else self.paths[idx]
+
+    def keys(self):
+        return self.names
+
+    def items(self):
+        return zip(self.names, self.paths)
+
+    def names_containing(self, needle: str):
+        """소문자 이름에 needle이 포함된 폰트명을 등록 순서대로 반환 (조회마다 lower() 재계산 없음)"""
+        names = self.names
+        for idx, lowered in enumerate(self.lower):
+            if needle in lowered:
+                yield names[idx]
+
+_PRECOMPUTED_FONTLIST_VERSION = 1
+
+
+def _precomputed_fontlist_name() -> str:
+    return f'fontlist-{sys.platform}.json'
+
+
+class _FontScanThread(QThread):
+    """SystemFontManager의 초기 시스템 폰트 스캔을 UI 스레드 밖에서 수행"""
+
+    def __init__(self, manager, use_precomputed: bool = True):
+        super().__init__()
+        self._manager = manager
+        self._use_precomputed = use_precomputed
+
+    def run(self):
+        self._manager._scan_system_fonts(self._use_precomputed)
+
+
 class SystemFontManager:
     _instance = None
     def __new__(cls):
         if cls._instance is None:
-            cls._instance = super(SystemFontManager, cls).__new__(cls)
-            cls._instance.font_map = cls._instance._find_system_fonts()
-            cls._instance.font_name_variations = cls._instance._build_font_variations()
-            cls._instance.font_matcher = FontMatcher()
-            cls._instance.font_file_index = cls._instance._build_font_file_index()
-            cls._instance._unmatched_fonts_warned: set[str] = set()
+            instance = super(SystemFontManager, cls).__new__(cls)
+            # 스캔 완료 전까지는 빈 인덱스로 시작 (조회 메서드는 wait_ready로 대기)
+            # 스레드 소유 관계:
+            # - 스캔 스레드가 _ready가 꺼진 동안에만 교체: font_map, font_name_variations, font_file_index,
+            #   font_matcher, _preferred_family_by_path, _variation_* / _short_variations, _match_cache, _sorted_names_cache
+            #   (GUI 스레드의 조회는 wait_ready 이후에만 읽고 _match_cache/_sorted_names_cache/_preferred_family_by_path를 채움)
+            # - GUI 스레드 전용: _unmatched_fonts_warned, _scan_thread, TextOverlay 패밀리 캐시
+            #   (스캔 결과의 패밀리 캐시 반영은 _wait_for_font_scan이 GUI 스레드에서 수행)
+            instance.font_map = FontIndex()
+            instance.font_name_variations = {}
+            instance.font_file_index = {}
+            instance.font_matcher = None
+            instance._preferred_family_by_path = {}
+            instance._variation_bigram_index = {}
+            instance._variation_order = {}
+            instance._short_variations = []
+            instance._unmatched_fonts_warned: set[str] = set()
+            instance._match_cache: dict[str, Optional[str]] = {}
+            instance._sorted_names_cache = (0, ())
+            instance._ready = threading.Event()
+            cls._instance = instance
+            instance._scan_thread = _FontScanThread(instance)
+            instance._scan_thread.start()
         return cls._instance
 
+    def _scan_system_fonts(self, use_precomputed: bool = True):
+        """폰트 스캔 + 변형/파일명 인덱스 구축 (백그라운드 스레드에서 실행)"""
+        try:
+            font_map = self._load_precomputed_font_map() if use_precomputed else None
+            if font_map is None:
+                font_map = self._find_system_fonts()
+            self.font_map = font_map
+            self.font_name_variations = self._build_font_variations()
+            # 데이터만 구축 - TextOverlay 패밀리 캐시 무효화는 GUI 스레드(_wait_for_font_scan)에서 수행
+            self.font_matcher = FontMatcher(self.font_map.keys())
+            self.font_file_index = self._build_font_file_index()
+        except Exception as e:
+            print(f"System font scan failed: {e}")
+        finally:
+            # 스캔이 중간에 실패해도 매처는 항상 준비 (호출부가 None 검사 없이 사용)
+            if self.font_matcher is None:
+                try:
+                    self.font_matcher = FontMatcher(self.font_map.keys())
+                except Exception as e:
+                    print(f"FontMatcher init failed: {e}")
+            self._match_cache = {}
+            self._sorted_names_cache = (0, ())
+            self._ready.set()
+
+    def is_ready(self) -> bool:
+        return self._ready.is_set()
+
+    def rescan(self) -> None:
+        """번들 폰트 목록을 무시하고 시스템 폰트를 다시 스캔 (백그라운드)"""
+        self.wait_ready()
+        if self._scan_thread is not None:
+            self._scan_thread.wait()
+        self._ready.clear()
+        self._scan_thread = _FontScanThread(self, use_precomputed=False)
+        self._scan_thread.start()
+
+    def _load_precomputed_font_map(self) -> Optional[FontIndex]:
+        """배포 번들(PyInstaller)에 포함된 fontlist-{platform}.json으로 스캔을 대체.
+        참조된 파일이 하나라도 없으면 None을 반환해 런타임 스캔으로 폴백한다."""
+        if not getattr(sys, 'frozen', False):
+            return None
+        # 번들 루트의 직접 후보만 확인 (목록이 없는 기본 빌드에서 _resolve_static_path의 번들 전체 탐색 방지)
+        name = _precomputed_fontlist_name()
+        bundle_dir = getattr(sys, '_MEIPASS', None) or os.path.dirname(os.path.abspath(sys.executable))
+        list_path = next((path for path in (os.path.join(bundle_dir, 'static', name), os.path.join(bundle_dir, name))
+                          if os.path.isfile(path)), None)
+        if list_path is None:
+            return None
+        try:
+            with open(list_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get('version') != _PRECOMPUTED_FONTLIST_VERSION:
+                return None
+            fonts = data.get('fonts') or []
+            families = data.get('families') or {}
+        except Exception as e:
+            print(f"Warning: Could not read precomputed font list {list_path}: {e}")
+            return None
+        font_paths = list(dict.fromkeys(path for _, path in fonts))
+        if not font_paths or not all(os.path.isfile(path) for path in font_paths):
+            return None
+        for path in font_paths:
+            QFontDatabase.addApplicationFont(path)
+        font_map = FontIndex()
+        for name, path in fonts:
+            if name and name not in font_map:
+                font_map[name] = path
+        self._preferred_family_by_path = {path: families.get(path) for path in font_paths}
+        print(f"Loaded precomputed font list: {len(font_paths)} files, {len(font_map)} names")
+        return font_map
+
+    def export_font_list(self, out_path: str) -> None:
+        """현재 폰트 맵을 번들용 fontlist JSON으로 저장 (build_fontlist.py에서 사용)"""
+        self.wait_ready()
+        data = {
+            'version': _PRECOMPUTED_FONTLIST_VERSION,
+            'platform': sys.platform,
+            'fonts': [[name, path] for name, path in self.font_map.items()],
+            'families': {path: self._preferred_family_by_path.get(path) for path in dict.fromkeys(self.font_map.paths)},
+        }
+        with open(out_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False)
+
+    def wait_ready(self, timeout: Optional[float] = None) -> bool:
+        """초기 폰트 스캔 완료까지 대기. timeout 내 완료되면 True."""
+        return self._ready.wait(timeout)
+
     def _get_all_names_from_font(self, font_path):
+        """폰트 파일의 name 테이블을 한 번만 읽어 (모든 이름 목록, 대표 Family명) 반환"""
         names = set()
+        family = None
+        full_name = None
         try:
-            font = TTFont(font_path, fontNumber=0)
+            records = _read_font_name_records(font_path)
             names.add(os.path.splitext(os.path.basename(font_path))[0])
-            for record in font['name'].names:
+            for record in records:
                 if record.nameID in [1, 4, 6]:  # Family name, Full name, PostScript name
                     try:
                         name = record.toUnicode()
@@ -294,103 +660,92 @@ class SystemFontManager:
                             # 하이픈과 공백 변형 추가
                             names.add(name.replace('-', ' '))
                             names.add(name.replace(' ', '-'))
+                            # Family 우선, 없으면 첫 Full name
+                            if record.nameID == 1 and family is None:
+                                family = name
+                            elif record.nameID == 4 and full_name is None:
+                                full_name = name
                     except (UnicodeDecodeError, AttributeError):
                         pass
         except Exception as e:
             print(f"Error reading font {font_path}: {e}")
             names.add(os.path.splitext(os.path.basename(font_path))[0])
-        return list(names)
+        return list(names), family or full_name
 
     def _find_system_fonts(self):
-        font_map = {}
-        font_dirs = []
+        font_map = FontIndex()
+        self._preferred_family_by_path: dict[str, Optional[str]] = {}
+        candidate_dirs: list[str] = []
         
         if sys.platform == "darwin":
-            font_dirs = ["/System/Library/Fonts", "/Library/Fonts", os.path.expanduser("~/Library/Fonts")]
+            candidate_dirs = ["/System/Library/Fonts", "/Library/Fonts", os.path.expanduser("~/Library/Fonts")]
         elif sys.platform == "win32":
             # 시스템 폰트 디렉토리
-            font_dirs = [os.path.join(os.environ["SystemRoot"], "Fonts")]
+            candidate_dirs = [os.path.join(os.environ["SystemRoot"], "Fonts")]
             
             # 사용자별 폰트 디렉토리 동적 감지
             if "LOCALAPPDATA" in os.environ:
-                user_fonts_dir = os.path.join(os.environ["LOCALAPPDATA"], "Microsoft", "Windows", "Fonts")
-                font_dirs.append(user_fonts_dir)
+                candidate_dirs.append(os.path.join(os.environ["LOCALAPPDATA"], "Microsoft", "Windows", "Fonts"))
             
             # 추가적으로 사용자 프로필 기반 폰트 디렉토리 감지
             if "USERPROFILE" in os.environ:
-                userprofile_fonts = os.path.join(os.environ["USERPROFILE"], "AppData", "Local", "Microsoft", "Windows", "Fonts")
-                if userprofile_fonts not in font_dirs:
-                    font_dirs.append(userprofile_fonts)
+                candidate_dirs.append(os.path.join(os.environ["USERPROFILE"], "AppData", "Local", "Microsoft", "Windows", "Fonts"))
             
             # 현재 사용자명을 이용한 절대 경로 구성 (fallback)
             if "USERNAME" in os.environ:
-                username = os.environ["USERNAME"]
-                username_fonts_dir = f"C:\\Users\\{username}\\AppData\\Local\\Microsoft\\Windows\\Fonts"
-                if username_fonts_dir not in font_dirs and os.path.exists(username_fonts_dir):
-                    font_dirs.append(username_fonts_dir)
+                candidate_dirs.append(f"C:\\Users\\{os.environ['USERNAME']}\\AppData\\Local\\Microsoft\\Windows\\Fonts")
             
             # 추가적으로 Users 디렉토리의 모든 사용자 폰트 디렉토리를 탐색
             try:
                 users_dir = "C:\\Users"
-                if os.path.exists(users_dir):
+                if os.path.isdir(users_dir):
                     for user_folder in os.listdir(users_dir):
-                        user_fonts_path = os.path.join(users_dir, user_folder, "AppData", "Local", "Microsoft", "Windows", "Fonts")
-                        if os.path.exists(user_fonts_path) and user_fonts_path not in font_dirs:
-                            font_dirs.append(user_fonts_path)
+                        candidate_dirs.append(os.path.join(users_dir, user_folder, "AppData", "Local", "Microsoft", "Windows", "Fonts"))
             except (OSError, PermissionError) as e:
                 print(f"Warning: Could not scan all user font directories: {e}")
             
             # 시스템의 다른 일반적인 폰트 위치들도 확인
-            additional_dirs = [
-                "C:\\Windows\\Fonts",  # SystemRoot와 중복일 수 있지만 안전하게 추가
+            candidate_dirs.extend([
+                "C:\\Windows\\Fonts",  # SystemRoot와 중복일 수 있지만 realpath 중복 제거로 한 번만 탐색
                 os.path.join(os.environ.get("ProgramFiles", "C:\\Program Files"), "Common Files", "Microsoft Shared", "Fonts"),
                 os.path.join(os.environ.get("ProgramFiles(x86)", "C:\\Program Files (x86)"), "Common Files", "Microsoft Shared", "Fonts") if "ProgramFiles(x86)" in os.environ else None
-            ]
-            
-            for additional_dir in additional_dirs:
-                if additional_dir and os.path.exists(additional_dir) and additional_dir not in font_dirs:
-                    font_dirs.append(additional_dir)
+            ])
                     
         else:  # Linux
-            font_dirs = ["/usr/share/fonts", "/usr/local/share/fonts", os.path.expanduser("~/.fonts")]
-            
-            # Linux에서 추가 폰트 디렉토리들
-            additional_linux_dirs = [
+            candidate_dirs = [
+                "/usr/share/fonts",
+                "/usr/local/share/fonts",
+                os.path.expanduser("~/.fonts"),
+                # Linux에서 추가 폰트 디렉토리들
                 "/usr/share/fonts/truetype",
-                "/usr/share/fonts/opentype", 
+                "/usr/share/fonts/opentype",
                 "/usr/local/share/fonts/truetype",
                 "/usr/local/share/fonts/opentype",
-                os.path.expanduser("~/.local/share/fonts")
+                os.path.expanduser("~/.local/share/fonts"),
             ]
-            
-            for additional_dir in additional_linux_dirs:
-                if os.path.exists(additional_dir) and additional_dir not in font_dirs:
-                    font_dirs.append(additional_dir)
         
-        # 중복 제거
-        font_dirs = list(set(font_dirs))
+        # 존재하는 디렉토리만 realpath 기준으로 한 번에 중복 제거 (등록 순서 유지)
+        font_dirs = list(dict.fromkeys(
+            os.path.realpath(d) for d in candidate_dirs if d and os.path.isdir(d)
+        ))
         
         # 디버깅: 폰트 디렉토리 목록 출력
         print(f"Scanning font directories: {len(font_dirs)} paths")
         for font_dir in font_dirs:
-            exists = os.path.exists(font_dir)
-            marker = 'OK' if exists else '!!'
             log_path = font_dir
             try:
                 log_path.encode('ascii')
             except Exception:
                 log_path = font_dir.encode('utf-8', 'ignore').decode('ascii', 'ignore')
-            print(f"  [{marker}] {log_path}")
+            print(f"  [OK] {log_path}")
         
         # 각 디렉토리에서 모든 폰트 파일 수집
         all_font_files = []
+        visited_dirs: set = set()  # 상위/하위 디렉토리가 함께 등록돼도 같은 디렉토리는 한 번만 탐색
         for dir_path in font_dirs:
             if os.path.exists(dir_path):
                 try:
-                    for root, dirs, files in os.walk(dir_path):
-                        for filename in files:
-                            if filename.lower().endswith(('.ttf', '.otf', '.ttc')):
-                                all_font_files.append(os.path.join(root, filename))
+                    all_font_files.extend(_iter_font_files(dir_path, visited_dirs))
                 except (OSError, PermissionError) as e:
                     print(f"Warning: Could not access directory {dir_path}: {e}")
         
@@ -417,7 +772,8 @@ class SystemFontManager:
                 # [개선] 시스템 폰트 데이터베이스에 명시적 등록 (UI 렌더링 누락 방지)
                 QFontDatabase.addApplicationFont(full_path)
                 
-                font_names = self._get_all_names_from_font(full_path)
+                font_names, preferred_family = self._get_all_names_from_font(full_path)
+                self._preferred_family_by_path[full_path] = preferred_family
                 added_any = False
                 for name in font_names:
                     if name and name not in font_map:
@@ -438,19 +794,33 @@ class SystemFontManager:
     def _register_font_variation_entry(self, variations: dict[str, str], font_name: str) -> None:
         """주어진 폰트 이름에 대한 다양한 변형을 variations 딕셔너리에 등록."""
         try:
-            lower = font_name.lower()
+            keys = _name_variants(font_name, keep_hangul=True)
         except Exception:
-            lower = font_name
-        keys = {
-            lower,
-            lower.replace(' ', ''),
-            lower.replace('-', ' '),
-            lower.replace(' ', '-'),
-            re.sub(r'[^a-z0-9가-힣]', '', lower),
-        }
+            keys = (font_name,) if font_name else ()
         for key in keys:
-            if key:
-                variations.setdefault(key, font_name)
+            if key not in variations:
+                variations[key] = font_name
+                self._index_variation_key(key)
+
+    def _index_variation_key(self, key: str) -> None:
+        """부분 매칭용 bigram 역색인에 변형 키 등록 (등록 순서 보존)."""
+        self._variation_order[key] = len(self._variation_order)
+        if len(key) < 2:
+            self._short_variations.append(key)
+            return
+        for bigram in _name_bigrams(key):
+            self._variation_bigram_index.setdefault(bigram, set()).add(key)
+
+    def _partial_match_candidates(self, lower_name: str):
+        """lower_name과 부분 문자열 관계가 가능한 변형 키만 등록 순서대로 반환."""
+        if len(lower_name) < 2:
+            return list(self.font_name_variations.keys())
+        candidates: set[str] = set(self._short_variations)
+        for bigram in _name_bigrams(lower_name):
+            bucket = self._variation_bigram_index.get(bigram)
+            if bucket:
+                candidates.update(bucket)
+        return sorted(candidates, key=self._variation_order.__getitem__)
 
     def _register_font_variations(self, font_name: str, path: Optional[str] = None) -> None:
         """font_name을 variations 및 파일 인덱스에 등록."""
@@ -463,20 +833,16 @@ class SystemFontManager:
     def _build_font_variations(self):
         """폰트 이름의 다양한 변형을 매핑"""
         variations: dict[str, str] = {}
+        self._variation_bigram_index: dict[str, set[str]] = {}
+        self._variation_order: dict[str, int] = {}
+        self._short_variations: list[str] = []
         for font_name in self.font_map.keys():
             self._register_font_variation_entry(variations, font_name)
         return variations
 
-    def _filename_variants(self, path: str) -> set[str]:
-        base = os.path.splitext(os.path.basename(path or ''))[0].lower()
-        variants = {
-            base,
-            base.replace(' ', ''),
-            base.replace('-', ''),
-            base.replace('_', ''),
-            re.sub(r'[^a-z0-9]+', '', base),
-        }
-        return {variant for variant in variants if variant}
+    def _filename_variants(self, path: str) -> tuple[str, ...]:
+        base = os.path.splitext(os.path.basename(path or ''))[0]
+        return _name_variants(base)
 
     def _index_font_filename(self, font_name: str, path: str, index: Optional[dict[str, list[str]]] = None) -> None:
         if not path:
@@ -495,25 +861,12 @@ class SystemFontManager:
         return index
 
     def _filename_candidate_keys(self, *names: str) -> list[str]:
-        keys: list[str] = []
-        seen: set[str] = set()
+        keys: dict[str, None] = {}
         for candidate in names:
             if not candidate:
                 continue
-            base = os.path.splitext(candidate)[0]
-            lower = base.lower()
-            variants = {
-                lower,
-                lower.replace(' ', ''),
-                lower.replace('-', ''),
-                lower.replace('_', ''),
-                re.sub(r'[^a-z0-9]+', '', lower),
-            }
-            for variant in variants:
-                if variant and variant not in seen:
-                    seen.add(variant)
-                    keys.append(variant)
-        return keys
+            keys.update(dict.fromkeys(_name_variants(os.path.splitext(candidate)[0])))
+        return list(keys)
 
     def _finalize_font_name(self, font_name: Optional[str]) -> Optional[str]:
         if not font_name:
@@ -551,25 +904,12 @@ class SystemFontManager:
             print(f"Warning: [{title}] {body}")
 
     def _preferred_family_from_path(self, font_path):
-        try:
-            font = TTFont(font_path, fontNumber=0)
-            family = None
-            for record in font['name'].names:
-                if record.nameID in [1, 4]:  # Family, Full name
-                    try:
-                        name = record.toUnicode()
-                        if name:
-                            # Family 우선
-                            if record.nameID == 1:
-                                family = name
-                                break
-                            if not family:
-                                family = name
-                    except Exception:
-                        continue
-            return family
-        except Exception:
-            return None
+        """스캔 시 함께 읽어 둔 대표 Family명 반환 (미스캔 경로만 파일을 직접 읽음)"""
+        if font_path in self._preferred_family_by_path:
+            return self._preferred_family_by_path[font_path]
+        _, family = self._get_all_names_from_font(font_path)
+        self._preferred_family_by_path[font_path] = family
+        return family
 
     def get_korean_family_name_for_search(self, font_name: str) -> str:
         """눈누 검색용 한글 패밀리명을 최대한 도출한다.
@@ -579,7 +919,7 @@ class SystemFontManager:
         4) 최종 실패 시 정제된 입력명 반환
         """
         try:
-            if any('가' <= ch <= '힣' for ch in font_name or ''):
+            if _RE_HANGUL.search(font_name or ''):
                 return font_name
             # 매칭 시도
             matched = self.find_best_font_match(font_name)
@@ -587,13 +927,12 @@ class SystemFontManager:
             # name 테이블에서 한글 family 찾기
             if path and os.path.exists(path):
                 try:
-                    tt = TTFont(path, fontNumber=0)
                     kor_candidates = []
-                    for record in tt['name'].names:
+                    for record in _read_font_name_records(path):
                         if record.nameID == 1:  # Family
                             try:
                                 nm = record.toUnicode()
-                                if nm and any('가' <= ch <= '힣' for ch in nm):
+                                if nm and _RE_HANGUL.search(nm):
                                     kor_candidates.append(nm)
                             except Exception:
                                 pass
@@ -621,7 +960,7 @@ class SystemFontManager:
                 'noto sans cjk kr': '본고딕',
                 'noto sans kr': '노토 산스 KR',
             }
-            key = (font_name or '').lower().replace(' ', '').replace('-', '')
+            key = (font_name or '').lower().translate(_TABLE_STRIP_SPACE_DASH)
             if key in filename_aliases:
                 return filename_aliases[key]
             ek = (font_name or '').lower()
@@ -634,19 +973,29 @@ class SystemFontManager:
             return font_name or ''
 
     def find_best_font_match(self, pdf_font_name):
-        """PDF의 폰트 이름을 시스템 폰트와 매칭 (개선된 버전)"""
+        """PDF의 폰트 이름을 시스템 폰트와 매칭 (결과는 매칭 실패(None)까지 캐시)"""
         if not pdf_font_name:
             return None
-        
+        self.wait_ready()
+        try:
+            return self._match_cache[pdf_font_name]
+        except KeyError:
+            pass
+        result = self._match_font_name(pdf_font_name)
+        self._match_cache[pdf_font_name] = result
+        return result
+
+    def _match_font_name(self, pdf_font_name):
+        """PDF의 폰트 이름을 시스템 폰트와 매칭 (개선된 버전)"""
         # PDF에서 추출된 폰트명에서 접두사 제거 (예: RJAWXJ+Dotum -> Dotum)
         clean_font_name = pdf_font_name
         if '+' in pdf_font_name:
             clean_font_name = pdf_font_name.split('+')[-1]
         # 추가 정규화: 하위표기 제거 및 특수 접미사 제거
         norm = clean_font_name
-        norm = re.sub(r"[,\(\)\[\]]", " ", norm)   # 괄호/콤마 제거
-        norm = re.sub(r"\b(MT|PS|Std|Pro|LT|Roman)\b", " ", norm, flags=re.I)
-        norm = re.sub(r"\s+", " ", norm).strip()
+        norm = _RE_BRACKETS.sub(" ", norm)   # 괄호/콤마 제거
+        norm = _RE_SUFFIX.sub(" ", norm)
+        norm = _RE_WS.sub(" ", norm).strip()
 
         # 1순위: 시스템 폰트 파일명 기반 매칭
         filename_keys = self._filename_candidate_keys(pdf_font_name, clean_font_name, norm)
@@ -677,7 +1026,7 @@ class SystemFontManager:
                     return finalized
 
         # 새로운 FontMatcher 사용
-        best_match = self.font_matcher.find_best_match(norm)
+        best_match = self.font_matcher.find_best_match(norm) if self.font_matcher else None
         if best_match and best_match in self.font_map:
             finalized = self._finalize_font_name(best_match)
             if finalized:
@@ -690,10 +1039,10 @@ class SystemFontManager:
             if finalized:
                 return finalized
         
-        # 부분 매칭 (정제된 이름으로)
-        for variation, original in self.font_name_variations.items():
+        # 부분 매칭 (정제된 이름으로) - bigram 역색인으로 후보를 먼저 축소
+        for variation in self._partial_match_candidates(lower_name):
             if lower_name in variation or variation in lower_name:
-                finalized = self._finalize_font_name(original)
+                finalized = self._finalize_font_name(self.font_name_variations[variation])
                 if finalized:
                     return finalized
         
@@ -715,21 +1064,27 @@ class SystemFontManager:
                     if finalized:
                         return finalized
                 # 유사한 이름 찾기
-                for font in self.font_map.keys():
-                    if korean_key in font.lower():
-                        finalized = self._finalize_font_name(font)
-                        if finalized:
-                            return finalized
+                for font in self.font_map.names_containing(korean_key):
+                    finalized = self._finalize_font_name(font)
+                    if finalized:
+                        return finalized
         
         # 매칭 실패 - 사용자에게 안내
         self._warn_unmatched_font(norm or pdf_font_name)
         return None
 
     def get_font_path(self, font_name):
+        self.wait_ready()
         return self.font_map.get(font_name)
 
     def get_all_font_names(self):
-        return sorted(self.font_map.keys())
+        """정렬된 폰트명 튜플 (font_map이 늘어난 경우에만 다시 정렬)"""
+        self.wait_ready()
+        count, names = self._sorted_names_cache
+        if count != len(self.font_map):
+            names = tuple(sorted(self.font_map.keys()))
+            self._sorted_names_cache = (len(self.font_map), names)
+        return names
 
 class PdfFontExtractor:
     """PDF에서 사용된 폰트 정보를 추출하는 클래스"""
@@ -744,46 +1099,67 @@ class PdfFontExtractor:
         self.used_fonts.clear()
         font_details = {}
         
+        # 페이지별 결과를 모아 한 번에 병합 (PyMuPDF 문서는 스레드 간 공유가 안전하지 않으므로 순차 처리)
         for page_num in range(len(self.doc)):
-            page = self.doc.load_page(page_num)
-            text_dict = page.get_text("dict")
-            
-            # 페이지에서 사용된 폰트 리스트도 확인
-            try:
-                font_list = page.get_fonts()
-                for font_info in font_list:
-                    font_name = font_info[3] if len(font_info) > 3 else font_info[0]
-                    if font_name:
-                        font_details[font_name] = {
-                            'xref': font_info[0],
-                            'name': font_info[3] if len(font_info) > 3 else font_name,
-                            'type': font_info[1] if len(font_info) > 1 else 'Unknown',
-                            'encoding': font_info[2] if len(font_info) > 2 else 'Unknown'
-                        }
-                        self.used_fonts.add(font_name)
-            except Exception as e:
-                print(f"Error getting font list from page {page_num}: {e}")
-            
-            # 텍스트 분석을 통한 폰트 추출 (기존 로직)
-            for block in text_dict.get("blocks", []):
-                if block.get('type') == 0:  # 텍스트 블록
-                    for line in block.get("lines", []):
-                        for span in line.get("spans", []):
-                            font_name = span.get('font', '')
-                            if font_name:
-                                self.used_fonts.add(font_name)
-                                if font_name not in font_details:
-                                    font_details[font_name] = {
-                                        'xref': 'Unknown',
-                                        'name': font_name,
-                                        'type': 'Text Analysis',
-                                        'encoding': 'Unknown'
-                                    }
+            page_fonts, page_details = self._extract_fonts_from_page(page_num)
+            self.used_fonts.update(page_fonts)
+            for font_name, detail in page_details.items():
+                if detail['type'] == 'Text Analysis':
+                    font_details.setdefault(font_name, detail)
+                else:
+                    font_details[font_name] = detail
         
         # 폰트 세부 정보 저장
         self.font_details = font_details
         return list(self.used_fonts)
     
+    def _extract_fonts_from_page(self, page_num):
+        """단일 페이지의 (폰트명 집합, 폰트 세부 정보) 반환"""
+        page_fonts = set()
+        page_details = {}
+        
+        # 페이지 리소스(XObject 상속 포함)의 폰트 목록으로 추출 - 페이지 로드 불필요
+        font_list = []
+        try:
+            font_list = self.doc.get_page_fonts(page_num, full=True)
+            for font_info in font_list:
+                font_name = font_info[3] if len(font_info) > 3 else font_info[0]
+                if font_name:
+                    page_details[font_name] = {
+                        'xref': font_info[0],
+                        'name': font_info[3] if len(font_info) > 3 else font_name,
+                        'type': font_info[1] if len(font_info) > 1 else 'Unknown',
+                        'encoding': font_info[2] if len(font_info) > 2 else 'Unknown'
+                    }
+                    page_fonts.add(font_name)
+        except Exception as e:
+            print(f"Error getting font list from page {page_num}: {e}")
+        
+        if font_list:
+            return page_fonts, page_details
+        
+        # 리소스 폰트 목록이 비어 있을 때만 텍스트 분석으로 보완 (이미지 블록 제외)
+        try:
+            page = self.doc.load_page(page_num)
+            text_dict = page.get_text("dict", flags=fitz.TEXTFLAGS_TEXT, sort=False)
+        except Exception as e:
+            print(f"Error analysing text fonts on page {page_num}: {e}")
+            return page_fonts, page_details
+        for block in text_dict.get("blocks", []):
+            if block.get('type') == 0:  # 텍스트 블록
+                for line in block.get("lines", []):
+                    for span in line.get("spans", []):
+                        font_name = span.get('font', '')
+                        if font_name:
+                            page_fonts.add(font_name)
+                            page_details.setdefault(font_name, {
+                                'xref': 'Unknown',
+                                'name': font_name,
+                                'type': 'Text Analysis',
+                                'encoding': 'Unknown'
+                            })
+        return page_fonts, page_details
+    
     def get_matched_fonts(self):
         """PDF 폰트와 시스템 폰트 매칭 결과"""
         matched_fonts = []
@@ -804,15 +1180,97 @@ class PdfFontExtractor:
         """매칭 신뢰도 계산"""
         if pdf_font == system_font:
             return 1.0
+        pdf_lower = pdf_font.lower()
+        system_lower = system_font.lower()
+        if pdf_lower == system_lower:
+            return 1.0
         
         # 문자열 유사도 계산
-        similarity = difflib.SequenceMatcher(None, pdf_font.lower(), system_font.lower()).ratio()
+        similarity = difflib.SequenceMatcher(None, pdf_lower, system_lower).ratio()
         return similarity
 
+# PyMuPDF span flags 비트
+_FLAG_ITALIC = 0x02
+_FLAG_UNDERLINE = 0x04
+_FLAG_BOLD = 0x10
+_STYLE_FLAG_KEYS = ((_FLAG_BOLD, 'style_bold'), (_FLAG_ITALIC, 'style_italic'), (_FLAG_UNDERLINE, 'style_underline'))
+
+
+@functools.lru_cache(maxsize=4096)
+def _qcolor_from_int(color_int: int) -> QColor:
+    """PDF sRGB 정수 색상을 QColor로 변환 (값별로 캐시된 인스턴스를 공유하므로 수정하지 말 것)"""
+    if color_int == 0:
+        return QColor(0, 0, 0)  # 기본 검정색
+    return QColor((color_int >> 16) & 0xFF, (color_int >> 8) & 0xFF, color_int & 0xFF)
+
+
+@functools.lru_cache(maxsize=64)
+def _synth_bold_offsets(font_size: float, synth_weight: float) -> tuple[float, ...]:
+    """합성 볼드용 가로 오프셋 목록 (-half ~ +half, 0.05pt 간격)"""
+    offset_factor = (synth_weight - 100.0) / 100.0 * 0.15
+    half_dx = font_size * offset_factor / 2.0
+    step = 0.05
+    offsets = []
+    sx = -half_dx
+    while sx <= half_dx + 0.001:
+        offsets.append(sx)
+        sx += step
+    return tuple(offsets)
+
+
+def _bbox_key(bbox) -> tuple[int, int, int, int]:
+    """bbox 비교/추적용 키 (0.1pt 단위로 반올림한 정수 튜플 - 문자열 포맷 없이 C 레벨 해시)"""
+    return (round(bbox.x0 * 10), round(bbox.y0 * 10), round(bbox.x1 * 10), round(bbox.y1 * 10))
+
+
+@functools.lru_cache(maxsize=128)
+def _font_search_urls(search_name: str) -> tuple[str, str]:
+    """폰트 설치 안내용 (Google, 눈누) 검색 URL"""
+    return (
+        f"https://www.google.com/search?q={quote_plus(f'{search_name} ttf')}",
+        f"https://noonnu.cc/en/index?search={quote_plus(search_name)}",
+    )
+
+
+_ParentDefaults = namedtuple(
+    '_ParentDefaults',
+    'last_patch_color last_use_custom_patch patch_margin is_hwp_doc recent_fonts',
+)
+
+
+def _collect_parent_defaults(parent) -> _ParentDefaults:
+    """편집 대화상자가 부모(MainWindow)에서 읽는 기본값을 한 번에 수집"""
+    return _ParentDefaults(
+        getattr(parent, 'last_patch_color', None),
+        getattr(parent, 'last_use_custom_patch', False),
+        getattr(parent, 'patch_margin', None),
+        getattr(parent, 'is_hwp_doc', False),
+        getattr(parent, 'recent_fonts', None),
+    )
+
+
+def _extract_margin_ratio(source) -> tuple[float, float, float, float]:
+    """패치 여백 설정값(dict / (h, v) / (l, r, t, b) / 단일 값)을 (좌, 우, 상, 하) 비율로 변환"""
+    try:
+        if isinstance(source, dict):
+            return (float(source.get('left', 0.0)), float(source.get('right', 0.0)),
+                    float(source.get('top', 0.0)), float(source.get('bottom', 0.0)))
+        if isinstance(source, (tuple, list)):
+            if len(source) == 4:
+                return (float(source[0]), float(source[1]), float(source[2]), float(source[3]))
+            if len(source) >= 2:
+                return (float(source[0]), float(source[0]), float(source[1]), float(source[1]))
+            return 0.0, 0.0, 0.0, 0.0
+        value = float(source)
+        return value, value, value, value
+    except (TypeError, ValueError):
+        return 0.0, 0.0, 0.0, 0.0
+
+
 class TextEditorDialog(QDialog):
     def __init__(self, span_info, pdf_fonts=None, parent=None):
         super().__init__(parent)
-        self.main_window = parent if isinstance(parent, QMainWindow) else None
+        parent_defaults = _collect_parent_defaults(parent)
         self.overlay_key = (span_info.get('page_num'), span_info.get('overlay_id')) if span_info.get('overlay_id') is not None else None
         
         if parent and hasattr(parent, 't'):
@@ -823,9 +1281,6 @@ class TextEditorDialog(QDialog):
         self.setWindowTitle(self._t('text_editor_title'))
         self.setMinimumSize(500, 350)
         
-        # 추가 위젯 import
-        from PySide6.QtWidgets import QGroupBox, QGridLayout, QComboBox
-        
         # 텍스트 편집 (한글 공백 문제 해결 - 개선된 버전)
         original_text = span_info.get('text', '')
         
@@ -834,40 +1289,22 @@ class TextEditorDialog(QDialog):
             line_text = span_info['line_text']
             span_text = span_info.get('text', '').strip()
             
-            print(f"Processing span: '{span_text}' in line: '{line_text}'")
-            
             # 사각형 선택의 경우 선택된 span 텍스트만 사용 (전체 라인 텍스트 사용 안함)
             # 단, 공백 복원을 위해 주변 컨텍스트는 고려
-            if span_text and span_text in line_text:
-                # span의 위치를 찾아서 앞뒤 공백 포함 여부 확인
-                span_index = line_text.find(span_text)
-                extracted_text = span_text
-                
-                # 앞에 공백이 있는지 확인 (단어 경계 유지)
-                if span_index > 0 and line_text[span_index - 1] == ' ':
-                    extracted_text = ' ' + extracted_text
-                
-                # 뒤에 공백이 있는지 확인 (단어 경계 유지)
-                end_index = span_index + len(span_text)
-                if end_index < len(line_text) and line_text[end_index] == ' ':
-                    extracted_text = extracted_text + ' '
-                
-                normalized_text = extracted_text
-                print(f"Extracted span with context: '{normalized_text}'")
+            # span의 위치를 한 번의 탐색으로 찾아 앞뒤 문맥 분리
+            before, sep, after = line_text.partition(span_text) if span_text else ('', '', '')
+            if sep:
+                # 앞뒤 공백이 있으면 포함 (단어 경계 유지)
+                normalized_text = (' ' if before.endswith(' ') else '') + span_text + (' ' if after.startswith(' ') else '')
             else:
                 # span을 찾을 수 없으면 원본 span 텍스트 사용
                 normalized_text = span_text if span_text else line_text.strip()
-                print(f"Using span text: '{normalized_text}'")
         else:
             # 기본 텍스트 정규화 (연속된 공백을 단일 공백으로)
-            normalized_text = re.sub(r'\s+', ' ', original_text.strip())
-            print(f"Using normalized original: '{normalized_text}'")
+            normalized_text = ' '.join(original_text.split())
         
         self.text_edit = QLineEdit(normalized_text)
-        self.parent_window = parent if isinstance(parent, QMainWindow) else None
-        self._recent_fonts = []
-        if self.parent_window and hasattr(self.parent_window, 'recent_fonts'):
-            self._recent_fonts = [f for f in getattr(self.parent_window, 'recent_fonts', []) if isinstance(f, str) and f.strip()]
+        self._recent_fonts = [f for f in (parent_defaults.recent_fonts or []) if isinstance(f, str) and f.strip()]
         
         # 원본 폰트 정보 저장
         self.original_font_info = {
@@ -876,6 +1313,9 @@ class TextEditorDialog(QDialog):
             'size': span_info.get('size', 12),
             'flags': span_info.get('flags', 0)
         }
+        # 표시/설치 안내에 쓰는 원본 폰트명과 서브셋 접두사(ABCDEF+)를 뗀 이름을 한 번만 계산
+        self._original_font_name = self.original_font_info['pdf_font_name'] or self.original_font_info['font'] or ''
+        self._clean_font_name = self._original_font_name.rsplit('+', 1)[-1]
         
         # 색상 정보 추출
         self.original_color = span_info.get('color', 0)
@@ -887,68 +1327,53 @@ class TextEditorDialog(QDialog):
         self.color_button.setStyleSheet(f"background-color: {self.text_color.name()}")
         self.color_button.clicked.connect(self.choose_color)
         
+        self.font_manager = SystemFontManager()
+        self._install_guide_dialogs: dict[str, QDialog] = {}
+
         # 원본 폰트 정보 표시 레이블
         self.create_original_font_info_section()
         
         # 폰트 선택 (PDF 폰트를 상위에 배치) - QFontComboBox 대신 검색 지원을 위해 QComboBox 사용
-        from PySide6.QtWidgets import QCompleter
         self.font_combo = QComboBox()
         self.font_combo.setEditable(True)
         self.font_combo.setInsertPolicy(QComboBox.InsertPolicy.NoInsert)
         self.font_combo.completer().setCompletionMode(QCompleter.CompletionMode.PopupCompletion)
         self.font_combo.completer().setFilterMode(Qt.MatchFlag.MatchContains)
         
-        font_manager = SystemFontManager()
+        font_manager = self.font_manager
 
         self.all_fonts_label = self._t('font_combo_all_fonts')
-        font_items: list[str] = []
-        seen: set[str] = set()
-
-        def add_font(name: str):
-            if not name:
-                return
-            key = name.strip()
-            key_lower = key.lower()
-            if not key or key_lower in seen:
-                return
-            seen.add(key_lower)
-            font_items.append(key)
-
-        for recent in self._recent_fonts:
-            add_font(recent)
-
         pdf_font_names: list[str] = []
         if pdf_fonts:
             pdf_font_names = [f['system_font'] for f in pdf_fonts if f.get('system_font')]
-            for fam in pdf_font_names:
-                add_font(fam)
-            add_font(self.all_fonts_label)
-        
-        for font in font_manager.get_all_font_names():
-            if font == self.all_fonts_label:
-                continue
-            add_font(font)
-
-        if self.all_fonts_label not in seen:
-            add_font(self.all_fonts_label)
+        font_items, font_item_set, font_model = self._build_font_items(
+            tuple(self._recent_fonts),
+            tuple(pdf_font_names) if pdf_fonts else None,
+            self.all_fonts_label,
+            font_manager.get_all_font_names(),
+        )
 
-        self.font_combo.clear()
-        self.font_combo.addItems(font_items)
+        # 같은 항목 목록이면 모델을 공유 (addItems로 항목마다 모델을 갱신하지 않음)
+        # 모델 교체/초기 선택 중에는 콤보 시그널을 막아 항목별 변경 알림을 생략
+        combo_signal_blocker = QSignalBlocker(self.font_combo)
+        self._font_model = font_model  # 캐시에서 밀려나도 이 콤보가 쓰는 동안 모델 유지
+        self.font_combo.setModel(font_model)
         
         # 최적의 폰트 매칭 및 설치 상태 확인
         pdf_font = span_info.get('font', '')
         best_match = font_manager.find_best_font_match(pdf_font)
-        self.font_available = bool(best_match and best_match in font_items)
+        self.font_available = bool(best_match and best_match in font_item_set)
         
-        if best_match and best_match in font_items:
+        if self.font_available:
             self.font_combo.setCurrentText(best_match)
         else:
             # span에 지정된 폰트가 있으면 우선 설정, 없으면 기본값
             initial_font = span_info.get('font') or (pdf_font_names[0] if pdf_fonts else 'Arial')
-            if initial_font in font_items:
+            if initial_font in font_item_set:
                 self.font_combo.setCurrentText(initial_font)
             elif self._recent_fonts:
                 self.font_combo.setCurrentText(self._recent_fonts[0])
+        combo_signal_blocker.unblock()
         
         # 폰트 설치 안내 버튼
         self.install_font_button = QPushButton(self._t('install_font_button'))
@@ -966,10 +1391,10 @@ class TextEditorDialog(QDialog):
         # 스타일 속성들 (문제 2 해결 - 밑줄 자동 체크 문제 수정)
         font_flags = span_info.get('flags', 0)
         self.bold_checkbox = QCheckBox(self._t('style_bold'))
-        self.bold_checkbox.setChecked(bool(font_flags & 2**4))  # Bold flag
+        self.bold_checkbox.setChecked(bool(font_flags & _FLAG_BOLD))
         
         self.italic_checkbox = QCheckBox(self._t('style_italic'))
-        self.italic_checkbox.setChecked(bool(font_flags & 2**1))  # Italic flag
+        self.italic_checkbox.setChecked(bool(font_flags & _FLAG_ITALIC))
         
         # 밑줄 플래그 정확한 확인 (PyMuPDF 문서 기준)
         self.underline_checkbox = QCheckBox(self._t('style_underline'))
@@ -1016,15 +1441,10 @@ class TextEditorDialog(QDialog):
         self.patch_color_button = QPushButton()
         self.patch_color_button.setFixedSize(50, 30)
         # 부모(MainWindow)에 저장된 최근 패치 색상/사용 여부를 기본값으로 사용
-        default_patch_color = QColor(255, 255, 255)
-        default_use_custom = False
-        try:
-            if hasattr(parent, 'last_patch_color') and isinstance(parent.last_patch_color, QColor):
-                default_patch_color = parent.last_patch_color
-            if hasattr(parent, 'last_use_custom_patch'):
-                default_use_custom = bool(parent.last_use_custom_patch)
-        except Exception:
-            pass
+        default_patch_color = parent_defaults.last_patch_color
+        if not isinstance(default_patch_color, QColor):
+            default_patch_color = QColor(255, 255, 255)
+        default_use_custom = bool(parent_defaults.last_use_custom_patch)
         self.patch_color_button_color = default_patch_color
         self.patch_color_pick_checkbox.setChecked(default_use_custom)
         self.patch_color_button.setStyleSheet(f"background-color: {self.patch_color_button_color.name()}")
@@ -1113,7 +1533,7 @@ class TextEditorDialog(QDialog):
         # 초기값 설정: 오버레이에 저장된 값 우선, 없으면 문서 전체 설정 따름
         if 'hwp_space_mode' in span_info:
             self.hwp_space_checkbox.setChecked(bool(span_info['hwp_space_mode']))
-        elif hasattr(parent, 'is_hwp_doc') and parent.is_hwp_doc:
+        elif parent_defaults.is_hwp_doc:
             self.hwp_space_checkbox.setChecked(True)
         else:
             self.hwp_space_checkbox.setChecked(False)
@@ -1160,21 +1580,6 @@ class TextEditorDialog(QDialog):
         patch_layout.addWidget(QLabel(self._t('patch_color_label') + ':'), 0, 0)
         patch_layout.addLayout(patch_color_row, 0, 1)
 
-        def _extract_margin_ratio(source) -> tuple[float, float, float, float]:
-            try:
-                if isinstance(source, dict):
-                    return (float(source.get('left', 0.0)), float(source.get('right', 0.0)),
-                            float(source.get('top', 0.0)), float(source.get('bottom', 0.0)))
-                if isinstance(source, (tuple, list)):
-                    if len(source) == 4:
-                        return (float(source[0]), float(source[1]), float(source[2]), float(source[3]))
-                    elif len(source) >= 2:
-                        return (float(source[0]), float(source[0]), float(source[1]), float(source[1]))
-                value = float(source)
-                return value, value, value, value
-            except Exception:
-                return 0.0, 0.0, 0.0, 0.0
-
         m_l, m_r, m_t, m_b = 0.0, 0.0, 0.0, 0.0
         # 개별 속성 우선
         if all(k in span_info for k in ['patch_margin_l', 'patch_margin_r', 'patch_margin_t', 'patch_margin_b']):
@@ -1184,8 +1589,8 @@ class TextEditorDialog(QDialog):
             m_b = float(span_info['patch_margin_b'])
         elif 'patch_margin' in span_info:
             m_l, m_r, m_t, m_b = _extract_margin_ratio(span_info.get('patch_margin'))
-        elif hasattr(parent, 'patch_margin'):
-            m_l, m_r, m_t, m_b = _extract_margin_ratio(getattr(parent, 'patch_margin'))
+        elif parent_defaults.patch_margin is not None:
+            m_l, m_r, m_t, m_b = _extract_margin_ratio(parent_defaults.patch_margin)
 
         def _create_margin_spin(initial_value: float) -> QDoubleSpinBox:
             spin = QDoubleSpinBox()
@@ -1253,6 +1658,44 @@ class TextEditorDialog(QDialog):
 
         self.position_adjustment_requested = False
 
+    # (최근 폰트, PDF 폰트, 라벨) -> (전체 폰트명 튜플, 콤보 항목 튜플, 항목 집합, 공유 모델)
+    _font_items_cache: dict = {}
+
+    @classmethod
+    def _build_font_items(cls, recent_fonts: tuple, pdf_font_names: Optional[tuple], all_fonts_label: str, all_font_names: tuple):
+        """폰트 콤보 항목 목록을 구성 (같은 입력이면 대화상자 간에 결과 재사용).
+        all_font_names는 SystemFontManager가 캐시한 튜플이므로 동일 객체 여부로 유효성을 확인한다."""
+        cache_key = (recent_fonts, pdf_font_names, all_fonts_label)
+        cached = cls._font_items_cache.get(cache_key)
+        if cached is not None and cached[0] is all_font_names:
+            return cached[1:]
+
+        # 소문자 키 -> 표시명 (dict 삽입 순서로 우선순위 유지, 대소문자 무시 중복 제거)
+        font_items: dict[str, str] = {}
+        candidates = list(recent_fonts)
+        if pdf_font_names is not None:
+            candidates.extend(pdf_font_names)
+            candidates.append(all_fonts_label)
+        candidates.extend(font for font in all_font_names if font != all_fonts_label)
+        candidates.append(all_fonts_label)
+
+        for name in candidates:
+            if not name:
+                continue
+            key = name.strip()
+            key_lower = key.lower()
+            if key_lower and key_lower not in font_items:
+                font_items[key_lower] = key
+
+        items = tuple(font_items.values())
+        item_set = frozenset(items)
+        # 콤보박스 간 공유되는 읽기 전용 모델 (NoInsert 정책이라 편집으로 항목이 바뀌지 않음)
+        model = QStringListModel(list(items))
+        if len(cls._font_items_cache) >= 32:
+            cls._font_items_cache.clear()
+        cls._font_items_cache[cache_key] = (all_font_names, items, item_set, model)
+        return items, item_set, model
+
     def _on_values_changed(self):
         """설정값이 변경될 때마다 부모 창에 실시간 미리보기 요청"""
         parent = self.parent()
@@ -1260,15 +1703,19 @@ class TextEditorDialog(QDialog):
             return
         
         vals = self.get_values()
-        print(f"[Dialog] Values changed: text='{vals.get('text')}', size={vals.get('size')}")
         parent.preview_edit_changes(self.overlay_key, vals)
 
     def _normalize_font_size(self, value):
+        # 대부분 span/spinbox에서 float가 그대로 들어오므로 타입 검사로 먼저 처리
+        value_type = type(value)
+        if value_type is float:
+            return value
+        if value_type is int:
+            return float(value)
         try:
-            val = float(value)
+            return float(value)
         except Exception:
             return 12.0
-        return val
 
     def _on_patch_margin_changed(self):
         # _on_values_changed로 통합됨
@@ -1280,15 +1727,13 @@ class TextEditorDialog(QDialog):
 
     def create_original_font_info_section(self):
         """원본 폰트 정보 섹션 생성 - 신뢰도 향상을 위해 유사 폰트 안내 강화"""
-        from PySide6.QtWidgets import QGroupBox, QGridLayout
-        
         # 원본 폰트 정보 그룹박스
         self.font_info_group = QGroupBox(self._t('original_font_group'))
         font_info_layout = QGridLayout()
         
         # 폰트명 정보
-        original_font = self.original_font_info.get('pdf_font_name') or self.original_font_info.get('font', 'Unknown')
-        clean_font_name = original_font.split('+')[-1] if '+' in original_font else original_font
+        original_font = self._original_font_name
+        clean_font_name = self._clean_font_name
         
         font_info_layout.addWidget(QLabel(self._t('original_font_label') + ':'), 0, 0)
         # 원본 폰트명을 강조하여 표시
@@ -1305,10 +1750,7 @@ class TextEditorDialog(QDialog):
         
         # 폰트 플래그 정보
         flags = self.original_font_info['flags']
-        style_info = []
-        if flags & 2**4: style_info.append(self._t('style_bold'))
-        if flags & 2**1: style_info.append(self._t('style_italic'))
-        if flags & 2**2: style_info.append(self._t('style_underline'))
+        style_info = [self._t(key) for mask, key in _STYLE_FLAG_KEYS if flags & mask]
 
         if style_info:
             font_info_layout.addWidget(QLabel(self._t('original_style_label') + ':'), 3, 0)
@@ -1320,8 +1762,26 @@ class TextEditorDialog(QDialog):
         line.setFrameShadow(QFrame.Shadow.Sunken)
         font_info_layout.addWidget(line, 4, 0, 1, 2)
         
-        # === 원본 폰트 설치 상태 확인 ===
-        font_manager = SystemFontManager()
+        # === 원본 폰트 설치 상태 확인 (버튼을 눌렀을 때만 구성) ===
+        self._font_info_layout = font_info_layout
+        self._install_status_button = QPushButton(self._t('btn_check_install_status'))
+        self._install_status_button.clicked.connect(self._populate_font_install_status)
+        font_info_layout.addWidget(self._install_status_button, 5, 0, 1, 2)
+        
+        self.font_info_group.setLayout(font_info_layout)
+
+    def _populate_font_install_status(self):
+        """원본 폰트 설치 상태/대체 폰트/설치 안내 행을 구성해 상태 확인 버튼과 교체"""
+        if self._install_status_button is None:
+            return
+        font_info_layout = self._font_info_layout
+        font_info_layout.removeWidget(self._install_status_button)
+        self._install_status_button.deleteLater()
+        self._install_status_button = None
+        
+        original_font = self._original_font_name
+        clean_font_name = self._clean_font_name
+        font_manager = self.font_manager
         
         # 1. 원본 폰트명으로 직접 확인
         original_font_path = font_manager.get_font_path(original_font)
@@ -1376,21 +1836,20 @@ class TextEditorDialog(QDialog):
                 install_guide_label.linkActivated.connect(lambda: self.show_font_install_guide_for_font(clean_font_name))
                 install_guide_label.setCursor(Qt.CursorShape.PointingHandCursor)
                 font_info_layout.addWidget(install_guide_label, 7, 1)
-        
-        self.font_info_group.setLayout(font_info_layout)
-        
-        self.font_info_group.setLayout(font_info_layout)
     
     def show_font_install_guide_for_font(self, font_name):
-        """특정 폰트에 대한 설치 안내 대화상자"""
-        from PySide6.QtWidgets import QDialog, QVBoxLayout, QTextEdit, QPushButton, QHBoxLayout
-        import sys
-        import webbrowser
-        from urllib.parse import quote_plus
-        
+        """특정 폰트에 대한 설치 안내 대화상자 (폰트별로 처음 열 때만 구성하고 이후 재사용)"""
         # 폰트명 정제
-        clean_name = font_name.split('+')[-1] if '+' in font_name else font_name
+        clean_name = font_name.rsplit('+', 1)[-1]
         
+        dialog = self._install_guide_dialogs.get(clean_name)
+        if dialog is None:
+            dialog = self._create_font_install_guide_dialog(clean_name)
+            self._install_guide_dialogs[clean_name] = dialog
+        dialog.exec()
+
+    def _create_font_install_guide_dialog(self, clean_name):
+        """설치 안내 대화상자 구성 (HTML/검색 URL 포함)"""
         dialog = QDialog(self)
         dialog.setWindowTitle(self._t('font_install_title', font=clean_name))
         dialog.setMinimumSize(500, 450)
@@ -1402,7 +1861,7 @@ class TextEditorDialog(QDialog):
 
         # 폰트 굵기/스타일 어미 제거 (Bold, Medium, Light 등)하여 검색 성공률 향상
         # 공백, 하이픈, 언더바 뒤에 오는 어미들을 포괄적으로 제거
-        search_name = re.sub(r'[\s\-_]*(Bold|Italic|Medium|Light|Regular|Thin|Black|Extra|Heavy|Semi|Demi|Static|Condensed|Narrow|ExtraBold|ExtraLight|UltraLight|SemiBold|DemiBold)+$', '', clean_name, flags=re.IGNORECASE).strip()
+        search_name = _RE_FONT_STYLE_SUFFIX.sub('', clean_name).strip()
         if not search_name:
             search_name = clean_name
             
@@ -1412,17 +1871,16 @@ class TextEditorDialog(QDialog):
 
         button_layout = QHBoxLayout()
         
-        query = quote_plus(search_name)
-        google_query = quote_plus(f"{search_name} ttf")
+        google_url, noonnu_url = _font_search_urls(search_name)
         
         google_font_btn = QPushButton(self._t('font_search_google'))
         google_font_btn.setMinimumHeight(35)
-        google_font_btn.clicked.connect(lambda: webbrowser.open(f"https://www.google.com/search?q={google_query}"))
+        google_font_btn.clicked.connect(lambda: webbrowser.open(google_url))
         button_layout.addWidget(google_font_btn)
 
         noonnu_btn = QPushButton(self._t('font_search_noonnu'))
         noonnu_btn.setMinimumHeight(35)
-        noonnu_btn.clicked.connect(lambda: webbrowser.open(f"https://noonnu.cc/en/index?search={query}"))
+        noonnu_btn.clicked.connect(lambda: webbrowser.open(noonnu_url))
         button_layout.addWidget(noonnu_btn)
 
         close_button = QPushButton(self._t('button_close'))
@@ -1432,55 +1890,60 @@ class TextEditorDialog(QDialog):
 
         layout.addLayout(button_layout)
         dialog.setLayout(layout)
-        dialog.exec()
+        return dialog
 
     def show_font_install_guide(self):
         """폰트 설치 안내 대화상자 (일반)"""
-        original_font = self.original_font_info.get('pdf_font_name') or self.original_font_info.get('font', 'Unknown')
-        self.show_font_install_guide_for_font(original_font)
+        self.show_font_install_guide_for_font(self._clean_font_name)
 
     
     def _convert_color_from_int(self, color_int):
         """PDF 색상 정수를 QColor로 변환"""
-        if color_int == 0:
-            return QColor(0, 0, 0)  # 기본 검정색
-        
-        # RGB 값 추출
-        r = (color_int >> 16) & 0xFF
-        g = (color_int >> 8) & 0xFF
-        b = color_int & 0xFF
-        
-        return QColor(r, g, b)
+        return _qcolor_from_int(color_int)
     
+    _color_dialog = None  # 텍스트/패치 색상 선택에 공유하는 QColorDialog
+
+    @classmethod
+    def _get_color_dialog(cls):
+        """공유 색상 대화상자를 처음 한 번만 생성 (OK/Cancel 버튼 확대/통일 포함)"""
+        if cls._color_dialog is None:
+            dlg = QColorDialog()
+            try:
+                # 버튼 크기 확대
+                for btn in dlg.findChildren(QPushButton):
+                    btn.setMinimumSize(96, 36)
+            except Exception:
+                pass
+            cls._color_dialog = dlg
+        return cls._color_dialog
+
+    def _pick_color(self, initial_color):
+        """공유 색상 대화상자를 이 창 위에 띄워 선택된 색상(취소 시 None) 반환"""
+        dlg = self._get_color_dialog()
+        # 편집 대화상자가 닫혀도 공유 대화상자가 함께 삭제되지 않도록 실행 중에만 부모 지정
+        dlg.setParent(self, Qt.WindowType.Dialog)
+        dlg.setCurrentColor(initial_color)
+        try:
+            if dlg.exec() == QDialog.DialogCode.Accepted:
+                color = dlg.selectedColor()
+                if color.isValid():
+                    return color
+            return None
+        finally:
+            dlg.setParent(None, Qt.WindowType.Dialog)
+
     def choose_color(self):
         """색상 선택 대화상자 (OK/Cancel 버튼 확대/통일)"""
-        dlg = QColorDialog(self)
-        dlg.setCurrentColor(self.text_color)
-        try:
-            # 버튼 크기 확대
-            for btn in dlg.findChildren(QPushButton):
-                btn.setMinimumSize(96, 36)
-        except Exception:
-            pass
-        if dlg.exec() == QDialog.DialogCode.Accepted:
-            color = dlg.selectedColor()
-            if color.isValid():
-                self.text_color = color
-                self.color_button.setStyleSheet(f"background-color: {color.name()}")
+        color = self._pick_color(self.text_color)
+        if color is not None:
+            self.text_color = color
+            self.color_button.setStyleSheet(f"background-color: {color.name()}")
 
     def _choose_patch_color(self):
-        dlg = QColorDialog(self)
-        dlg.setCurrentColor(self.patch_color_button_color)
-        try:
-            for btn in dlg.findChildren(QPushButton):
-                btn.setMinimumSize(96, 36)
-        except Exception:
-            pass
-        if dlg.exec() == QDialog.DialogCode.Accepted:
-            color = dlg.selectedColor()
-            if color.isValid():
-                self.patch_color_button_color = color
-                self.patch_color_button.setStyleSheet(f"background-color: {color.name()}")
+        color = self._pick_color(self.patch_color_button_color)
+        if color is not None:
+            self.patch_color_button_color = color
+            self.patch_color_button.setStyleSheet(f"background-color: {color.name()}")
 
     def start_position_adjustment(self):
         """위치 조정 모드 시작"""
@@ -1489,6 +1952,10 @@ class TextEditorDialog(QDialog):
         self.accept()  # close() 대신 accept() 사용하여 다이얼로그 결과를 OK로 설정
     
     def get_values(self):
+        margin_l = self.patch_margin_spin_l.value() / 100.0
+        margin_r = self.patch_margin_spin_r.value() / 100.0
+        margin_t = self.patch_margin_spin_t.value() / 100.0
+        margin_b = self.patch_margin_spin_b.value() / 100.0
         return {
             "text": self.text_edit.text(),
             "font": self.font_combo.currentText(),
@@ -1508,21 +1975,152 @@ class TextEditorDialog(QDialog):
             "hwp_space_mode": self.hwp_space_checkbox.isChecked(),
             "text_only_mode": self.text_only_checkbox.isChecked(),
             "position_adjustment_requested": getattr(self, 'position_adjustment_requested', False),
-            "patch_margin_l": self.patch_margin_spin_l.value() / 100.0 if hasattr(self, 'patch_margin_spin_l') else 0.0,
-            "patch_margin_r": self.patch_margin_spin_r.value() / 100.0 if hasattr(self, 'patch_margin_spin_r') else 0.0,
-            "patch_margin_t": self.patch_margin_spin_t.value() / 100.0 if hasattr(self, 'patch_margin_spin_t') else 0.0,
-            "patch_margin_b": self.patch_margin_spin_b.value() / 100.0 if hasattr(self, 'patch_margin_spin_b') else 0.0,
-            "patch_margin": (
-                self.patch_margin_spin_l.value() / 100.0 if hasattr(self, 'patch_margin_spin_l') else 0.0,
-                self.patch_margin_spin_r.value() / 100.0 if hasattr(self, 'patch_margin_spin_r') else 0.0,
-                self.patch_margin_spin_t.value() / 100.0 if hasattr(self, 'patch_margin_spin_t') else 0.0,
-                self.patch_margin_spin_b.value() / 100.0 if hasattr(self, 'patch_margin_spin_b') else 0.0
-            )
+            "patch_margin_l": margin_l,
+            "patch_margin_r": margin_r,
+            "patch_margin_t": margin_t,
+            "patch_margin_b": margin_b,
+            "patch_margin": (margin_l, margin_r, margin_t, margin_b)
         }
 
 class TextOverlay:
     """텍스트 오버레이 레이어 관리 클래스 - 완전한 텍스트 속성 지원"""
 
+    __slots__ = (
+        'text', 'font', 'pdf_font_name', 'size', 'color', 'bbox', 'page_num', 'flags', 'origin',
+        'visible', 'z_index', 'original_bbox', 'flattened', 'image_flattened', 'force_image',
+        'stretch', 'tracking', 'hwp_space_mode', 'text_only_mode', 'font_path',
+        'synth_bold', 'synth_bold_weight', 'underline_weight', 'underline_offset',
+        'patch_margin_l', 'patch_margin_r', 'patch_margin_t', 'patch_margin_b',
+        'patch_margin_h', 'patch_margin_v',
+        'height_ratio', 'preview_height_ratio', 'ascent_ratio', 'descent_ratio',
+        'baseline_top_ratio', 'baseline_bottom_ratio', 'content_bbox',
+        '_loaded_font_family', '_hwp_layout_key', '_hwp_layout_cache', '_has_bold_variant',
+        '_last_flatten_width', '_hash_cache', '_current_hash_cache',
+    )
+
+    # 렌더링 경로 공유 캐시: 폰트 파일 → (등록된 패밀리들, 정규화명 → 패밀리), 정규화 패밀리명 → 실제 패밀리
+    _families_by_font_path = {}
+    _families_set = None
+    _families_normalized = {}
+    _resolved_families = {}  # 요청 이름 → 보정된 패밀리 (패밀리 목록 변경 시 초기화)
+    # 측정용 폰트 메트릭 LRU: (폰트 키, DPI) → (QFontMetricsF, 공백 너비)
+    _metrics_cache = OrderedDict()
+    _METRICS_CACHE_SIZE = 256
+    # 스타일별 공유 QFont 풀: (패밀리, 픽셀 크기, 이탤릭, 자간) → (페인터용, 커닝 해제, 측정용)
+    _font_pool = {}
+    _FONT_POOL_SIZE = 256
+
+    @classmethod
+    def _ensure_family_cache(cls):
+        if cls._families_set is None:
+            families = _qt_font_families()
+            cls._families_set = frozenset(families)
+            normalized = {}
+            for fam in families:
+                normalized.setdefault(_normalize_family(fam), fam)
+            cls._families_normalized = normalized
+
+    @classmethod
+    def _invalidate_family_cache(cls):
+        _qt_font_families.cache_clear()
+        cls._families_set = None
+        cls._families_normalized = {}
+        cls._resolved_families = {}
+
+    @classmethod
+    def _load_font_family(cls, font_path, requested=None):
+        """폰트 파일을 한 번만 등록하고 요청 이름과 일치하는 패밀리(없으면 첫 패밀리)를 반환"""
+        entry = cls._families_by_font_path.get(font_path)
+        if entry is None:
+            families = ()
+            font_id = QFontDatabase.addApplicationFont(font_path)
+            if font_id != -1:
+                families = tuple(QFontDatabase.applicationFontFamilies(font_id))
+                cls._invalidate_family_cache()
+            norm_map = {}
+            for fam in families:
+                norm_map.setdefault(_normalize_family(fam), fam)
+            entry = (families, norm_map)
+            cls._families_by_font_path[font_path] = entry
+        families, norm_map = entry
+        if not families:
+            return None
+        if requested:
+            chosen = norm_map.get(_normalize_family(requested))
+            if chosen:
+                return chosen
+        return families[0]
+
+    @classmethod
+    def _pooled_fonts(cls, font_key):
+        """(패밀리, 픽셀 크기, 이탤릭, 자간) 별 (페인터용, 커닝 해제, 측정용) QFont 공유"""
+        fonts = cls._font_pool.get(font_key)
+        if fonts is not None:
+            return fonts
+        family, pixel_size, italic, tracking = font_key
+        qfont = QFont(family)
+        qfont.setBold(False)
+        if italic:
+            qfont.setItalic(True)
+        if tracking:
+            qfont.setLetterSpacing(QFont.SpacingType.PercentageSpacing, 100.0 + tracking)
+        
+        # [수정] 폰트 엔진의 정수 단위 반올림 강제 방지를 위한 10배 정밀 렌더링 전략
+        # Qt 폰트 엔진은 내부적으로 픽셀 단위로 크기를 맞추려는 경향이 있으므로,
+        # 폰트 크기를 10배로 키우고(setPixelSize) 페인터를 0.1배로 줄여 렌더링함으로써 소수점 정밀도를 강제 확보합니다.
+        
+        # [중요] 소수점 단위 폰트 크기 정밀 표현을 위한 전략 설정 (크기 설정 전에 적용)
+        qfont.setStyleStrategy(QFont.StyleStrategy.ForceOutline | QFont.StyleStrategy.PreferAntialias)
+        qfont.setHintingPreference(QFont.HintingPreference.PreferNoHinting)
+        qfont.setPixelSize(pixel_size)
+        paint_font = QFont(qfont)
+        
+        # [중요] PDF와의 자간 정합성을 위해 Kerning 비활성화
+        qfont.setKerning(False)
+        
+        # 측정용 폰트 준비 (장평/자간이 적용되지 않은 순수 너비 측정용)
+        measure_font = QFont(qfont)
+        measure_font.setStretch(100)
+        measure_font.setLetterSpacing(QFont.SpacingType.AbsoluteSpacing, 0)
+        measure_font.setKerning(False)
+        measure_font.setHintingPreference(QFont.HintingPreference.PreferNoHinting)
+        
+        if len(cls._font_pool) >= cls._FONT_POOL_SIZE:
+            cls._font_pool.clear()
+        fonts = (paint_font, qfont, measure_font)
+        cls._font_pool[font_key] = fonts
+        return fonts
+
+    @classmethod
+    def _measure_metrics(cls, measure_font, device):
+        """QFontMetricsF와 기본 공백 너비를 폰트/장치 DPI별로 재사용"""
+        key = (measure_font.key(), device.logicalDpiX(), device.logicalDpiY())
+        cached = cls._metrics_cache.get(key)
+        if cached is not None:
+            cls._metrics_cache.move_to_end(key)
+            return cached
+        metrics = QFontMetricsF(measure_font, device)
+        cached = (metrics, metrics.horizontalAdvance(' '))
+        cls._metrics_cache[key] = cached
+        if len(cls._metrics_cache) > cls._METRICS_CACHE_SIZE:
+            cls._metrics_cache.popitem(last=False)
+        return cached
+
+    @classmethod
+    def _resolve_family(cls, name):
+        """설치된 패밀리명으로 보정 (정확히 일치하지 않으면 정규화 이름으로 조회)"""
+        resolved = cls._resolved_families.get(name)
+        if resolved is not None:
+            return resolved
+        # 처음 보는 이름일 때만 QFontDatabase 패밀리 목록을 조회
+        cls._ensure_family_cache()
+        if name in cls._families_set:
+            resolved = name
+        else:
+            resolved = cls._families_normalized.get(_normalize_family(name), name)
+        cls._resolved_families[name] = resolved
+        return resolved
+
     def __init__(
         self,
         text,
@@ -1560,6 +2158,9 @@ class TextOverlay:
         self.z_index = 0  # 레이어 순서
         self.original_bbox = source_bbox if source_bbox is not None else bbox  # 패치 원본 영역
         self.flattened = False  # PDF에 반영 여부
+        self.image_flattened = False  # 이미지로 플래튼된 경우
+        self.force_image = False
+        self._last_flatten_width = 0
         # 확장 속성: 장평 / 자간
         self.stretch = 1.0  # 1.0 = 100%
         self.tracking = 0.0  # percent delta (0 = 기본)
@@ -1574,7 +2175,16 @@ class TextOverlay:
         self.patch_margin_r = 0.0
         self.patch_margin_t = 0.0
         self.patch_margin_b = 0.0
+        # 레거시 프로젝트 파일 호환용 (가로/세로 공통 마진)
+        self.patch_margin_h = 0.0
+        self.patch_margin_v = 0.0
         self._loaded_font_family = None
+        self._hwp_layout_key = None
+        self._hwp_layout_cache = None
+        self._has_bold_variant = None  # 폰트명 기반 볼드체 여부 (폰트 변경 시 재계산)
+        # (좌표 원값, 해시) - Rect가 제자리 수정될 수 있어 원값 비교로 유효성 확인
+        self._hash_cache = None
+        self._current_hash_cache = None
         base_ratio = self._normalize_height_ratio(height_ratio if height_ratio is not None else 1.15)
         self.height_ratio = base_ratio
         self.content_bbox = fitz.Rect(content_bbox) if content_bbox is not None else fitz.Rect(self.original_bbox)
@@ -1620,12 +2230,15 @@ class TextOverlay:
         new_values=None
     ):
         """텍스트 속성 업데이트 (편집창 연계)"""
+        if text is not None or font is not None or size is not None or tracking is not None or font_path is not None:
+            self._hwp_layout_cache = None
         if text is not None:
             self.text = text
         if origin is not None:
             self.origin = origin
         if font is not None:
             self.font = font
+            self._has_bold_variant = None
         if pdf_font_name is not None:
             self.pdf_font_name = pdf_font_name
         if size is not None:
@@ -1641,6 +2254,7 @@ class TextOverlay:
         if font_path is not None:
             self.font_path = font_path
             self._loaded_font_family = None
+            self._has_bold_variant = None
         if synth_bold is not None:
             self.synth_bold = bool(synth_bold)
         if synth_bold_weight is not None:
@@ -1721,7 +2335,7 @@ class TextOverlay:
             self.baseline_bottom_ratio = None
         # 속성 변경 시 다시 플래튼 필요
         self.flattened = False
-        print(f"오버레이 속성 업데이트: '{self.text}' - {self.font}, {self.size}px")
+        _vlog(f"오버레이 속성 업데이트: '{self.text}' - {self.font}, {self.size}px")
 
     @staticmethod
     def _estimate_height_ratio(bbox, size):
@@ -1738,14 +2352,17 @@ class TextOverlay:
 
     @staticmethod
     def _normalize_height_ratio(value):
-        try:
-            ratio = float(value)
-        except Exception:
-            ratio = 1.15
-        if ratio <= 0:
+        if type(value) is float:
+            ratio = value
+        else:
+            try:
+                ratio = float(value)
+            except Exception:
+                ratio = 1.15
+        if not ratio > 0:
             ratio = 1.15
         # 허용 범위를 넓혀 한글/복합 폰트의 실제 줄간격 비율을 존중
-        return max(0.5, min(1.8, ratio))
+        return 0.5 if ratio < 0.5 else 1.8 if ratio > 1.8 else ratio
 
     def move_to(self, new_bbox):
         """오버레이 위치 이동 (레이어 방식) - 단순 이동으로 원상복구"""
@@ -1756,26 +2373,89 @@ class TextOverlay:
         # bbox 업데이트
         self.bbox = new_bbox
         
-        # content_bbox도 함께 이동
-        if hasattr(self, 'content_bbox') and self.content_bbox:
-            c = self.content_bbox
-            self.content_bbox = fitz.Rect(c.x0 + dx, c.y0 + dy, c.x1 + dx, c.y1 + dy)
+        # content_bbox도 함께 이동 (오버레이 전용 Rect이므로 제자리에서 평행이동)
+        c = self.content_bbox
+        if c:
+            c.x0 += dx
+            c.y0 += dy
+            c.x1 += dx
+            c.y1 += dy
         else:
             self.content_bbox = fitz.Rect(new_bbox)
         
     def get_hash(self):
         """오버레이 해시 생성 (원본 위치 기반)"""
-        return f"{self.original_bbox.x0:.1f},{self.original_bbox.y0:.1f},{self.original_bbox.x1:.1f},{self.original_bbox.y1:.1f}"
+        ob = self.original_bbox
+        raw = (ob.x0, ob.y0, ob.x1, ob.y1)
+        cached = self._hash_cache
+        if cached is not None and cached[0] == raw:
+            return cached[1]
+        key = _bbox_key(ob)
+        self._hash_cache = (raw, key)
+        return key
         
     def get_current_hash(self):
         """현재 위치 기반 해시 생성"""
-        return f"{self.bbox.x0:.1f},{self.bbox.y0:.1f},{self.bbox.x1:.1f},{self.bbox.y1:.1f}"
-        
+        b = self.bbox
+        raw = (b.x0, b.y0, b.x1, b.y1)
+        cached = self._current_hash_cache
+        if cached is not None and cached[0] == raw:
+            return cached[1]
+        key = _bbox_key(b)
+        self._current_hash_cache = (raw, key)
+        return key
+        
+    def _hwp_layout(self, lines, measure_font, font_metrics_f, base_space_w, t_ratio, precision_multiplier):
+        """HWP 공백 모드 줄별 (단어 또는 None, 진행 폭, QStaticText) 목록 - 텍스트/폰트/자간이 같으면 재사용"""
+        key = (self.text, measure_font.key(), font_metrics_f.fontDpi(), t_ratio)
+        if self._hwp_layout_cache is not None and self._hwp_layout_key == key:
+            return self._hwp_layout_cache
+        hwp_space_advance = (base_space_w * 1.5 * t_ratio) / precision_multiplier
+        layout = []
+        for line in lines:
+            items = []
+            for part in _HWP_SPACE_SPLIT_RE.split(line):
+                if not part: continue
+                if part.isspace():
+                    items.append((None, hwp_space_advance * len(part), None))
+                else:
+                    # 단어별 셰이핑 결과를 QStaticText에 보관해 리페인트 시 재셰이핑 방지
+                    static_text = QStaticText(part)
+                    static_text.setTextFormat(Qt.TextFormat.PlainText)
+                    items.append((part, (font_metrics_f.horizontalAdvance(part) * t_ratio) / precision_multiplier, static_text))
+            layout.append(items)
+        self._hwp_layout_key = key
+        self._hwp_layout_cache = layout
+        return layout
+
+    def _render_key(self):
+        """화면 렌더링 결과에 영향을 주는 상태 (뷰어의 오버레이 레이어 캐시 키)"""
+        ob = self.original_bbox
+        origin = self.origin
+        return (self.z_index, self.visible, self.text, self.font, self.font_path, self.size,
+                self.color, self.flags, tuple(self.bbox), tuple(ob) if ob is not None else None,
+                tuple(origin) if origin is not None else None,
+                self.stretch, self.tracking, self.hwp_space_mode, self.synth_bold_weight,
+                self.underline_weight, self.underline_offset, self.height_ratio, self.ascent_ratio)
+
+    def _is_outside_clip(self, painter):
+        """페인터 클립 영역 밖 오버레이 판별 (오른쪽으로 늘어나는 텍스트를 고려해 보수적으로 판정)"""
+        if not painter.hasClipping():
+            return False
+        clip = painter.clipBoundingRect()
+        if clip.isNull():
+            return False
+        pad = max(1.0, float(self.size)) * 2.0
+        n_lines = self.text.count('\n') + 1
+        return (self.bbox.x0 - pad > clip.right()
+                or self.bbox.y1 + pad * n_lines < clip.top()
+                or self.bbox.y0 - pad > clip.bottom())
+
     def render_to_painter(self, painter, scale_factor=1.0, offsets=(0, 0)):
         """QPainter를 사용하여 오버레이 렌더링 (PDF 좌표계 직접 사용)
         painter는 이미 적절한 scale과 translate가 적용된 상태여야 함.
         """
-        if not self.visible:
+        if not self.visible or self._is_outside_clip(painter):
             return
         
         painter.save() # 상태 저장
@@ -1784,90 +2464,53 @@ class TextOverlay:
             # 1. 원본 폰트 정보 및 속성 준비
             effective_point_size = max(0.1, float(self.size))
             
-            # 2. QFont 생성 및 검증
-            qfont = None
+            # 2. 폰트 패밀리 결정
+            family = None
             if self.font_path and os.path.exists(self.font_path):
                 try:
                     if not self._loaded_font_family:
-                        font_id = QFontDatabase.addApplicationFont(self.font_path)
-                        if font_id != -1:
-                            families = QFontDatabase.applicationFontFamilies(font_id)
-                            if families:
-                                self._loaded_font_family = families[0]
-                    if self._loaded_font_family:
-                        qfont = QFont(self._loaded_font_family)
+                        self._loaded_font_family = self._load_font_family(self.font_path, self.font)
+                    family = self._loaded_font_family
                 except Exception: pass
 
-            if qfont is None:
-                qfont = QFont(self.font or 'Arial')
+            if not family:
+                family = self._resolve_family(self.font or 'Arial')
 
             # 스타일 및 정밀 크기 설정 (PDF 포인트 단위)
             is_bold_flag = bool(self.flags & 16)
-            loaded_name = (self._loaded_font_family or self.font or '').lower()
-            has_bold_variant = any(kw in loaded_name for kw in ('bold', 'black', 'heavy'))
+            if self._has_bold_variant is None:
+                loaded_name = (self._loaded_font_family or self.font or '').lower()
+                self._has_bold_variant = any(kw in loaded_name for kw in ('bold', 'black', 'heavy'))
+            has_bold_variant = self._has_bold_variant
             
             # 중요: 실제 폰트 자체가 볼드면(has_bold_variant) 추가 합성 볼드 적용 안함
             # UI 프리뷰(render_to_painter)와 PDF 출력(_flatten_single_overlay) 로직 100% 일치시킴
-            if is_bold_flag:
-                if has_bold_variant:
-                    # 이미 볼드체이므로 추가 합성 볼드 및 Qt Bold 설정 불필요
-                    qfont.setBold(False)
-                    self.synth_bold = False
-                else:
-                    # 일반체만 있으므로 합성 볼드 적용
-                    qfont.setBold(False)
-                    self.synth_bold = True
-            else:
-                qfont.setBold(False)
-                self.synth_bold = False
-                
-            if self.flags & 2: # 이탤릭
-                qfont.setItalic(True)
-            
+            # (Qt Bold는 어느 경우에도 설정하지 않음 - 볼드는 합성 볼드로만 표현)
+            self.synth_bold = is_bold_flag and not has_bold_variant
+
             try:
-                if abs(float(self.tracking)) > 0.01:
-                    qfont.setLetterSpacing(QFont.SpacingType.PercentageSpacing, 100.0 + float(self.tracking))
-            except Exception: pass
-            
-            # [수정] 폰트 엔진의 정수 단위 반올림 강제 방지를 위한 10배 정밀 렌더링 전략
-            # Qt 폰트 엔진은 내부적으로 픽셀 단위로 크기를 맞추려는 경향이 있으므로,
-            # 폰트 크기를 10배로 키우고(setPixelSize) 페인터를 0.1배로 줄여 렌더링함으로써 소수점 정밀도를 강제 확보합니다.
-            
-            # [중요] 소수점 단위 폰트 크기 정밀 표현을 위한 전략 설정 (크기 설정 전에 적용)
-            qfont.setStyleStrategy(QFont.StyleStrategy.ForceOutline | QFont.StyleStrategy.PreferAntialias)
-            qfont.setHintingPreference(QFont.HintingPreference.PreferNoHinting)
+                tracking = float(self.tracking)
+            except Exception:
+                tracking = 0.0
             
-            # 10배 확대된 픽셀 사이즈 설정 (1포인트 = 1픽셀인 scaled painter 환경 기준)
+            # 10배 확대된 픽셀 사이즈 (1포인트 = 1픽셀인 scaled painter 환경 기준)
             precision_multiplier = 10.0
-            qfont.setPixelSize(int(effective_point_size * precision_multiplier))
+            font_key = (family, int(effective_point_size * precision_multiplier), bool(self.flags & 2),
+                        tracking if abs(tracking) > 0.01 else 0.0)
+            paint_font, qfont, measure_font = self._pooled_fonts(font_key)
             
             # 3. 색상 설정
-            if isinstance(self.color, int):
-                qcolor = QColor((self.color >> 16) & 0xFF, (self.color >> 8) & 0xFF, self.color & 0xFF)
-            else:
-                qcolor = QColor(0, 0, 0)
+            qcolor = _qcolor_from_int(self.color) if isinstance(self.color, int) else _qcolor_from_int(0)
                 
-            painter.setFont(qfont)
+            painter.setFont(paint_font)
             painter.setPen(qcolor)
             
-            # [중요] PDF와의 자간 정합성을 위해 Kerning 비활성화
-            qfont.setKerning(False)
-            
             # 4. 정교한 렌더링 파라미터 (PDF 좌표계)
-            # 측정용 폰트 준비 (장평/자간이 적용되지 않은 순수 너비 측정용)
-            measure_font = QFont(qfont)
-            measure_font.setStretch(100)
-            measure_font.setLetterSpacing(QFont.SpacingType.AbsoluteSpacing, 0)
-            measure_font.setKerning(False)
-            measure_font.setHintingPreference(QFont.HintingPreference.PreferNoHinting)
             # 현재 painter 장치 컨텍스트를 반영하여 측정 (DPI 등 동기화)
-            font_metrics_f = QFontMetricsF(measure_font, painter.device())
-            
-            ascent_ratio = float(getattr(self, 'ascent_ratio', 0.85))
-            height_ratio = float(getattr(self, 'height_ratio', 1.15))
+            font_metrics_f, base_space_w = self._measure_metrics(measure_font, painter.device())
             
             # 베이스라인 결정 (절대 좌표계로 원복하여 정합성 확보)
-            origin = getattr(self, 'origin', None)
+            origin = self.origin
             if origin:
                 # origin은 베이스라인의 절대 좌표 (x, y)
                 dx = self.bbox.x0 - self.original_bbox.x0
@@ -1876,52 +2519,71 @@ class TextOverlay:
                 text_x = origin[0] + dx
             else:
                 # origin이 없는 경우 bbox 상단 기준비율로 계산
-                base_baseline_y = self.bbox.y0 + (effective_point_size * ascent_ratio)
+                base_baseline_y = self.bbox.y0 + (effective_point_size * float(self.ascent_ratio))
                 text_x = self.bbox.x0
                 
-            line_height_pt = effective_point_size * height_ratio
-            synth_weight = float(getattr(self, 'synth_bold_weight', 120))
+            line_height_pt = effective_point_size * float(self.height_ratio)
+            synth_weight = float(self.synth_bold_weight)
             offset_factor = (synth_weight - 100.0) / 100.0 * 0.15
             total_bold_offset = effective_point_size * offset_factor if self.synth_bold else 0.0
-            step_pt = 0.05
             
-            stretch = float(getattr(self, 'stretch', 1.0))
-
-            def _draw_text_item(x_pos, y_pos, txt):
+            stretch = float(self.stretch)
+            tracking_ratio = tracking / 100.0
+
+            # 글자마다 반복되는 값은 루프 밖에서 한 번만 준비
+            inv_precision = 1.0 / precision_multiplier
+            apply_stretch = abs(stretch - 1.0) > 0.001
+            bold_pen = bold_brush = None
+            if total_bold_offset > 0.005:
+                # 스케일된 공간에서의 오프셋 보정 (10배 확대된 좌표계 기준)
+                local_bold_width = total_bold_offset * precision_multiplier / stretch
+                bold_pen = QPen(qcolor, local_bold_width, Qt.PenStyle.SolidLine,
+                                Qt.PenCapStyle.RoundCap, Qt.PenJoinStyle.RoundJoin)
+                bold_brush = QBrush(qcolor)
+            text_origin = QPointF(0, 0)
+            # QStaticText는 좌상단 기준이므로 ascent만큼 올려 베이스라인 정렬
+            static_text_origin = QPointF(0, -font_metrics_f.ascent())
+
+            def _draw_text_item(x_pos, y_pos, txt, static_text=None):
                 painter.save()
                 # 글자 시작점을 원점으로 이동 후 가로 스케일 적용
                 painter.translate(x_pos, y_pos)
                 
                 # 10배 정밀 렌더링을 위해 페인터를 0.1배로 축소 (폰트의 10배 확대를 상쇄)
-                painter.scale(1.0 / precision_multiplier, 1.0 / precision_multiplier)
+                painter.scale(inv_precision, inv_precision)
                 
-                if abs(stretch - 1.0) > 0.001:
+                if apply_stretch:
                     painter.scale(stretch, 1.0)
                 
-                if total_bold_offset > 0.005:
-                    # 스케일된 공간에서의 오프셋 보정 (10배 확대된 좌표계 기준)
-                    local_bold_offset = total_bold_offset * precision_multiplier
-                    local_step = step_pt * precision_multiplier / stretch
-                    half_offset = (local_bold_offset / stretch) / 2.0
-                    curr_dx = -half_offset
-                    max_iter = 200
-                    while curr_dx <= half_offset and max_iter > 0:
-                        painter.drawText(QPointF(curr_dx, 0), txt)
-                        curr_dx += local_step
-                        max_iter -= 1
-                    painter.drawText(QPointF(half_offset, 0), txt)
+                if bold_pen is not None:
+                    # 합성 볼드: 외곽선을 볼드 폭만큼 한 번에 stroke + fill (반복 drawText 대체)
+                    path = QPainterPath()
+                    path.addText(text_origin, qfont, txt)
+                    painter.strokePath(path, bold_pen)
+                    painter.fillPath(path, bold_brush)
+                elif static_text is not None:
+                    painter.drawStaticText(static_text_origin, static_text)
                 else:
-                    painter.drawText(QPointF(0, 0), txt)
+                    painter.drawText(text_origin, txt)
                 painter.restore()
 
-            is_hwp = getattr(self, 'hwp_space_mode', False)
+            is_hwp = self.hwp_space_mode
             lines = self.text.splitlines() if "\n" in self.text else [self.text]
             
-            stretch = float(getattr(self, 'stretch', 1.0))
-            tracking_ratio = float(getattr(self, 'tracking', 0.0)) / 100.0
-            
             # 항상 개별 글자 정밀 배치 수행 (PDF와 1:1 일치 보장)
             needs_precise = True 
+            # 밑줄: 펜과 좌표용 QPointF를 줄마다 새로 만들지 않고 재사용
+            underline_pen = None
+            if self.flags & 4:
+                u_offset = float(self.underline_offset)
+                underline_pen = QPen(qcolor)
+                underline_pen.setWidthF(float(self.underline_weight))
+                underline_start = QPointF()
+                underline_end = QPointF()
+            hwp_layout = None
+            if is_hwp and abs(stretch - 1.0) < 0.001:
+                hwp_layout = self._hwp_layout(lines, measure_font, font_metrics_f, base_space_w,
+                                              1.0 + tracking_ratio, precision_multiplier)
 
             for li, line in enumerate(lines):
                 curr_y = base_baseline_y + li * line_height_pt
@@ -1929,17 +2591,11 @@ class TextOverlay:
                     curr_x = text_x
                     t_ratio = 1.0 + tracking_ratio
                     
-                    if is_hwp and abs(stretch - 1.0) < 0.001:
-                        parts = re.split(r'( +)', line)
-                        base_space_w = font_metrics_f.horizontalAdvance(' ')
-                        hwp_space_advance = (base_space_w * 1.5 * t_ratio) / precision_multiplier
-                        for part in parts:
-                            if not part: continue
-                            if part.isspace():
-                                curr_x += hwp_space_advance * len(part)
-                            else:
-                                _draw_text_item(curr_x, curr_y, part)
-                                curr_x += (font_metrics_f.horizontalAdvance(part) * t_ratio) / precision_multiplier
+                    if hwp_layout is not None:
+                        for part, advance, static_text in hwp_layout[li]:
+                            if part is not None:
+                                _draw_text_item(curr_x, curr_y, part, static_text)
+                            curr_x += advance
                     else:
                         for ch in line:
                             # 순수 글자 너비 측정 (측정용 폰트 사용)
@@ -1959,20 +2615,18 @@ class TextOverlay:
                     actual_width = font_metrics_f.horizontalAdvance(line) / precision_multiplier
                 
                 # 밑줄 처리
-                if self.flags & 4:
-                    u_offset = float(getattr(self, 'underline_offset', 1.5))
+                if underline_pen is not None:
                     underline_y = curr_y + u_offset
-                    u_weight = float(getattr(self, 'underline_weight', 0.6))
-                    pen = painter.pen()
-                    pen.setWidthF(u_weight)
-                    painter.setPen(pen)
-                    painter.drawLine(QPointF(text_x, underline_y), QPointF(text_x + actual_width, underline_y))
+                    underline_start.setX(text_x)
+                    underline_start.setY(underline_y)
+                    underline_end.setX(text_x + actual_width)
+                    underline_end.setY(underline_y)
+                    painter.setPen(underline_pen)
+                    painter.drawLine(underline_start, underline_end)
                     painter.setPen(qcolor)
         finally:
             painter.restore() # 상태 복구
         
-        print(f"   OK TextOverlay 렌더링 완료: '{self.text}'")
-        
     def to_dict(self):
         """편집창 연계를 위한 딕셔너리 변환"""
         return {
@@ -1985,31 +2639,123 @@ class TextOverlay:
             'flags': self.flags,
             'original_bbox': _rect_to_tuple(self.original_bbox),
             'current_bbox': _rect_to_tuple(self.bbox),
-            'content_bbox': _rect_to_tuple(getattr(self, 'content_bbox', self.bbox)),
+            'content_bbox': _rect_to_tuple(self.content_bbox),
             'page_num': self.page_num,
-            'height_ratio': getattr(self, 'height_ratio', 1.15),
-            'ascent_ratio': getattr(self, 'ascent_ratio', 0.85),
-            'descent_ratio': getattr(self, 'descent_ratio', max(0.0, getattr(self, 'height_ratio', 1.15) - getattr(self, 'ascent_ratio', 0.85))),
-            'baseline_top_ratio': getattr(self, 'baseline_top_ratio', None),
-            'baseline_bottom_ratio': getattr(self, 'baseline_bottom_ratio', None),
-            'hwp_space_mode': getattr(self, 'hwp_space_mode', False),
-            'text_only_mode': getattr(self, 'text_only_mode', False),
-            'synth_bold_weight': getattr(self, 'synth_bold_weight', 120),
-            'underline_weight': getattr(self, 'underline_weight', 0.6),
-            'underline_offset': getattr(self, 'underline_offset', 1.5),
-            'origin': getattr(self, 'origin', None),
-            'patch_margin_l': getattr(self, 'patch_margin_l', 0.0),
-            'patch_margin_r': getattr(self, 'patch_margin_r', 0.0),
-            'patch_margin_t': getattr(self, 'patch_margin_t', 0.0),
-            'patch_margin_b': getattr(self, 'patch_margin_b', 0.0),
+            'height_ratio': self.height_ratio,
+            'ascent_ratio': self.ascent_ratio,
+            'descent_ratio': self.descent_ratio,
+            'baseline_top_ratio': self.baseline_top_ratio,
+            'baseline_bottom_ratio': self.baseline_bottom_ratio,
+            'hwp_space_mode': self.hwp_space_mode,
+            'text_only_mode': self.text_only_mode,
+            'synth_bold_weight': self.synth_bold_weight,
+            'underline_weight': self.underline_weight,
+            'underline_offset': self.underline_offset,
+            'origin': self.origin,
+            'patch_margin_l': self.patch_margin_l,
+            'patch_margin_r': self.patch_margin_r,
+            'patch_margin_t': self.patch_margin_t,
+            'patch_margin_b': self.patch_margin_b,
             'patch_margin': (
-                getattr(self, 'patch_margin_l', 0.0),
-                getattr(self, 'patch_margin_r', 0.0),
-                getattr(self, 'patch_margin_t', 0.0),
-                getattr(self, 'patch_margin_b', 0.0)
+                self.patch_margin_l,
+                self.patch_margin_r,
+                self.patch_margin_t,
+                self.patch_margin_b
             )
         }
 
+def _span_looks_like_overlay(span):
+    """span 속성만으로 보는 오버레이 텍스트 휴리스틱 (임베디드 폰트/비검정색/비정상 크기)"""
+    font_name = span.get('font', '')
+    color = span.get('color', 0)
+    size = span.get('size', 12)
+    return ('+' in font_name or 'C2_' in font_name or  # 임베디드 폰트
+            color != 0 or  # 검은색이 아닌 텍스트
+            size > 20 or size < 6)  # 비정상적 크기
+
+
+class _PageSpanIndex:
+    """페이지 텍스트 span 공간 인덱스 (세로 밴드 버킷)
+    점 히트 테스트 시 전체 block/line/span 순회 대신 해당 밴드의 후보만 검사한다.
+    records: (bbox, span, line, looks_overlay) 목록 (문서 순서)
+    """
+    __slots__ = ('records', '_bounds', '_bands', '_unbounded', '_hangul')
+
+    BAND_HEIGHT = 24.0
+    TOLERANCE = 0.75  # PdfViewerWidget._rect_contains_point 기본 허용오차와 동일
+
+    def __init__(self, text_dict):
+        self.records = []
+        self._bounds = []  # 허용오차를 미리 더한 (x0, y0, x1, y1) - 질의 시 산술 없이 비교만 수행
+        self._bands = {}
+        self._unbounded = []
+        self._hangul = {}  # id(span) -> 한글 포함 여부 (줄 텍스트 복원 시 공백 임계값 판정용)
+        tol = self.TOLERANCE
+        for block in text_dict.get("blocks", []):
+            if block.get('type') != 0:
+                continue
+            for line in block.get("lines", []):
+                for span in line.get("spans", []):
+                    bbox = fitz.Rect(span["bbox"])
+                    idx = len(self.records)
+                    self.records.append((bbox, span, line, _span_looks_like_overlay(span)))
+                    self._hangul[id(span)] = _RE_HANGUL.search(span.get("text", "")) is not None
+                    self._bounds.append((bbox.x0 - tol, bbox.y0 - tol, bbox.x1 + tol, bbox.y1 + tol))
+                    try:
+                        first = int((bbox.y0 - tol) // self.BAND_HEIGHT)
+                        last = int((bbox.y1 + tol) // self.BAND_HEIGHT)
+                    except (OverflowError, ValueError):
+                        self._unbounded.append(idx)
+                        continue
+                    for band in range(first, last + 1):
+                        self._bands.setdefault(band, []).append(idx)
+
+    def at_point(self, point):
+        """point를 포함하는 span 레코드 목록 (문서 순서 유지)"""
+        try:
+            candidates = self._bands.get(int(point.y // self.BAND_HEIGHT), ())
+        except (OverflowError, ValueError):
+            return []
+        if self._unbounded:
+            candidates = sorted(set(candidates).union(self._unbounded))
+        px, py = point.x, point.y
+        bounds = self._bounds
+        records = self.records
+        hits = []
+        for idx in candidates:
+            x0, y0, x1, y1 = bounds[idx]
+            if x0 <= px <= x1 and y0 <= py <= y1:
+                hits.append(records[idx])
+        return hits
+
+    def has_hangul(self, span):
+        """span 텍스트의 한글 포함 여부 (인덱스 생성 시 계산된 값, 인덱스 밖 span은 즉시 계산)"""
+        flag = self._hangul.get(id(span))
+        if flag is None:
+            flag = _RE_HANGUL.search(span.get("text", "")) is not None
+        return flag
+
+    def count_overlapping(self, bounds, limit=2):
+        """허용오차 포함 bounds (x0, y0, x1, y1)와 겹치는 span 수 (limit에 도달하면 중단)"""
+        qx0, qy0, qx1, qy1 = bounds
+        try:
+            first = int(qy0 // self.BAND_HEIGHT)
+            last = int(qy1 // self.BAND_HEIGHT)
+        except (OverflowError, ValueError):
+            return limit
+        candidates = set(self._unbounded)
+        for band in range(first, last + 1):
+            candidates.update(self._bands.get(band, ()))
+        count = 0
+        for idx in candidates:
+            x0, y0, x1, y1 = self._bounds[idx]
+            if x0 <= qx1 and qx0 <= x1 and y0 <= qy1 and qy0 <= y1:
+                count += 1
+                if count >= limit:
+                    break
+        return count
+
+
 class PdfViewerWidget(QLabel):
     text_selected = Signal(dict)
     
@@ -2030,7 +2776,8 @@ class PdfViewerWidget(QLabel):
         self.hover_span_info = None
         
         # 오버레이 텍스트 추적 시스템 (레거시)
-        self.overlay_texts = set()  # (page_num, bbox_hash) 튜플 저장
+        self.overlay_texts = {}  # page_num -> {bbox_hash} (페이지별 집합 - 조회 시 튜플 키 생성 불필요)
+        self._overlay_texts_version = 0  # 등록/해제 시 증가 (호버 상태 키용)
         
         # 새로운 레이어 방식 오버레이 시스템
         self.text_overlays = {}  # page_num -> [TextOverlay] 매핑
@@ -2038,6 +2785,10 @@ class PdfViewerWidget(QLabel):
         
         # 배경 패치 관리 시스템 (오버레이와 분리)
         self.background_patches = {}  # page_num -> [bbox] 매핑 (원본 텍스트 숨김 영역)
+        self._paint_tools_cache = None  # (배율, paintEvent용 펜/브러시 dict)
+        self._overlay_id_maps = {}  # page_num -> ((목록 id, 길이, 마지막 항목 id), z_index -> 오버레이)
+        self._overlay_layer_cache = None  # (상태 키, 위젯 좌표 QRect, 오버레이 합성 QPixmap) - 현재 페이지 1장만 보관
+        self._patch_paint_cache = {}  # id(patch entry) -> ((bbox 값, 색상), (QRectF, 브러시, 반투명 브러시, rgb))
         
         # 텍스트 위치 조정용 변수
         self.selected_text_info = None
@@ -2058,6 +2809,11 @@ class PdfViewerWidget(QLabel):
         self.hover_timer.timeout.connect(self.check_hover)
         self.hover_timer.start(100)  # 100ms마다 체크
         self._text_dict_cache = {}  # page_num -> text_dict 캐시
+        self._span_index_cache = {}  # page_num -> _PageSpanIndex (text_dict 캐시와 함께 초기화)
+        self._page_pixmap_cache = OrderedDict()  # (page_num, 배율) -> 렌더된 페이지 QPixmap (LRU, 문서별)
+        self._hover_state_key = None  # 직전 호버 검사 시점의 마우스/페이지/오버레이 상태
+        self._hover_stable = None  # (상태 키(마우스 제외), 허용오차 포함 bounds) - 다른 후보와 겹치지 않는 호버 영역
+        self._page_offset_cache = (None, None)  # (상태 키, (scale, offset_x, offset_y))
         
         # 싱글/더블 클릭 구분을 위한 타이머
         self.single_click_timer = QTimer()
@@ -2076,14 +2832,38 @@ class PdfViewerWidget(QLabel):
 
     def _tick_anim(self):
         self._anim_phase = (self._anim_phase + 1) % 16
-        # 애니메이션이 필요한 모든 경우에 화면 갱신
-        if self.text_adjustment_mode or self.quick_adjustment_mode or self.hover_rect or self.active_overlay:
-            self.update()
+        # 점선 애니메이션이 그려지는 영역만 부분 갱신 (패치/오버레이 전체 리페인트 방지)
+        region = self._animated_region()
+        if region is not None:
+            self.update(region)
+
+    def _animated_region(self):
+        """_anim_phase에 따라 달라지는 점선 사각형들의 화면 영역 합 (없으면 None)"""
+        rects = []
+        if self.hover_rect and isinstance(self.hover_span_info, dict) and self.hover_span_info.get('is_overlay', False):
+            rects.append(self.hover_rect)
+        if self.active_overlay and not self.text_adjustment_mode:
+            page_num, overlay_id = self.active_overlay
+            if page_num == self.current_page_num:
+                overlay = self.get_overlay_by_id(page_num, overlay_id)
+                if overlay:
+                    rects.append(overlay.bbox)
+        region = None
+        for pdf_rect in rects:
+            screen_rect = self._pdf_rect_to_screen_rect_f(pdf_rect)
+            if screen_rect is None:
+                continue
+            # 펜 두께(최대 2px)와 안티앨리어싱 여유
+            r = screen_rect.toAlignedRect().adjusted(-3, -3, 3, 3)
+            region = r if region is None else region.united(r)
+        return region
         
     def set_document(self, doc):
         self.doc = doc
         self.current_page_num = 0
         self._text_dict_cache = {} # 캐시 초기화
+        self._span_index_cache = {}
+        self._page_pixmap_cache.clear()
         self.pdf_font_extractor = PdfFontExtractor(doc)
         self.pdf_fonts = self.pdf_font_extractor.extract_fonts_from_document()
         self.active_overlay = None
@@ -2172,10 +2952,10 @@ class PdfViewerWidget(QLabel):
                     if not self._rect_contains_point(current_bbox, pdf_point):
                         if self.quick_adjustment_mode:
                             self.exit_quick_adjustment_mode()
-                            print("Quick adjustment mode 종료 - 다른 지점 클릭")
+                            _vlog("Quick adjustment mode 종료 - 다른 지점 클릭")
                         else:
                             self.exit_text_adjustment_mode()
-                            print("Text adjustment mode 종료 - 다른 지점 클릭")
+                            _vlog("Text adjustment mode 종료 - 다른 지점 클릭")
                         return
                     # 같은 텍스트 영역 내 클릭이면 계속 조정 모드 유지
                     return
@@ -2185,12 +2965,8 @@ class PdfViewerWidget(QLabel):
         click_pos = event.position().toPoint()
         pdf_x, pdf_y = self._widget_point_to_pdf(click_pos)
         overlay_hit = None
-        if pdf_x is not None and pdf_y is not None and self.text_overlays.get(self.current_page_num):
-            pdf_point = fitz.Point(pdf_x, pdf_y)
-            for ov in reversed(self.text_overlays[self.current_page_num]):
-                if ov.visible and self._rect_contains_point(ov.bbox, pdf_point):
-                    overlay_hit = ov
-                    break
+        if pdf_x is not None and pdf_y is not None:
+            overlay_hit = self._overlay_at_point(self.current_page_num, fitz.Point(pdf_x, pdf_y))
         if overlay_hit:
             self.active_overlay = (self.current_page_num, overlay_hit.z_index)
         else:
@@ -2198,7 +2974,7 @@ class PdfViewerWidget(QLabel):
         self.update() # 즉시 갱신하여 패치 투명도 반영
         self.pending_single_click_pos = click_pos
         self.single_click_timer.start(300)  # 300ms 후 싱글클릭 처리
-        print(f"Single click timer started at position: {self.pending_single_click_pos}")
+        _vlog(f"Single click timer started at position: {self.pending_single_click_pos}")
     
     def mouseMoveEvent(self, event):
         current_pos = event.position().toPoint()
@@ -2240,25 +3016,107 @@ class PdfViewerWidget(QLabel):
             if self.parent():
                 self.parent().wheelEvent(event)
     
+    def _get_text_dict(self, page_num):
+        """페이지 text_dict (페이지당 한 번 파싱, 페이지 텍스트 변경 시 invalidate_text_cache로 갱신)"""
+        text_dict = self._text_dict_cache.get(page_num)
+        if text_dict is None:
+            page = self.doc.load_page(page_num)
+            text_dict = page.get_text("dict")
+            self._text_dict_cache[page_num] = text_dict
+        return text_dict
+
+    def _get_span_index(self, page_num):
+        """페이지 span 공간 인덱스 (text_dict 캐시 기반, 페이지당 한 번 생성)"""
+        index = self._span_index_cache.get(page_num)
+        if index is None:
+            index = _PageSpanIndex(self._get_text_dict(page_num))
+            self._span_index_cache[page_num] = index
+        return index
+
+    def warm_text_cache(self, page_num):
+        """페이지 표시 직후 유휴 시점에 span 인덱스를 미리 생성 (첫 호버 지연 제거)
+        PyMuPDF 문서 객체는 스레드 안전하지 않으므로 워커 스레드 대신 이벤트 루프 유휴 시점에 실행한다."""
+        doc = self.doc
+        def _warm():
+            # 그 사이 페이지/문서가 바뀌었으면 생략
+            if self.doc is not doc or doc is None or self.current_page_num != page_num:
+                return
+            try:
+                self._get_span_index(page_num)
+            except Exception as e:
+                _vlog(f"텍스트 캐시 예열 실패: {e}")
+        if doc is not None and page_num not in self._span_index_cache:
+            QTimer.singleShot(0, _warm)
+
+    def invalidate_text_cache(self, page_num=None):
+        """페이지 콘텐츠를 직접 수정한 경우 text_dict/span 인덱스/렌더 픽스맵 캐시 폐기"""
+        if page_num is None:
+            self._text_dict_cache.clear()
+            self._span_index_cache.clear()
+            self._page_pixmap_cache.clear()
+        else:
+            self._text_dict_cache.pop(page_num, None)
+            self._span_index_cache.pop(page_num, None)
+            for key in [k for k in self._page_pixmap_cache if k[0] == page_num]:
+                del self._page_pixmap_cache[key]
+
+    PAGE_PIXMAP_CACHE_SIZE = 16
+    PAGE_PIXMAP_CACHE_BYTES = 192 * 1024 * 1024  # 고배율 픽스맵은 장당 수십 MB이므로 용량으로도 제한
+
+    def cached_page_pixmap(self, page_num, scale):
+        """렌더 픽스맵 캐시 조회 (없으면 None)"""
+        key = (page_num, round(scale, 4))
+        pixmap = self._page_pixmap_cache.get(key)
+        if pixmap is not None:
+            self._page_pixmap_cache.move_to_end(key)
+        return pixmap
+
+    def store_page_pixmap(self, page_num, scale, pixmap):
+        key = (page_num, round(scale, 4))
+        self._page_pixmap_cache[key] = pixmap
+        self._page_pixmap_cache.move_to_end(key)
+        cache = self._page_pixmap_cache
+        total = sum(pm.width() * pm.height() * 4 for pm in cache.values())
+        while len(cache) > 1 and (len(cache) > self.PAGE_PIXMAP_CACHE_SIZE or total > self.PAGE_PIXMAP_CACHE_BYTES):
+            _, evicted = cache.popitem(last=False)
+            total -= evicted.width() * evicted.height() * 4
+
     def check_hover(self):
         """마우스 호버 체크 및 텍스트 블록 하이라이트 (캐시 적용 최적화)"""
         if not self.doc or not hasattr(self, 'mouse_pos'):
             return
         
+        # 100ms 타이머 틱마다 호출되므로, 마우스가 멈춰 있고 페이지/배율/오버레이/텍스트 캐시가
+        # 그대로면 결과도 동일 → 히트 테스트 생략
+        page_num = self.current_page_num
+        context_key = (
+            id(self.doc), page_num, self.pixmap_scale_factor,
+            id(self._span_index_cache.get(page_num)), self._overlay_texts_version,
+            tuple((ov.bbox.x0, ov.bbox.y0, ov.bbox.x1, ov.bbox.y1, ov.visible)
+                  for ov in self.text_overlays.get(page_num, ())),
+        )
+        state_key = (self.mouse_pos.x(), self.mouse_pos.y(), context_key)
+        if state_key == self._hover_state_key:
+            return
+        self._hover_state_key = state_key
+        
         try:
             # 마우스 위치를 PDF 좌표로 변환
             pdf_x, pdf_y = self._widget_point_to_pdf(self.mouse_pos)
             if pdf_x is None or pdf_y is None:
                 return
+
+            # 다른 후보와 겹치지 않는 현재 호버 영역 안에서 움직이는 중이면 결과가 같으므로 즉시 종료
+            stable = self._hover_stable
+            if stable is not None and stable[0] == context_key:
+                x0, y0, x1, y1 = stable[1]
+                if x0 <= pdf_x <= x1 and y0 <= pdf_y <= y1:
+                    return
             
             pdf_point = fitz.Point(pdf_x, pdf_y)
             
-            # 캐시된 텍스트 데이터 사용
-            if self.current_page_num not in self._text_dict_cache:
-                page = self.doc.load_page(self.current_page_num)
-                self._text_dict_cache[self.current_page_num] = page.get_text("dict")
-            
-            text_dict = self._text_dict_cache[self.current_page_num]
+            # 캐시된 span 공간 인덱스 사용
+            span_index = self._get_span_index(self.current_page_num)
             
             # 호버 중인 텍스트/오버레이 찾기 - 오버레이 bbox 먼저 검사
             overlay_hover_rect = None
@@ -2267,50 +3125,52 @@ class PdfViewerWidget(QLabel):
             original_hover_span_info = None
 
             # 0) 오버레이 레이어 히트 테스트 (PDF 텍스트보다 우선)
-            if self.text_overlays.get(self.current_page_num):
-                for ov in reversed(self.text_overlays[self.current_page_num]):
-                    if ov.visible and self._rect_contains_point(ov.bbox, pdf_point):
-                        overlay_hover_rect = ov.bbox
-                        overlay_hover_span_info = {
-                            'text': ov.text,
-                            'font': ov.font,
-                            'size': ov.size,
-                            'flags': ov.flags,
-                            'color': ov.color,
-                            'original_bbox': ov.original_bbox,
-                            'is_overlay': True,
-                            'overlay_id': ov.z_index,
-                            'synth_bold_weight': getattr(ov, 'synth_bold_weight', 120),
-                            'underline_weight': getattr(ov, 'underline_weight', 0.6),
-                            'underline_offset': getattr(ov, 'underline_offset', 1.5)
-                        }
-                        break
+            ov = self._overlay_at_point(self.current_page_num, pdf_point)
+            if ov is not None:
+                overlay_hover_rect = ov.bbox
+                overlay_hover_span_info = {
+                    'text': ov.text,
+                    'font': ov.font,
+                    'size': ov.size,
+                    'flags': ov.flags,
+                    'color': ov.color,
+                    'original_bbox': ov.original_bbox,
+                    'is_overlay': True,
+                    'overlay_id': ov.z_index,
+                    'synth_bold_weight': getattr(ov, 'synth_bold_weight', 120),
+                    'underline_weight': getattr(ov, 'underline_weight', 0.6),
+                    'underline_offset': getattr(ov, 'underline_offset', 1.5)
+                }
 
-            for block in text_dict.get("blocks", []):
-                if block.get('type') == 0:
-                    for line in block.get("lines", []):
-                        for span in line.get("spans", []):
-                            bbox = fitz.Rect(span["bbox"])
-                            if self._rect_contains_point(bbox, pdf_point):
-                                span_info = span.copy()
-                                span_info['original_bbox'] = bbox
-                                
-                                # 오버레이 텍스트인지 확인
-                                if self.is_overlay_text(span, bbox):
-                                    if not overlay_hover_rect:  # 첫 번째 오버레이 텍스트 우선
-                                        overlay_hover_rect = bbox
-                                        overlay_hover_span_info = span_info
-                                else:
-                                    if not original_hover_rect:  # 첫 번째 원본 텍스트
-                                        original_hover_rect = bbox
-                                        original_hover_span_info = span_info
+            # 오버레이 레이어에 맞았으면 span 결과는 쓰이지 않으므로 검사 생략.
+            # span 사본은 실제로 채택되는 후보에 대해서만 만든다.
+            hits = span_index.at_point(pdf_point) if overlay_hover_rect is None else ()
+            for bbox, span, _line, looks_overlay in hits:
+                # 오버레이 텍스트인지 확인
+                if self.is_overlay_text(span, bbox, looks_overlay):
+                    # 첫 번째 오버레이 텍스트 우선 - 이후 후보는 볼 필요 없음
+                    overlay_hover_rect = bbox
+                    overlay_hover_span_info = span.copy()
+                    overlay_hover_span_info['original_bbox'] = bbox
+                    break
+                if not original_hover_rect:  # 첫 번째 원본 텍스트
+                    original_hover_rect = bbox
+                    original_hover_span_info = span.copy()
+                    original_hover_span_info['original_bbox'] = bbox
             
             # 오버레이 텍스트가 있으면 우선, 없으면 원본 텍스트 사용
             new_hover_rect = overlay_hover_rect if overlay_hover_rect else original_hover_rect
             new_hover_span_info = overlay_hover_span_info if overlay_hover_span_info else original_hover_span_info
+
+            self._hover_stable = None
+            if new_hover_rect:
+                stable_bounds = self._exclusive_hover_bounds(page_num, new_hover_rect, ov, span_index)
+                if stable_bounds is not None:
+                    self._hover_stable = (context_key, stable_bounds)
             
             # 호버 상태가 변경되었을 때만 업데이트
-            if new_hover_rect != self.hover_rect:
+            # 같은 span 레코드/오버레이면 동일한 Rect 객체이므로 identity로 먼저 판정 (값 비교는 fitz 바인딩 호출)
+            if new_hover_rect is not self.hover_rect and new_hover_rect != self.hover_rect:
                 self.hover_rect = new_hover_rect
                 self.hover_span_info = new_hover_span_info
                 self.update()  # 다시 그리기
@@ -2330,6 +3190,23 @@ class PdfViewerWidget(QLabel):
         except Exception:
             pass
     
+    def _exclusive_hover_bounds(self, page_num, hover_rect, hit_overlay, span_index):
+        """호버 결과가 hover_rect 안 어디서든 동일하게 나오는 경우 허용오차 포함 bounds, 아니면 None.
+        다른 보이는 오버레이나 (오버레이 레이어 히트가 아니면) 다른 span과 겹치면 None."""
+        tol = _PageSpanIndex.TOLERANCE
+        bounds = (hover_rect.x0 - tol, hover_rect.y0 - tol, hover_rect.x1 + tol, hover_rect.y1 + tol)
+        bx0, by0, bx1, by1 = bounds
+        for other in self.text_overlays.get(page_num, ()):
+            if other is hit_overlay or not other.visible:
+                continue
+            r = other.bbox
+            if r.x0 - tol <= bx1 and bx0 <= r.x1 + tol and r.y0 - tol <= by1 and by0 <= r.y1 + tol:
+                return None
+        # 오버레이 레이어 히트는 span보다 항상 우선하므로 span 겹침은 무관
+        if hit_overlay is None and span_index.count_overlapping(bounds, limit=2) > 1:
+            return None
+        return bounds
+
     def mouseDoubleClickEvent(self, event):
         # PDF 문서가 로드되지 않았으면 무시
         if not self.doc:
@@ -2344,158 +3221,127 @@ class PdfViewerWidget(QLabel):
             self.exit_quick_adjustment_mode()
         
         # 디버깅을 위해 항상 이벤트 처리 (Ctrl 키 조건 제거)
-        print("Double click detected!")  # 디버깅 출력
+        _vlog("Double click detected!")  # 디버깅 출력
         
         try:
             # 라벨 내에서의 클릭 위치
             label_pos = event.position().toPoint()
-            print(f"Click position: {label_pos}")  # 디버깅 출력
+            _vlog(f"Click position: {label_pos}")  # 디버깅 출력
             
             pdf_x, pdf_y = self._widget_point_to_pdf(label_pos)
             if pdf_x is None or pdf_y is None:
                 return
             
             pdf_point = fitz.Point(pdf_x, pdf_y)
-            print(f"PDF coordinates: ({pdf_x}, {pdf_y})")  # 디버깅 출력
+            _vlog(f"PDF coordinates: ({pdf_x}, {pdf_y})")  # 디버깅 출력
 
             # 오버레이 레이어 우선 히트 테스트 (빈 영역 오버레이 포함)
-            if self.text_overlays.get(self.current_page_num):
-                for ov in reversed(self.text_overlays[self.current_page_num]):
-                    if ov.visible and self._rect_contains_point(ov.bbox, pdf_point):
-                        print("Overlay hit - open editor")
-                        self.active_overlay = (self.current_page_num, ov.z_index)
-                        span_info = {
-                            'text': ov.text,
-                            'font': ov.font,
-                            'size': ov.size,
-                            'flags': ov.flags,
-                            'color': ov.color,
-                            'original_bbox': ov.original_bbox,
-                            'current_bbox': ov.bbox,
-                            'is_overlay': True,
-                            'overlay_id': ov.z_index,
-                            'page_num': self.current_page_num,
-                            'stretch': getattr(ov, 'stretch', 1.0),
-                            'tracking': getattr(ov, 'tracking', 0.0),
-                            'hwp_space_mode': getattr(ov, 'hwp_space_mode', False),
-                            'synth_bold_weight': getattr(ov, 'synth_bold_weight', 120),
-                            'underline_weight': getattr(ov, 'underline_weight', 0.6),
-                            'underline_offset': getattr(ov, 'underline_offset', 1.5)
-                        }
-                        self.text_selected.emit(span_info)
-                        return
+            ov = self._overlay_at_point(self.current_page_num, pdf_point)
+            if ov is not None:
+                _vlog("Overlay hit - open editor")
+                self.active_overlay = (self.current_page_num, ov.z_index)
+                span_info = {
+                    'text': ov.text,
+                    'font': ov.font,
+                    'size': ov.size,
+                    'flags': ov.flags,
+                    'color': ov.color,
+                    'original_bbox': ov.original_bbox,
+                    'current_bbox': ov.bbox,
+                    'is_overlay': True,
+                    'overlay_id': ov.z_index,
+                    'page_num': self.current_page_num,
+                    'stretch': getattr(ov, 'stretch', 1.0),
+                    'tracking': getattr(ov, 'tracking', 0.0),
+                    'hwp_space_mode': getattr(ov, 'hwp_space_mode', False),
+                    'synth_bold_weight': getattr(ov, 'synth_bold_weight', 120),
+                    'underline_weight': getattr(ov, 'underline_weight', 0.6),
+                    'underline_offset': getattr(ov, 'underline_offset', 1.5)
+                }
+                self.text_selected.emit(span_info)
+                return
 
-            page = self.doc.load_page(self.current_page_num)
-            text_dict = page.get_text("dict")
+            span_index = self._get_span_index(self.current_page_num)
             
             # 더블클릭: 정확히 클릭한 텍스트 찾기 (거리 우선순위가 아닌 직접 포함 여부 확인)
-            clicked_overlay_spans = []  # 클릭 지점에 포함되는 오버레이 텍스트들
-            clicked_original_spans = []  # 클릭 지점에 포함되는 원본 텍스트들
-            found_spans = 0
+            clicked_overlay_spans = []  # 클릭 지점에 포함되는 오버레이 텍스트들 (bbox, span, line)
+            clicked_original_spans = []  # 클릭 지점에 포함되는 원본 텍스트들 (bbox, span, line)
+            found_spans = len(span_index.records)
             
-            print(f"더블클릭한 위치에서 텍스트 검색 중...")
+            _vlog(f"더블클릭한 위치에서 텍스트 검색 중...")
             
-            for block in text_dict.get("blocks", []):
-                if block.get('type') != 0:
-                    continue
-                    
-                for line in block.get("lines", []):
-                    for span in line.get("spans", []):
-                        found_spans += 1
-                        bbox = fitz.Rect(span["bbox"])
-                        span_text = span.get("text", "").strip()
-                        
-                        # 더블클릭은 정확한 포함 여부만 확인 (거리 계산 불필요)
-                        if self._rect_contains_point(bbox, pdf_point):
-                            print(f"OK 클릭 지점에 포함된 텍스트: '{span_text}' bbox={bbox}")
-                            
-                            # 오버레이 텍스트인지 확인하여 분류
-                            if self.is_overlay_text(span, bbox):
-                                clicked_overlay_spans.append(span)
-                                print(f"   → 오버레이 텍스트로 분류")
-                            else:
-                                clicked_original_spans.append(span)
-                                print(f"   → 원본 텍스트로 분류")
+            # 더블클릭은 정확한 포함 여부만 확인 (거리 계산 불필요)
+            for bbox, span, line, looks_overlay in span_index.at_point(pdf_point):
+                span_text = span.get("text", "").strip()
+                _vlog(f"OK 클릭 지점에 포함된 텍스트: '{span_text}' bbox={bbox}")
+                
+                # 오버레이 텍스트인지 확인하여 분류
+                if self.is_overlay_text(span, bbox, looks_overlay):
+                    clicked_overlay_spans.append((bbox, span, line))
+                    _vlog(f"   → 오버레이 텍스트로 분류")
+                else:
+                    clicked_original_spans.append((bbox, span, line))
+                    _vlog(f"   → 원본 텍스트로 분류")
             
             # 더블클릭에서는 클릭 지점에 직접 포함된 텍스트만 선택
             selected_span = None
             
             # 오버레이 텍스트가 있으면 우선 선택
             if clicked_overlay_spans:
-                selected_span = clicked_overlay_spans[0]  # 첫 번째 오버레이 텍스트 선택
+                selected_bbox, selected_span, selected_line = clicked_overlay_spans[0]  # 첫 번째 오버레이 텍스트 선택
                 try:
-                    overlay_rect = fitz.Rect(selected_span.get('bbox', selected_span.get('original_bbox', selected_span.get('bbox'))))
-                    overlay_obj = self.find_overlay_at_position(self.current_page_num, overlay_rect)
+                    overlay_obj = self.find_overlay_at_position(self.current_page_num, selected_bbox)
                     if overlay_obj:
                         self.active_overlay = (self.current_page_num, overlay_obj.z_index)
                 except Exception:
                     pass
-                print(f"더블클릭으로 선택된 오버레이 텍스트: '{selected_span.get('text', '')}'")
+                _vlog(f"더블클릭으로 선택된 오버레이 텍스트: '{selected_span.get('text', '')}'")
             elif clicked_original_spans:
-                selected_span = clicked_original_spans[0]  # 첫 번째 원본 텍스트 선택
-                print(f"더블클릭으로 선택된 원본 텍스트: '{selected_span.get('text', '')}'")
+                selected_bbox, selected_span, selected_line = clicked_original_spans[0]  # 첫 번째 원본 텍스트 선택
+                _vlog(f"더블클릭으로 선택된 원본 텍스트: '{selected_span.get('text', '')}'")
             else:
-                print(f"X 더블클릭한 위치에 텍스트가 없습니다. (검사한 span: {found_spans}개)")
+                _vlog(f"X 더블클릭한 위치에 텍스트가 없습니다. (검사한 span: {found_spans}개)")
                 return
             
-            print(f"전체 {found_spans}개 span 중 클릭 지점에 포함된 텍스트: 오버레이={len(clicked_overlay_spans)}, 원본={len(clicked_original_spans)}")
+            _vlog(f"전체 {found_spans}개 span 중 클릭 지점에 포함된 텍스트: 오버레이={len(clicked_overlay_spans)}, 원본={len(clicked_original_spans)}")
             
             if selected_span:
-                print(f"Selected span text: '{selected_span.get('text', '')}'")
+                _vlog(f"Selected span text: '{selected_span.get('text', '')}'")
                 
                 # 라인 정보 수집 (한글 공백 문제 해결 - 개선된 버전)
                 line_text = ""
                 line_spans = []
-                target_line = None
-                
-                # 먼저 선택된 span이 속한 line을 찾기
-                for block in text_dict.get("blocks", []):
-                    if block.get('type') != 0:
-                        continue
-                    for line in block.get("lines", []):
-                        for span in line.get("spans", []):
-                            if span == selected_span:
-                                target_line = line
-                                break
-                        if target_line:
-                            break
-                    if target_line:
-                        break
+                # 선택된 span이 속한 line (인덱스 레코드에 함께 저장된 참조 - 재탐색 불필요)
+                target_line = selected_line
                 
                 # 선택된 라인의 모든 span을 분석하여 정확한 공백 복원 (더 정밀한 버전)
                 if target_line:
                     spans_in_line = target_line.get("spans", [])
                     
                     # 디버깅 정보 출력
-                    print(f"Line has {len(spans_in_line)} spans")
-                    for i, s in enumerate(spans_in_line):
-                        print(f"  Span {i}: '{s.get('text', '')}' bbox: {s.get('bbox', [])}")
+                    if _VERBOSE:
+                        print(f"Line has {len(spans_in_line)} spans")
+                        for i, s in enumerate(spans_in_line):
+                            print(f"  Span {i}: '{s.get('text', '')}' bbox: {s.get('bbox', [])}")
                     
+                    # 한 번의 순회로 복원: 이전 span의 좌표/정리된 텍스트는 변수로 넘겨 재조회·재계산하지 않음
+                    prev_x0 = prev_x1 = 0.0
+                    prev_text = ""
                     for i, s in enumerate(spans_in_line):
                         span_text = s.get("text", "")
-                        span_bbox = fitz.Rect(s["bbox"])
+                        span_x0, span_y0, span_x1, span_y1 = s["bbox"]
                         
                         if i > 0 and span_text.strip():  # 빈 텍스트 무시
                             # 이전 span과의 거리 계산
-                            prev_bbox = fitz.Rect(spans_in_line[i-1]["bbox"])
-                            horizontal_gap = span_bbox.x0 - prev_bbox.x1
+                            horizontal_gap = span_x0 - prev_x1
                             
                             # 더 정확한 문자 크기 계산
-                            prev_text = spans_in_line[i-1].get("text", "").strip()
                             if prev_text:
-                                # 한글과 영문의 평균 너비가 다르므로 텍스트 타입별로 계산
-                                korean_chars = sum(1 for c in prev_text if '가' <= c <= '힣')
-                                other_chars = len(prev_text) - korean_chars
-                                
-                                # 한글은 일반적으로 더 넓음
-                                if korean_chars > 0:
-                                    avg_char_width = (prev_bbox.x1 - prev_bbox.x0) / len(prev_text)
-                                    space_threshold = avg_char_width * 0.4  # 한글은 40%
-                                else:
-                                    avg_char_width = (prev_bbox.x1 - prev_bbox.x0) / len(prev_text)
-                                    space_threshold = avg_char_width * 0.25  # 영문은 25%
+                                # 한글은 일반적으로 더 넓음: 한글 포함 40%, 영문 25%
+                                avg_char_width = (prev_x1 - prev_x0) / len(prev_text)
+                                space_threshold = avg_char_width * (0.4 if span_index.has_hangul(spans_in_line[i-1]) else 0.25)
                             else:
-                                avg_char_width = span_bbox.height  # 대략적인 추정
+                                avg_char_width = max(span_y1 - span_y0, 0.0)  # 대략적인 추정
                                 space_threshold = avg_char_width * 0.3
                             
                             # 공백 추가 조건 (더 관대한 조건)
@@ -2510,18 +3356,18 @@ class PdfViewerWidget(QLabel):
                             # 한글 문자와 숫자/영문 사이의 공백 처리 또는 일반 공백 조건
                             if should_add_space or self._needs_space_between_spans(spans_in_line[i-1], s):
                                 line_text += " "
-                                print(f"Added space between '{prev_text}' and '{span_text}' (gap: {horizontal_gap:.2f})")
+                                _vlog(f"Added space between '{prev_text}' and '{span_text}' (gap: {horizontal_gap:.2f})")
                             else:
-                                print(f"No space between '{prev_text}' and '{span_text}' (gap: {horizontal_gap:.2f}, threshold: {space_threshold:.2f})")
+                                _vlog(f"No space between '{prev_text}' and '{span_text}' (gap: {horizontal_gap:.2f}, threshold: {space_threshold:.2f})")
                         
                         line_text += span_text
                         line_spans.append(s)
+                        prev_x0, prev_x1 = span_x0, span_x1
+                        prev_text = span_text.strip()
                     
-                    print(f"Final line_text: '{line_text}'")
-                
-                # 레이어 오버레이 확인 후 span 정보 준비
-                selected_bbox = fitz.Rect(selected_span["bbox"])
+                    _vlog(f"Final line_text: '{line_text}'")
                 
+                # 레이어 오버레이 확인 후 span 정보 준비 (selected_bbox는 인덱스 레코드의 Rect 재사용)
                 # 현재 위치에 레이어 오버레이가 있는지 확인
                 overlay = self.find_overlay_by_current_position(self.current_page_num, selected_bbox)
                 if not overlay:
@@ -2529,7 +3375,7 @@ class PdfViewerWidget(QLabel):
                     overlay = self.find_overlay_at_position(self.current_page_num, selected_bbox)
                 
                 if overlay:
-                    print(f"기존 레이어 오버레이 감지: '{overlay.text}' (ID: {overlay.z_index})")
+                    _vlog(f"기존 레이어 오버레이 감지: '{overlay.text}' (ID: {overlay.z_index})")
                     # 레이어 오버레이의 현재 속성을 편집창에 전달
                     span_info = {
                         'text': overlay.text,
@@ -2553,7 +3399,7 @@ class PdfViewerWidget(QLabel):
                         'underline_offset': getattr(overlay, 'underline_offset', 1.5)
                     }
                     self.active_overlay = (self.current_page_num, overlay.z_index)
-                    print(f"   편집창에 오버레이 속성 전달: {overlay.font}, {overlay.size}pt, flags={overlay.flags}")
+                    _vlog(f"   편집창에 오버레이 속성 전달: {overlay.font}, {overlay.size}pt, flags={overlay.flags}")
                 else:
                     # 원본 텍스트의 속성을 편집창에 전달
                     span_info = {
@@ -2563,7 +3409,7 @@ class PdfViewerWidget(QLabel):
                         'flags': selected_span.get('flags', 0),
                         'color': selected_span.get('color', 0),
                         'origin': selected_span.get('origin'), # 베이스라인 좌표 필수
-                        'original_bbox': selected_bbox,
+                        'original_bbox': fitz.Rect(selected_bbox),  # 인덱스 레코드와 분리된 사본
                         'line_text': line_text.strip(),
                         'line_spans': line_spans,
                         'is_overlay': False  # 원본 텍스트 표시
@@ -2573,18 +3419,21 @@ class PdfViewerWidget(QLabel):
                 print("OK 더블클릭 텍스트 선택 완료 - 편집창으로 전달")
                 self.text_selected.emit(span_info)
             else:
-                print(f"X 더블클릭 위치에 적합한 텍스트를 찾을 수 없습니다.")
+                _vlog(f"X 더블클릭 위치에 적합한 텍스트를 찾을 수 없습니다.")
                 
         except Exception as e:
             print(f"Error in mouseDoubleClickEvent: {e}")
-            import traceback
-            traceback.print_exc()
+            if _VERBOSE:
+                import traceback
+                traceback.print_exc()
     
     def paintEvent(self, event):
         """커스텀 그리기: PDF 배경, 패치, 호버 하이라이트, 텍스트 오버레이"""
         painter = QPainter(self)
         if not painter.isActive():
             return
+        # 다시 그릴 영역으로 클립 (영역 밖 오버레이는 render_to_painter에서 건너뜀)
+        painter.setClipRect(event.rect())
             
         painter.setRenderHint(QPainter.RenderHint.Antialiasing)
         painter.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform)
@@ -2599,7 +3448,7 @@ class PdfViewerWidget(QLabel):
             if hasattr(win, 'theme_mode'):
                 theme = win.theme_mode
 
-        bg_color = QColor(30, 31, 34) if theme == 'dark' else QColor(240, 240, 240)
+        bg_color = self._BG_DARK if theme == 'dark' else self._BG_LIGHT
         
         pixmap = self.pixmap()
         if not pixmap or pixmap.isNull():
@@ -2610,28 +3459,12 @@ class PdfViewerWidget(QLabel):
         # 1. 위젯 배경 및 PDF 픽스맵 렌더링 (중앙 정렬)
         painter.fillRect(self.rect(), bg_color) 
         
-        crect = self.contentsRect()
         # 정밀한 부동소수점 오프셋 계산 (정합성 핵심)
-        scale = self.pixmap_scale_factor
-        
-        # 실제 PDF 페이지 크기 (포인트 단위)
-        try:
-            page = self.doc.load_page(self.current_page_num)
-            pw_pt = page.rect.width
-            ph_pt = page.rect.height
-        except:
-            pw_pt = pixmap.width() / scale if scale > 0 else pixmap.width()
-            ph_pt = pixmap.height() / scale if scale > 0 else pixmap.height()
-
-        # 화면상의 실제 픽셀 크기 (float)
-        pw_px = pw_pt * scale
-        ph_px = ph_pt * scale
-        
-        offset_x = crect.left() + (crect.width() - pw_px) / 2.0
-        offset_y = crect.top() + (crect.height() - ph_px) / 2.0
+        scale, offset_x, offset_y = self._page_offsets(pixmap)
         
         # PDF 배경 픽스맵은 픽셀 단위로 정확히 그림
         painter.drawPixmap(QPointF(offset_x, offset_y), pixmap)
+        tools = self._paint_tools(scale)
         
         # --- [좌표 변환 시작] ---
         # 이후 모든 그리기는 PDF 좌표계(포인트)에서 수행하도록 설정
@@ -2640,59 +3473,61 @@ class PdfViewerWidget(QLabel):
         painter.scale(scale, scale)
         
         # 2. 배경 패치 렌더링 (PDF 좌표계)
-        if hasattr(self, 'background_patches') and self.current_page_num in self.background_patches:
-            for pentry in self.background_patches[self.current_page_num]:
-                painter.save()
-                try:
-                    patch_bbox = pentry.get('bbox')
-                    stored_color = pentry.get('color')
-                    patch_overlay_id = pentry.get('overlay_id')
-                    
-                    if not patch_bbox: continue
-                    
-                    is_active = False
-                    if self.active_overlay and isinstance(self.active_overlay, (tuple, list)):
-                        is_active = (self.active_overlay[0] == self.current_page_num and 
-                                    self.active_overlay[1] == patch_overlay_id)
-                    
-                    # 편집 중인 패치는 50% 투명도(128) 적용하여 원본이 보이게 함, 일반 패치는 100%(255)
-                    alpha = 128 if is_active else 255 
-                    
-                    if stored_color:
-                        c = QColor(int(stored_color[0]*255), int(stored_color[1]*255), int(stored_color[2]*255), alpha)
-                    else:
-                        c = QColor(255, 255, 255, alpha)
-                    
-                    painter.setPen(Qt.PenStyle.NoPen)
-                    painter.setBrush(QBrush(c))
-                    # PDF 좌표계이므로 bbox 그대로 사용
-                    painter.drawRect(QRectF(patch_bbox.x0, patch_bbox.y0, patch_bbox.width, patch_bbox.height))
-                    
+        patches = self.background_patches.get(self.current_page_num)
+        if patches:
+            active = self.active_overlay
+            has_active = (isinstance(active, (tuple, list)) and active[0] == self.current_page_num)
+            active_id = active[1] if has_active else None
+            painter.save()
+            try:
+                painter.setPen(Qt.PenStyle.NoPen)
+                # 같은 색의 연속 패치는 drawRects 한 번으로 그림
+                # (최신 패치가 위를 덮어야 하므로 색상별 재배열 없이 연속 구간만 묶음)
+                run_rects = []
+                run_rgb = None
+                run_brush = None
+                for pentry in patches:
+                    paint = self._patch_paint(pentry)
+                    if paint is None:
+                        continue
+                    patch_rect, fill_brush, active_brush, rgb = paint
+                    is_active = has_active and pentry.get('overlay_id') == active_id
+                    if run_rects and (is_active or rgb != run_rgb):
+                        painter.setBrush(run_brush)
+                        painter.drawRects(run_rects)
+                        run_rects = []
                     if is_active:
-                        # 점선 테두리는 눈에 보여야 하므로 스케일 역산하여 1px 유지
-                        pen_w = 1.0 / scale if scale > 0 else 1.0
-                        painter.setPen(QPen(QColor(0, 0, 0, 150), pen_w, Qt.PenStyle.DashLine))
+                        # 편집 중인 패치는 50% 투명도(128) 적용하여 원본이 보이게 함
+                        painter.setBrush(active_brush)
+                        painter.drawRect(patch_rect)
+                        painter.setPen(tools['patch_active'])
                         painter.setBrush(Qt.BrushStyle.NoBrush)
-                        painter.drawRect(QRectF(patch_bbox.x0, patch_bbox.y0, patch_bbox.width, patch_bbox.height))
-                finally:
-                    painter.restore()
+                        painter.drawRect(patch_rect)
+                        painter.setPen(Qt.PenStyle.NoPen)
+                    else:
+                        # 일반 패치는 100%(255)
+                        if not run_rects:
+                            run_rgb, run_brush = rgb, fill_brush
+                        run_rects.append(patch_rect)
+                if run_rects:
+                    painter.setBrush(run_brush)
+                    painter.drawRects(run_rects)
+            finally:
+                painter.restore()
 
         # 3. 호버 하이라이트 (PDF 좌표계)
         if self.hover_rect:
             painter.save()
             try:
                 is_ov = isinstance(self.hover_span_info, dict) and self.hover_span_info.get('is_overlay', False)
-                pen_w = 1.5 / scale if scale > 0 else 1.5
                 if is_ov:
-                    pen = QPen(QColor(0, 200, 0), pen_w)
-                    pen.setStyle(Qt.PenStyle.CustomDashLine)
-                    pen.setDashPattern([6/scale, 4/scale])
+                    pen = tools['hover_overlay']
                     pen.setDashOffset(self._anim_phase / scale)
                     painter.setPen(pen)
                     painter.setBrush(Qt.BrushStyle.NoBrush)
                 else:
-                    painter.setPen(QPen(QColor(0, 120, 255, 220), pen_w))
-                    painter.setBrush(QBrush(QColor(0, 120, 255, 50)))
+                    painter.setPen(tools['hover_text'])
+                    painter.setBrush(tools['hover_text_brush'])
                 painter.drawRect(QRectF(self.hover_rect.x0, self.hover_rect.y0, self.hover_rect.width, self.hover_rect.height))
             finally:
                 painter.restore()
@@ -2705,13 +3540,10 @@ class PdfViewerWidget(QLabel):
                 if overlay:
                     painter.save()
                     try:
-                        pen_w = 2.0 / scale if scale > 0 else 2.0
-                        pen = QPen(QColor(0, 200, 0), pen_w)
-                        pen.setStyle(Qt.PenStyle.CustomDashLine)
-                        pen.setDashPattern([6/scale, 4/scale])
+                        pen = tools['active']
                         pen.setDashOffset(self._anim_phase / scale)
                         painter.setPen(pen)
-                        painter.setBrush(QBrush(QColor(0, 200, 0, 30)))
+                        painter.setBrush(tools['active_brush'])
                         painter.drawRect(QRectF(overlay.bbox.x0, overlay.bbox.y0, overlay.bbox.width, overlay.bbox.height))
                     finally:
                         painter.restore()
@@ -2722,9 +3554,8 @@ class PdfViewerWidget(QLabel):
             if abox:
                 painter.save()
                 try:
-                    pen_w = 2.5 / scale if scale > 0 else 2.5
-                    painter.setPen(QPen(QColor(255, 165, 0), pen_w))
-                    painter.setBrush(QBrush(QColor(255, 165, 0, 60)))
+                    painter.setPen(tools['adjust'])
+                    painter.setBrush(tools['adjust_brush'])
                     painter.drawRect(QRectF(abox.x0, abox.y0, abox.width, abox.height))
                     # 십자선 (픽셀 단위 시인성 확보를 위해 조정)
                     center = QRectF(abox.x0, abox.y0, abox.width, abox.height).center()
@@ -2735,15 +3566,11 @@ class PdfViewerWidget(QLabel):
                     painter.restore()
 
         # 6. 텍스트 오버레이 실제 내용 렌더링
-        if hasattr(self, 'text_overlays') and self.current_page_num in self.text_overlays:
-            sorted_ovs = sorted(self.text_overlays[self.current_page_num], key=lambda x: x.z_index)
-            for ov in sorted_ovs:
-                if ov.visible:
-                    try:
-                        # 절대 좌표계에서 직접 렌더링
-                        ov.render_to_painter(painter, scale, offsets=(0, 0))
-                    except Exception as e_ov:
-                        print(f"오버레이 렌더링 에러: {e_ov}")
+        # 평상시에는 보이는 영역만 합성한 레이어를 blit (애니메이션 틱마다 글리프 재래스터화 방지),
+        # 이동/편집 중이거나 레이어가 너무 크면 기존처럼 직접 그림
+        overlay_layer = self._overlay_layer(scale, offset_x, offset_y)
+        if overlay_layer is None:
+            self._draw_overlays(painter, scale)
 
         # PDF 좌표계 변환 종료 (반드시 호출)
         try:
@@ -2751,18 +3578,146 @@ class PdfViewerWidget(QLabel):
         except Exception:
             pass
 
+        if overlay_layer is not None:
+            layer_rect, layer = overlay_layer
+            painter.drawPixmap(layer_rect.topLeft(), layer)
+
         # 7. 사각형 영역 선택 (Ctrl + 드래그) - 이건 화면 좌표계 유지
         if self.selection_mode and self.selection_rect:
             painter.save()
             try:
-                painter.setPen(QPen(QColor(255, 0, 0, 200), 2))
-                painter.setBrush(QBrush(QColor(255, 0, 0, 50)))
+                painter.setPen(tools['selection'])
+                painter.setBrush(tools['selection_brush'])
                 painter.drawRect(self.selection_rect)
             finally:
                 painter.restore()
 
         painter.end()
     
+    _BG_DARK = QColor(30, 31, 34)
+    _BG_LIGHT = QColor(240, 240, 240)
+
+    def _paint_tools(self, scale):
+        """paintEvent용 펜/브러시를 배율별로 한 번만 생성 (점선 펜은 프레임마다 dash offset만 갱신)"""
+        cached = self._paint_tools_cache
+        if cached is not None and cached[0] == scale:
+            return cached[1]
+        inv = 1.0 / scale if scale > 0 else 1.0
+
+        def dash_pen(width):
+            pen = QPen(QColor(0, 200, 0), width * inv)
+            pen.setStyle(Qt.PenStyle.CustomDashLine)
+            pen.setDashPattern([6 * inv, 4 * inv])
+            return pen
+
+        tools = {
+            # 점선 테두리는 눈에 보여야 하므로 스케일 역산하여 1px 유지
+            'patch_active': QPen(QColor(0, 0, 0, 150), inv, Qt.PenStyle.DashLine),
+            'hover_overlay': dash_pen(1.5),
+            'hover_text': QPen(QColor(0, 120, 255, 220), 1.5 * inv),
+            'hover_text_brush': QBrush(QColor(0, 120, 255, 50)),
+            'active': dash_pen(2.0),
+            'active_brush': QBrush(QColor(0, 200, 0, 30)),
+            'adjust': QPen(QColor(255, 165, 0), 2.5 * inv),
+            'adjust_brush': QBrush(QColor(255, 165, 0, 60)),
+            # 사각형 영역 선택은 화면 좌표계
+            'selection': QPen(QColor(255, 0, 0, 200), 2),
+            'selection_brush': QBrush(QColor(255, 0, 0, 50)),
+        }
+        self._paint_tools_cache = (scale, tools)
+        return tools
+
+    OVERLAY_LAYER_MAX_PIXELS = 8 * 1024 * 1024  # 합성 레이어 상한 (ARGB 약 32MB, 고배율/고DPI에서 위젯 전체 할당 방지)
+
+    def _draw_overlays(self, painter, scale):
+        """현재 페이지 오버레이를 z 순서대로 painter(PDF 좌표계 변환 적용 상태)에 직접 렌더링"""
+        overlays = self.text_overlays.get(self.current_page_num)
+        if not overlays:
+            return
+        for ov in sorted(overlays, key=lambda x: x.z_index):
+            if ov.visible:
+                try:
+                    # 절대 좌표계에서 직접 렌더링
+                    ov.render_to_painter(painter, scale, offsets=(0, 0))
+                except Exception as e_ov:
+                    _vlog(f"오버레이 렌더링 에러: {e_ov}")
+
+    def _overlay_layer(self, scale, offset_x, offset_y):
+        """현재 페이지 오버레이를 보이는 영역(+스크롤 여유분)만 투명 QPixmap 한 장으로 합성하여 (위젯 좌표 QRect, QPixmap) 반환.
+        오버레이 렌더링 상태/배율이 그대로이고 보이는 영역이 이전 레이어 안에 있으면 재사용한다.
+        이동/편집 중(입력마다 상태가 바뀜)이거나 상한을 넘으면 None을 반환해 직접 그리게 한다."""
+        overlays = self.text_overlays.get(self.current_page_num)
+        if not overlays:
+            return None
+        if self.text_adjustment_mode or self.quick_adjustment_mode or QApplication.activeModalWidget() is not None:
+            self._overlay_layer_cache = None
+            return None
+        visible = self.visibleRegion().boundingRect()
+        if visible.isEmpty():
+            return None
+        dpr = self.devicePixelRatioF()
+        size = self.size()
+        key = (id(self.doc), self.current_page_num, scale, offset_x, offset_y,
+               size.width(), size.height(), dpr, id(TextOverlay._families_set),
+               tuple(ov._render_key() for ov in overlays))
+        cached = self._overlay_layer_cache
+        if cached is not None and cached[0] == key and cached[1].contains(visible):
+            return cached[1], cached[2]
+
+        max_pixels = self.OVERLAY_LAYER_MAX_PIXELS
+        margin_x, margin_y = visible.width() // 4, visible.height() // 4
+        layer_rect = visible.adjusted(-margin_x, -margin_y, margin_x, margin_y).intersected(self.rect())
+        if layer_rect.width() * layer_rect.height() * dpr * dpr > max_pixels:
+            layer_rect = visible
+            if layer_rect.width() * layer_rect.height() * dpr * dpr > max_pixels:
+                self._overlay_layer_cache = None
+                return None
+
+        layer = QPixmap(max(1, int(math.ceil(layer_rect.width() * dpr))), max(1, int(math.ceil(layer_rect.height() * dpr))))
+        layer.setDevicePixelRatio(dpr)
+        layer.fill(Qt.GlobalColor.transparent)
+        lp = QPainter(layer)
+        try:
+            lp.setRenderHint(QPainter.RenderHint.Antialiasing)
+            lp.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform)
+            lp.setRenderHint(QPainter.RenderHint.TextAntialiasing)
+            # 레이어 범위로 클립해 범위 밖 오버레이는 render_to_painter에서 건너뜀
+            lp.setClipRect(QRectF(0, 0, layer_rect.width(), layer_rect.height()))
+            lp.translate(offset_x - layer_rect.x(), offset_y - layer_rect.y())
+            lp.scale(scale, scale)
+            self._draw_overlays(lp, scale)
+        finally:
+            lp.end()
+        self._overlay_layer_cache = (key, layer_rect, layer)
+        return layer_rect, layer
+
+    def _patch_paint(self, pentry):
+        """배경 패치의 그리기 객체 (QRectF, 불투명 브러시, 반투명 브러시, (r, g, b)) 반환.
+        bbox 값/색상이 그대로면 이전 프레임에서 만든 객체를 재사용한다."""
+        patch_bbox = pentry.get('bbox')
+        if not patch_bbox:
+            return None
+        stored_color = pentry.get('color')
+        key = (patch_bbox.x0, patch_bbox.y0, patch_bbox.x1, patch_bbox.y1, stored_color)
+        cached = self._patch_paint_cache.get(id(pentry))
+        if cached is not None and cached[0] == key:
+            return cached[1]
+
+        if stored_color:
+            r, g, b = int(stored_color[0]*255), int(stored_color[1]*255), int(stored_color[2]*255)
+        else:
+            r, g, b = 255, 255, 255
+        paint = (
+            QRectF(patch_bbox.x0, patch_bbox.y0, patch_bbox.width, patch_bbox.height),
+            QBrush(QColor(r, g, b, 255)),
+            QBrush(QColor(r, g, b, 128)),
+            (r, g, b),
+        )
+        if len(self._patch_paint_cache) >= 1024:
+            self._patch_paint_cache.clear()
+        self._patch_paint_cache[id(pentry)] = (key, paint)
+        return paint
+
     def _pdf_rect_to_screen_rect(self, pdf_rect):
         """PDF 좌표 사각형을 화면 좌표 사각형으로 변환"""
         try:
@@ -2792,23 +3747,7 @@ class PdfViewerWidget(QLabel):
             if not pixmap or pixmap.isNull():
                 return None
             
-            crect = self.contentsRect()
-            scale = getattr(self, 'pixmap_scale_factor', 1.0)
-            
-            # 실제 PDF 페이지 크기 (포인트 단위) 기반 정밀 오프셋
-            try:
-                page = self.doc.load_page(self.current_page_num)
-                pw_pt = page.rect.width
-                ph_pt = page.rect.height
-            except:
-                pw_pt = pixmap.width() / scale if scale > 0 else pixmap.width()
-                ph_pt = pixmap.height() / scale if scale > 0 else pixmap.height()
-
-            pw_px = pw_pt * scale
-            ph_px = ph_pt * scale
-            
-            offset_x = crect.left() + (crect.width() - pw_px) / 2.0
-            offset_y = crect.top() + (crect.height() - ph_px) / 2.0
+            scale, offset_x, offset_y = self._page_offsets(pixmap)
             
             screen_x0 = pdf_rect.x0 * scale + offset_x
             screen_y0 = pdf_rect.y0 * scale + offset_y
@@ -2837,6 +3776,37 @@ class PdfViewerWidget(QLabel):
         except:
             return None, None
 
+    def _page_offsets(self, pixmap):
+        """현재 페이지의 (scale, offset_x, offset_y)를 반환.
+        페이지 로드와 중앙 정렬 계산은 위젯 크기/배율/페이지가 바뀔 때만 다시 수행한다."""
+        crect = self.contentsRect()
+        scale = self.pixmap_scale_factor
+        key = (id(self.doc), self.current_page_num, scale,
+               crect.left(), crect.top(), crect.width(), crect.height(),
+               pixmap.width(), pixmap.height())
+        cached_key, cached = self._page_offset_cache
+        if cached_key == key:
+            return cached
+
+        # 실제 PDF 페이지 크기 (포인트 단위) 기반 정밀 오프셋
+        try:
+            page = self.doc.load_page(self.current_page_num)
+            pw_pt = page.rect.width
+            ph_pt = page.rect.height
+        except:
+            pw_pt = pixmap.width() / scale if scale > 0 else pixmap.width()
+            ph_pt = pixmap.height() / scale if scale > 0 else pixmap.height()
+
+        # 화면상의 실제 픽셀 크기 (float)
+        pw_px = pw_pt * scale
+        ph_px = ph_pt * scale
+
+        offset_x = crect.left() + (crect.width() - pw_px) / 2.0
+        offset_y = crect.top() + (crect.height() - ph_px) / 2.0
+        cached = (scale, offset_x, offset_y)
+        self._page_offset_cache = (key, cached)
+        return cached
+
     def _widget_point_to_pdf(self, widget_point: QPoint):
         """위젯 좌표(QPoint)를 PDF 좌표로 변환 (마진/테두리 반영)"""
         try:
@@ -2844,28 +3814,13 @@ class PdfViewerWidget(QLabel):
             if pixmap is None or pixmap.isNull():
                 return None, None
 
-            crect = self.contentsRect()
-            scale = getattr(self, 'pixmap_scale_factor', 1.0)
+            scale, offset_x, offset_y = self._page_offsets(pixmap)
             if scale <= 0:
                 return None, None
 
-            # 실제 PDF 페이지 크기 (포인트 단위) 기반 정밀 오프셋
-            try:
-                page = self.doc.load_page(self.current_page_num)
-                pw_pt = page.rect.width
-                ph_pt = page.rect.height
-            except:
-                pw_pt = pixmap.width() / scale
-                ph_pt = pixmap.height() / scale
-
-            pw_px = pw_pt * scale
-            ph_px = ph_pt * scale
-            
-            offset_x = crect.left() + (crect.width() - pw_px) / 2.0
-            offset_y = crect.top() + (crect.height() - ph_px) / 2.0
-
-            pdf_x = (widget_point.x() - offset_x) / scale
-            pdf_y = (widget_point.y() - offset_y) / scale
+            inv_scale = 1.0 / scale
+            pdf_x = (widget_point.x() - offset_x) * inv_scale
+            pdf_y = (widget_point.y() - offset_y) * inv_scale
             return pdf_x, pdf_y
         except Exception as e:
             print(f"_widget_point_to_pdf error: {e}")
@@ -2909,7 +3864,7 @@ class PdfViewerWidget(QLabel):
             if overlay:
                 # 레이어 방식: 오버레이 위치만 업데이트 (PDF 재렌더링 불필요)
                 self.move_overlay_to(overlay, new_bbox)
-                print(f"레이어 이동: '{overlay.text}' dx={dx}, dy={dy}")
+                _vlog(f"레이어 이동: '{overlay.text}' dx={dx}, dy={dy}")
                 
                 # 선택된 텍스트 정보 업데이트
                 self.selected_text_info['original_bbox'] = new_bbox
@@ -2923,7 +3878,7 @@ class PdfViewerWidget(QLabel):
                     if isinstance(self.hover_span_info, dict) and 'bbox' in self.hover_span_info:
                         self.hover_span_info['bbox'] = new_bbox
                 
-                print(f"   hover_rect 업데이트: {new_bbox}")
+                _vlog(f"   hover_rect 업데이트: {new_bbox}")
                 return
             
             # 레이어 오버레이가 없으면 기존 방식으로 fallback
@@ -2935,19 +3890,26 @@ class PdfViewerWidget(QLabel):
             # 오류 발생 시 기존 방식으로 fallback
             self._adjust_text_position_fallback(dx, dy, old_bbox, new_bbox)
         
-        print(f"텍스트 위치 조정: dx={dx}, dy={dy}")
+        _vlog(f"텍스트 위치 조정: dx={dx}, dy={dy}")
     
+    def _main_window(self):
+        """편집 기능(apply_background_patch 등)을 가진 메인 윈도우.
+        생성 시 전달된 parent_window를 우선 사용하고, 없을 때만 부모 체인을 탐색한다."""
+        main_window = self.parent_window
+        if main_window is not None and hasattr(main_window, 'apply_background_patch'):
+            return main_window
+        widget = self.parent()
+        while widget is not None and not hasattr(widget, 'apply_background_patch'):
+            widget = widget.parent()
+        if widget is not None:
+            self.parent_window = widget
+        return widget
+
     def _adjust_text_position_fallback(self, dx, dy, old_bbox, new_bbox):
         """텍스트 위치 조정 - 기존 PDF 렌더링 방식 fallback"""
         try:
             # 메인 윈도우 찾기
-            main_window = None
-            widget = self
-            while widget:
-                widget = widget.parent()
-                if isinstance(widget, QMainWindow):
-                    main_window = widget
-                    break
+            main_window = self._main_window()
             
             if not main_window:
                 print("메인 윈도우를 찾을 수 없습니다.")
@@ -2957,20 +3919,16 @@ class PdfViewerWidget(QLabel):
             page = self.doc.load_page(self.current_page_num)
             
             # 레거시 추적 시스템 업데이트
-            old_bbox_hash = self._get_bbox_hash(old_bbox)
-            if (self.current_page_num, old_bbox_hash) in self.overlay_texts:
-                self.overlay_texts.remove((self.current_page_num, old_bbox_hash))
-            
-            new_bbox_hash = self._get_bbox_hash(new_bbox)
-            self.overlay_texts.add((self.current_page_num, new_bbox_hash))
+            page_hashes = self.overlay_texts.setdefault(self.current_page_num, set())
+            page_hashes.discard(self._get_bbox_hash(old_bbox))
+            page_hashes.add(self._get_bbox_hash(new_bbox))
+            self._overlay_texts_version += 1
             
             # PDF 오버레이 업데이트 (배경 패치와 분리 관리)
             if hasattr(main_window, 'apply_background_patch'):
                 color_value = self.selected_text_info.get('color', 0)
-                if isinstance(color_value, int):
-                    text_color = QColor(0, 0, 0) if color_value == 0 else QColor(0, 0, 0)
-                else:
-                    text_color = color_value if hasattr(color_value, 'redF') else QColor(0, 0, 0)
+                # int(span 색상)를 포함해 QColor가 아닌 값은 모두 검정으로 처리 (기존 동작과 동일)
+                text_color = color_value if hasattr(color_value, 'redF') else QColor(0, 0, 0)
                 
                 new_values = {
                     'text': self.selected_text_info.get('text', ''),
@@ -3007,8 +3965,8 @@ class PdfViewerWidget(QLabel):
         try:
             # 선택 영역을 PDF 좌표로 변환
             pdf_selection_rect = self._screen_rect_to_pdf_rect(self.selection_rect)
-            print(f"화면 선택 영역: {self.selection_rect}")
-            print(f"PDF 선택 영역: {pdf_selection_rect}")
+            _vlog(f"화면 선택 영역: {self.selection_rect}")
+            _vlog(f"PDF 선택 영역: {pdf_selection_rect}")
             if not pdf_selection_rect:
                 print("X PDF 좌표 변환 실패 - 사각형 선택 취소")
                 return
@@ -3016,9 +3974,7 @@ class PdfViewerWidget(QLabel):
             page = self.doc.load_page(self.current_page_num)
 
             # 메인 윈도우 참조 획득
-            main_window = self
-            while main_window and not hasattr(main_window, 'apply_background_patch'):
-                main_window = main_window.parent()
+            main_window = self._main_window()
 
             if not main_window:
                 print("X MainWindow를 찾을 수 없어 작업을 중단합니다.")
@@ -3028,33 +3984,40 @@ class PdfViewerWidget(QLabel):
             # 텍스트: 영역 내 텍스트를 가져와 한 줄로 정규화
             try:
                 region_text = page.get_text("text", clip=pdf_selection_rect) or ""
-                region_text = re.sub(r"\s+", " ", region_text).strip()
+                region_text = " ".join(region_text.split())
             except Exception:
                 region_text = ""
 
             # 스타일: 가장 빈도 높은 폰트 / 평균 크기 / 가장 빈도 높은 색상
             try:
-                text_dict = page.get_text("dict")
-                fonts = []
-                sizes = []
-                colors = []
-                for block in text_dict.get("blocks", []):
-                    if block.get('type') != 0:
-                        continue
-                    for line in block.get("lines", []):
-                        for span in line.get("spans", []):
-                            span_bbox = fitz.Rect(span["bbox"])
-                            if span_bbox.intersects(pdf_selection_rect):
-                                if span.get('font'): fonts.append(span['font'])
-                                if span.get('size'): sizes.append(float(span['size']))
-                                if 'color' in span: colors.append(span['color'])
-                chosen_font = fonts and Counter(fonts).most_common(1)[0][0] or 'Arial'
-                chosen_size = sizes and (sum(sizes)/len(sizes)) or 12.0
-                chosen_color = colors and Counter(colors).most_common(1)[0][0] or 0
+                # 한 번의 순회로 폰트/색상 빈도와 크기 합계를 누적 (동률이면 먼저 나온 값 우선 - most_common과 동일)
+                font_counts = {}
+                color_counts = {}
+                size_sum = 0.0
+                size_n = 0
+                # fitz.Rect.intersects와 동일한 판정(빈 사각형 제외, 경계 접촉 미교차)을 span bbox 튜플로 직접 수행
+                sx0, sy0, sx1, sy1 = pdf_selection_rect.x0, pdf_selection_rect.y0, pdf_selection_rect.x1, pdf_selection_rect.y1
+                records = self._get_span_index(page.number).records if (sx0 < sx1 and sy0 < sy1) else ()
+                for _span_bbox, span, _line, _looks_overlay in records:
+                    bx0, by0, bx1, by1 = span["bbox"]
+                    if bx0 < sx1 and sx0 < bx1 and by0 < sy1 and sy0 < by1 and bx0 < bx1 and by0 < by1:
+                        font = span.get('font')
+                        if font:
+                            font_counts[font] = font_counts.get(font, 0) + 1
+                        size = span.get('size')
+                        if size:
+                            size_sum += float(size)
+                            size_n += 1
+                        if 'color' in span:
+                            color = span['color']
+                            color_counts[color] = color_counts.get(color, 0) + 1
+                chosen_font = max(font_counts, key=font_counts.get, default=None) or 'Arial'
+                chosen_size = size_n and (size_sum / size_n) or 12.0
+                chosen_color = max(color_counts, key=color_counts.get, default=None) or 0
             except Exception:
                 chosen_font, chosen_size, chosen_color = 'Arial', 12.0, 0
 
-            # 시스템 폰트 매칭
+            # 시스템 폰트 매칭 (SystemFontManager는 프로세스 단일 인스턴스이며 매칭 결과는 실패 포함 캐시됨)
             chosen_font_orig = chosen_font
             try:
                 fmgr = SystemFontManager()
@@ -3077,6 +4040,7 @@ class PdfViewerWidget(QLabel):
             patch_only_mode = getattr(main_window, 'patch_only_mode', False)
 
             if patch_only_mode:
+                # 사전 스냅샷: 직전 스냅샷 이후 저장 없이 바뀐 상태(방향키 이동/삭제 등)를 별도 undo 단계로 보존
                 if hasattr(main_window, 'undo_manager') and self.doc:
                     try:
                         main_window.undo_manager.save_state(self.doc, self)
@@ -3116,7 +4080,7 @@ class PdfViewerWidget(QLabel):
                     patch_rect, patch_color = main_window.apply_background_patch(page, pdf_selection_rect, new_values, overlay=None, preview=False)
                 except Exception:
                     patch_rect, patch_color = (pdf_selection_rect, None)
-                print("OK 선택 영역 배경 패치 적용 완료 (패치 전용 모드)")
+                _vlog("OK 선택 영역 배경 패치 적용 완료 (패치 전용 모드)")
 
                 if hasattr(main_window, 'undo_manager') and self.doc:
                     try:
@@ -3154,7 +4118,7 @@ class PdfViewerWidget(QLabel):
             dialog = TextEditorDialog(span_info, getattr(main_window, 'pdf_fonts', None), main_window)
             if dialog.exec() != QDialog.DialogCode.Accepted:
                 # 편집 취소: 아무 것도 적용하지 않고 상태만 초기화
-                print("사각형 선택 편집 취소 - 배경 패치/오버레이 적용 안 함")
+                _vlog("사각형 선택 편집 취소 - 배경 패치/오버레이 적용 안 함")
                 self.selection_rect = None
                 self.selection_mode = False
                 keep_enabled = getattr(main_window, 'patch_precise_mode', False)
@@ -3167,8 +4131,9 @@ class PdfViewerWidget(QLabel):
                 return
 
             # 편집 확정: 값 수집 및 사전 Undo 스냅샷
+            # (undo 스택 최상단은 '현재 상태'로 취급됨 - 방향키 이동처럼 스냅샷 없이 바뀐 상태를 보존하려면 사전/사후 저장 모두 필요)
             new_values = dialog.get_values()
-            print(f"사각형 선택 후 오버레이 값: {new_values}")
+            _vlog(f"사각형 선택 후 오버레이 값: {new_values}")
             if hasattr(main_window, 'undo_manager') and self.doc:
                 main_window.undo_manager.save_state(self.doc, self)
 
@@ -3188,10 +4153,10 @@ class PdfViewerWidget(QLabel):
                 patch_rect, patch_color = main_window.apply_background_patch(page, patch_target_rect, new_values, overlay=overlay, preview=False)
             except Exception:
                 patch_rect, patch_color = (patch_target_rect, None)
-            print(f"OK 최적화 영역 배경 패치 적용 완료: {patch_rect}")
+            _vlog(f"OK 최적화 영역 배경 패치 적용 완료: {patch_rect}")
 
             if overlay:
-                print(f"OK 새 텍스트 오버레이 생성 완료 (ID: {getattr(overlay, 'z_index', '?')})")
+                _vlog(f"OK 새 텍스트 오버레이 생성 완료 (ID: {getattr(overlay, 'z_index', '?')})")
                 overlay_info = {
                     'text': overlay.text,
                     'font': overlay.font,
@@ -3247,30 +4212,27 @@ class PdfViewerWidget(QLabel):
         return self._widget_point_to_pdf(QPoint(int(screen_x), int(screen_y)))
     
     def _screen_rect_to_pdf_rect(self, screen_rect):
-        """화면 사각형을 PDF 좌표계로 변환"""
+        """화면 사각형을 PDF 좌표계로 변환 (픽스맵 오프셋/배율을 한 번만 구해 두 모서리에 적용)"""
         try:
-            print(f"화면→PDF 좌표 변환 시작")
-            print(f"   입력 화면 사각형: {screen_rect}")
-            print(f"   topLeft: ({screen_rect.topLeft().x()}, {screen_rect.topLeft().y()})")
-            print(f"   bottomRight: ({screen_rect.bottomRight().x()}, {screen_rect.bottomRight().y()})")
-            print(f"   width x height: {screen_rect.width()} x {screen_rect.height()}")
-            print(f"   현재 pixmap_scale_factor: {self.pixmap_scale_factor}")
-            
-            # 좌상단과 우하단 점을 PDF 좌표로 변환
-            top_left_pdf = self._screen_to_pdf_coordinates(screen_rect.topLeft().x(), screen_rect.topLeft().y())
-            bottom_right_pdf = self._screen_to_pdf_coordinates(screen_rect.bottomRight().x(), screen_rect.bottomRight().y())
-            
-            print(f"   변환된 PDF 좌상단: {top_left_pdf}")
-            print(f"   변환된 PDF 우하단: {bottom_right_pdf}")
-            
-            if top_left_pdf[0] is not None and bottom_right_pdf[0] is not None:
-                pdf_rect = fitz.Rect(top_left_pdf[0], top_left_pdf[1], bottom_right_pdf[0], bottom_right_pdf[1])
-                print(f"   최종 PDF 사각형: {pdf_rect}")
-                print(f"   PDF 크기: {pdf_rect.width:.1f} x {pdf_rect.height:.1f}")
-                return pdf_rect
-            else:
+            pixmap = self.pixmap()
+            if pixmap is None or pixmap.isNull():
                 print(f"   X 좌표 변환 실패")
                 return None
+            scale, offset_x, offset_y = self._page_offsets(pixmap)
+            if scale <= 0:
+                print(f"   X 좌표 변환 실패")
+                return None
+
+            inv_scale = 1.0 / scale
+            top_left = screen_rect.topLeft()
+            bottom_right = screen_rect.bottomRight()
+            pdf_rect = fitz.Rect(
+                (top_left.x() - offset_x) * inv_scale, (top_left.y() - offset_y) * inv_scale,
+                (bottom_right.x() - offset_x) * inv_scale, (bottom_right.y() - offset_y) * inv_scale,
+            )
+            _vlog(f"화면→PDF 좌표 변환: {screen_rect} (배율 {scale:.3f}) -> {pdf_rect}")
+            _vlog(f"   PDF 크기: {pdf_rect.width:.1f} x {pdf_rect.height:.1f}")
+            return pdf_rect
         except Exception as e:
             print(f"X 좌표 변환 오류: {e}")
             return None
@@ -3292,84 +4254,77 @@ class PdfViewerWidget(QLabel):
             return
             
         try:
-            # 호버된 텍스트 정보 수집
-            page = self.doc.load_page(self.current_page_num)
-            current_text_dict = page.get_text("dict")
+            # 호버된 텍스트 정보 수집 (캐시된 span 인덱스 - 문서 순서 유지)
+            span_index = self._get_span_index(self.current_page_num)
             
             # 호버 영역과 일치하는 텍스트 찾기
-            for block in current_text_dict.get("blocks", []):
-                if block.get('type') != 0:
-                    continue
-                for line in block.get("lines", []):
-                    for span in line.get("spans", []):
-                        bbox = fitz.Rect(span["bbox"])
-                        
-                        # 호버 영역과 일치하는 텍스트 찾기
-                        if self._rects_overlap(bbox, self.hover_rect, tol=1.0):
-                            # 오버레이된 텍스트인지 확인 (수정된 텍스트만 위치조정 가능)
-                            if not self.is_overlay_text(span, bbox):
-                                print(f"원본 텍스트는 위치조정 불가: {span.get('text', '')}")
-                                return
-                            
-                            # 텍스트 정보 설정
-                            text_info = {
-                                'text': span.get('text', ''),
-                                'font': span.get('font', 'Unknown'),
-                                'size': span.get('size', 12),
-                                'flags': span.get('flags', 0),
-                                'color': span.get('color', 0),
-                                'original_bbox': bbox,
-                                'span': span,
-                                'page_num': self.current_page_num
-                            }
-                            
-                            # Quick adjustment 모드 시작
-                            self.quick_adjustment_mode = True
-                            self.selected_text_info = text_info.copy()
-                            self.setCursor(Qt.CursorShape.SizeAllCursor)
-                            print(f"오버레이 텍스트 위치조정 모드 시작: {span.get('text', '')}")
-                            overlay_obj = self.find_overlay_at_position(self.current_page_num, bbox)
-                            if not overlay_obj:
-                                overlay_obj = self.find_overlay_by_current_position(self.current_page_num, bbox)
-                            if overlay_obj:
-                                self.active_overlay = (self.current_page_num, overlay_obj.z_index)
-                            else:
-                                self.active_overlay = None
-                            self.update()
-                            return
-                            
+            for bbox, span, _line, looks_overlay in span_index.records:
+                if self._rects_overlap(bbox, self.hover_rect, tol=1.0):
+                    # 오버레이된 텍스트인지 확인 (수정된 텍스트만 위치조정 가능)
+                    if not self.is_overlay_text(span, bbox, looks_overlay):
+                        print(f"원본 텍스트는 위치조정 불가: {span.get('text', '')}")
+                        return
+                    
+                    # 텍스트 정보 설정
+                    text_info = {
+                        'text': span.get('text', ''),
+                        'font': span.get('font', 'Unknown'),
+                        'size': span.get('size', 12),
+                        'flags': span.get('flags', 0),
+                        'color': span.get('color', 0),
+                        'original_bbox': fitz.Rect(bbox),  # 인덱스 레코드와 분리된 사본
+                        'span': span,
+                        'page_num': self.current_page_num
+                    }
+                    
+                    # Quick adjustment 모드 시작
+                    self.quick_adjustment_mode = True
+                    self.selected_text_info = text_info.copy()
+                    self.setCursor(Qt.CursorShape.SizeAllCursor)
+                    print(f"오버레이 텍스트 위치조정 모드 시작: {span.get('text', '')}")
+                    overlay_obj = self.find_overlay_at_position(self.current_page_num, bbox)
+                    if not overlay_obj:
+                        overlay_obj = self.find_overlay_by_current_position(self.current_page_num, bbox)
+                    if overlay_obj:
+                        self.active_overlay = (self.current_page_num, overlay_obj.z_index)
+                    else:
+                        self.active_overlay = None
+                    self.update()
+                    return
+                    
         except Exception as e:
             print(f"Error in start_position_adjustment_from_hover: {e}")
             return
     
-    def is_overlay_text(self, span, bbox):
-        """텍스트가 오버레이된 텍스트인지 확인 - 레이어 시스템 + 추적 시스템 기반"""
+    def is_overlay_text(self, span, bbox, looks_overlay=None):
+        """텍스트가 오버레이된 텍스트인지 확인 - 레이어 시스템 + 추적 시스템 기반
+        looks_overlay: span 인덱스에 미리 계산된 휴리스틱 결과 (참이면 레이어 검색 생략)
+        """
         try:
+            if looks_overlay:
+                return True
+
             # 1. 새로운 레이어 시스템에서 확인 (최우선)
             overlay = self.find_overlay_at_position(self.current_page_num, bbox)
             if overlay:
-                print(f"레이어 시스템에서 오버레이 감지: '{overlay.text}'")
+                _vlog(f"레이어 시스템에서 오버레이 감지: '{overlay.text}'")
                 return True
             
             # 2. 레거시 추적 시스템에서 확인
             bbox_hash = self._get_bbox_hash(bbox)
-            if (self.current_page_num, bbox_hash) in self.overlay_texts:
-                print(f"추적 시스템에서 오버레이 감지: {bbox_hash}")
+            if bbox_hash in self.overlay_texts.get(self.current_page_num, ()):
+                _vlog(f"추적 시스템에서 오버레이 감지: {bbox_hash}")
                 return True
                 
-            # 3. 휴리스틱 검사
+            # 3. 휴리스틱 검사 (명확한 오버레이 표시자들)
             font_name = span.get('font', '')
             color = span.get('color', 0)
             size = span.get('size', 12)
-            
-            # 명확한 오버레이 표시자들
-            if ('+' in font_name or 'C2_' in font_name or  # 임베디드 폰트
-                color != 0 or  # 검은색이 아닌 텍스트
-                size > 20 or size < 6):  # 비정상적 크기
-                print(f"휴리스틱으로 오버레이 감지: font={font_name}, color={color}, size={size}")
+            if looks_overlay is None and _span_looks_like_overlay(span):
+                _vlog(f"휴리스틱으로 오버레이 감지: font={font_name}, color={color}, size={size}")
                 return True
             
-            print(f"원본 텍스트로 판정: font={font_name}, color={color}, size={size}")
+            _vlog(f"원본 텍스트로 판정: font={font_name}, color={color}, size={size}")
             return False  # 기본적으로 원본 텍스트로 간주
             
         except Exception as e:
@@ -3377,19 +4332,22 @@ class PdfViewerWidget(QLabel):
             return False
     
     def _get_bbox_hash(self, bbox):
-        """bbox 해시 생성"""
-        return f"{bbox.x0:.1f},{bbox.y0:.1f},{bbox.x1:.1f},{bbox.y1:.1f}"
+        """bbox 해시 생성 (0.1pt 단위 정수 튜플)"""
+        return _bbox_key(bbox)
     
     def register_overlay_text(self, page_num, bbox):
         """오버레이 텍스트를 추적 시스템에 등록 (레거시)"""
         bbox_hash = self._get_bbox_hash(bbox)
-        self.overlay_texts.add((page_num, bbox_hash))
+        self.overlay_texts.setdefault(page_num, set()).add(bbox_hash)
+        self._overlay_texts_version += 1
         print(f"오버레이 텍스트 등록: 페이지 {page_num}, bbox {bbox_hash}")
         
     def unregister_overlay_text(self, page_num, bbox):
         bbox_hash = self._get_bbox_hash(bbox)
-        if (page_num, bbox_hash) in self.overlay_texts:
-            self.overlay_texts.discard((page_num, bbox_hash))
+        page_hashes = self.overlay_texts.get(page_num)
+        if page_hashes and bbox_hash in page_hashes:
+            page_hashes.discard(bbox_hash)
+            self._overlay_texts_version += 1
             print(f"오버레이 텍스트 해제: 페이지 {page_num}, bbox {bbox_hash}")
 
     @staticmethod
@@ -3416,12 +4374,46 @@ class PdfViewerWidget(QLabel):
     def _rects_overlap(rect_a: fitz.Rect, rect_b: fitz.Rect, tol: float = 0.75) -> bool:
         if rect_a is None or rect_b is None:
             return False
-        expanded_a = fitz.Rect(rect_a.x0 - tol, rect_a.y0 - tol, rect_a.x1 + tol, rect_a.y1 + tol)
-        expanded_b = fitz.Rect(rect_b.x0 - tol, rect_b.y0 - tol, rect_b.x1 + tol, rect_b.y1 + tol)
-        return expanded_a.intersects(expanded_b)
+        # 허용오차만큼 확장한 두 사각형의 교차 판정 (fitz.Rect.intersects와 동일: 빈 사각형 제외, 경계 접촉은 미교차)
+        # 임시 Rect 생성 없이 float 비교만 수행
+        ax0, ay0, ax1, ay1 = rect_a.x0 - tol, rect_a.y0 - tol, rect_a.x1 + tol, rect_a.y1 + tol
+        bx0, by0, bx1, by1 = rect_b.x0 - tol, rect_b.y0 - tol, rect_b.x1 + tol, rect_b.y1 + tol
+        return (ax0 < ax1 and ay0 < ay1 and bx0 < bx1 and by0 < by1 and
+                ax0 < bx1 and bx0 < ax1 and ay0 < by1 and by0 < ay1)
+
+    def _overlay_at_point(self, page_num, point, tol: float = 0.75):
+        """point를 포함하는 최상위(가장 나중에 추가된) 보이는 오버레이"""
+        overlays = self.text_overlays.get(page_num)
+        if not overlays:
+            return None
+        px, py = point.x, point.y
+        for ov in reversed(overlays):
+            if not ov.visible:
+                continue
+            r = ov.bbox
+            if r.x0 - tol <= px <= r.x1 + tol and r.y0 - tol <= py <= r.y1 + tol:
+                return ov
+        return None
 
     def get_overlay_by_id(self, page_num: int, overlay_id: int):
-        overlays = self.text_overlays.get(page_num, [])
+        overlays = self.text_overlays.get(page_num)
+        if not overlays:
+            return None
+        # 페이지별 z_index → 오버레이 맵. 목록은 여러 경로에서 직접 수정되므로
+        # (목록 객체, 길이, 마지막 항목)이 그대로일 때만 재사용하고, 찾은 항목의 z_index도 재확인
+        version = (id(overlays), len(overlays), id(overlays[-1]))
+        cached = self._overlay_id_maps.get(page_num)
+        if cached is None or cached[0] != version:
+            by_id = {}
+            for overlay in overlays:
+                by_id.setdefault(overlay.z_index, overlay)  # 중복 z_index는 기존처럼 앞쪽 우선
+            cached = (version, by_id)
+            self._overlay_id_maps[page_num] = cached
+        overlay = cached[1].get(overlay_id)
+        if overlay is None or overlay.z_index == overlay_id:
+            return overlay
+        # 맵 생성 후 z_index가 바뀌어 어긋난 경우 기존 순차 탐색으로 보정
+        self._overlay_id_maps.pop(page_num, None)
         for overlay in overlays:
             if overlay.z_index == overlay_id:
                 return overlay
@@ -3456,7 +4448,7 @@ class PdfViewerWidget(QLabel):
         pdf_font_name=None
     ):
         """새로운 텍스트 오버레이 추가 (레이어 방식) - 완전한 속성 지원"""
-        print(f"TextOverlay 생성 중 - 폰트: '{font}', 크기: {size}, 플래그: {flags}")
+        _vlog(f"TextOverlay 생성 중 - 폰트: '{font}', 크기: {size}, 플래그: {flags}")
         norm_height = TextOverlay._normalize_height_ratio(height_ratio if height_ratio is not None else 1.15)
         preview_norm = TextOverlay._normalize_height_ratio(preview_height_ratio if preview_height_ratio is not None else norm_height)
         if ascent_ratio is None:
@@ -3496,12 +4488,9 @@ class PdfViewerWidget(QLabel):
                 new_values=new_values
             )
 
-        if page_num not in self.text_overlays:
-            self.text_overlays[page_num] = []
-
-        self.text_overlays[page_num].append(overlay)
-        print(f"레이어 오버레이 추가: 페이지 {page_num}, 텍스트 '{text}', ID {overlay.z_index}")
-        print(f"   속성: 폰트='{font}', 크기={size}px, 플래그={flags}, 색상={color}")
+        self.text_overlays.setdefault(page_num, []).append(overlay)
+        _vlog(f"레이어 오버레이 추가: 페이지 {page_num}, 텍스트 '{text}', ID {overlay.z_index}")
+        _vlog(f"   속성: 폰트='{font}', 크기={size}px, 플래그={flags}, 색상={color}")
         return overlay
         
     def find_overlay_at_position(self, page_num, bbox):
@@ -3510,10 +4499,12 @@ class PdfViewerWidget(QLabel):
             return None
             
         target = fitz.Rect(bbox)
+        rects_close = self._rects_close
+        rects_overlap = self._rects_overlap
         for overlay in reversed(self.text_overlays[page_num]):
-            if self._rects_close(overlay.original_bbox, target) or self._rects_close(overlay.bbox, target):
-                return overlay
-            if self._rects_overlap(overlay.bbox, target):
+            current = overlay.bbox
+            if (rects_close(overlay.original_bbox, target) or rects_close(current, target)
+                    or rects_overlap(current, target)):
                 return overlay
         return None
         
@@ -3531,7 +4522,7 @@ class PdfViewerWidget(QLabel):
     def move_overlay_to(self, overlay, new_bbox):
         """오버레이를 새 위치로 이동 (레이어 방식)"""
         if overlay:
-            print(f"오버레이 이동: '{overlay.text}' -> {new_bbox}")
+            _vlog(f"오버레이 이동: '{overlay.text}' -> {new_bbox}")
             overlay.move_to(new_bbox)
             self.update()  # 화면 갱신만 필요 (PDF 렌더링 불필요)
 
@@ -3596,16 +4587,15 @@ class PdfViewerWidget(QLabel):
     
     def add_background_patch(self, page_num, bbox, color=None, overlay_id=None):
         """배경 패치 영역 추가 (항상 새 패치 추가: 최신 패치가 위를 덮음)"""
-        if page_num not in self.background_patches:
-            self.background_patches[page_num] = []
         entry = {'bbox': bbox, 'overlay_id': overlay_id}
         if color is not None:
             if isinstance(color, QColor):
                 entry['color'] = (color.redF(), color.greenF(), color.blueF())
             else:
                 entry['color'] = color
-        self.background_patches[page_num].append(entry)
-        print(f"배경 패치 영역 추가: 페이지 {page_num} (누적 {len(self.background_patches[page_num])})")
+        page_patches = self.background_patches.setdefault(page_num, [])
+        page_patches.append(entry)
+        print(f"배경 패치 영역 추가: 페이지 {page_num} (누적 {len(page_patches)})")
         # 즉시 화면 갱신
         self.update()
     
@@ -3678,66 +4668,27 @@ class PdfViewerWidget(QLabel):
                 pdf_x = label_pos.x() / self.pixmap_scale_factor
                 pdf_y = label_pos.y() / self.pixmap_scale_factor
             
-            pdf_point = fitz.Point(pdf_x, pdf_y)
-            page = self.doc.load_page(self.current_page_num)
-            text_dict = page.get_text("dict")
-            
-            # 오버레이된 텍스트 우선 검색 (최신 페이지 상태에서)
-            closest_span = None
-            min_distance = float('inf')
-            
-            # 페이지를 다시 로드하여 최신 상태의 텍스트 정보 가져오기
-            current_page = self.doc.load_page(self.current_page_num)
-            current_text_dict = current_page.get_text("dict")
-            
-            for block in current_text_dict.get("blocks", []):
-                if block.get('type') != 0:
-                    continue
-                for line in block.get("lines", []):
-                    for span in line.get("spans", []):
-                        bbox = fitz.Rect(span["bbox"])
-                        
-                        if self._rect_contains_point(bbox, pdf_point):
-                            closest_span = span
-                            min_distance = 0
-                            break
-                        
-                        # 거리 계산
-                        center_x = (bbox.x0 + bbox.x1) / 2
-                        center_y = (bbox.y0 + bbox.y1) / 2
-                        distance = ((pdf_x - center_x) ** 2 + (pdf_y - center_y) ** 2) ** 0.5
-                        
-                        if distance < min_distance:
-                            min_distance = distance
-                            closest_span = span
-                
-                if min_distance == 0:
-                    break
-            
             # 0) 오버레이 우선 히트 테스트: 오버레이가 클릭 지점에 있으면 그것만 선택
-            if self.text_overlays.get(self.current_page_num):
-                for ov in reversed(self.text_overlays[self.current_page_num]):
-                    if ov.visible:
-                        bbox = ov.bbox
-                        if self._rect_contains_point(bbox, fitz.Point(pdf_x, pdf_y)):
-                            overlay_info = {
-                                'text': ov.text,
-                                'font': ov.font,
-                                'size': ov.size,
-                                'flags': ov.flags,
-                                'color': ov.color,
-                                'original_bbox': ov.original_bbox,
-                                'current_bbox': ov.bbox,
-                                'is_overlay': True,
-                                'overlay_id': ov.z_index,
-                                'page_num': self.current_page_num,
-                                'synth_bold_weight': getattr(ov, 'synth_bold_weight', 120),
-                                'underline_weight': getattr(ov, 'underline_weight', 0.6),
-                                'underline_offset': getattr(ov, 'underline_offset', 1.5)
-                            }
-                            self.enter_quick_adjustment_mode(overlay_info)
-                            self.pending_single_click_pos = None
-                            return
+            ov = self._overlay_at_point(self.current_page_num, fitz.Point(pdf_x, pdf_y))
+            if ov is not None:
+                overlay_info = {
+                    'text': ov.text,
+                    'font': ov.font,
+                    'size': ov.size,
+                    'flags': ov.flags,
+                    'color': ov.color,
+                    'original_bbox': ov.original_bbox,
+                    'current_bbox': ov.bbox,
+                    'is_overlay': True,
+                    'overlay_id': ov.z_index,
+                    'page_num': self.current_page_num,
+                    'synth_bold_weight': getattr(ov, 'synth_bold_weight', 120),
+                    'underline_weight': getattr(ov, 'underline_weight', 0.6),
+                    'underline_offset': getattr(ov, 'underline_offset', 1.5)
+                }
+                self.enter_quick_adjustment_mode(overlay_info)
+                self.pending_single_click_pos = None
+                return
 
             # 오버레이가 아니면, 원본 텍스트로는 빠른 조정 모드에 진입하지 않음
             print("No overlay at click. Skipping quick adjustment for original text.")
@@ -3789,18 +4740,14 @@ class PdfViewerWidget(QLabel):
             prev_last_char = prev_text[-1]
             curr_first_char = curr_text[0]
             
-            # 한글 문자인지 확인
-            def is_korean(char):
-                return '가' <= char <= '힣' or 'ㄱ' <= char <= 'ㅣ'
-            
-            # 영문/숫자인지 확인
-            def is_alphanumeric(char):
-                return char.isalnum() and not is_korean(char)
+            # 한글(완성형/자모) 여부
+            prev_korean = _RE_HANGUL_OR_JAMO.match(prev_last_char) is not None
+            curr_korean = _RE_HANGUL_OR_JAMO.match(curr_first_char) is not None
             
             # 한글-영문/숫자 또는 영문/숫자-한글 조합에서 공백 필요
             return (
-                (is_korean(prev_last_char) and is_alphanumeric(curr_first_char)) or
-                (is_alphanumeric(prev_last_char) and is_korean(curr_first_char))
+                (prev_korean and not curr_korean and curr_first_char.isalnum()) or
+                (curr_korean and not prev_korean and prev_last_char.isalnum())
             )
         except Exception:
             return False
@@ -4000,6 +4947,7 @@ class UndoRedoManager:
 
 class MainWindow(QMainWindow):
     _instance = None # 전역 접근을 위한 클래스 변수
+    _translation_cache: dict = {}  # (언어, 키) -> 폴백까지 해석된 번역 문자열
 
     def __init__(self, initial_pdf_path: Optional[str] = None):
         super().__init__()
@@ -4164,9 +5112,7 @@ class MainWindow(QMainWindow):
             family = None
             if font_path:
                 try:
-                    font_id = QFontDatabase.addApplicationFont(font_path)
-                    families = QFontDatabase.applicationFontFamilies(font_id)
-                    family = families[0] if families else None
+                    family = TextOverlay._load_font_family(font_path, font_name)
                 except Exception:
                     family = None
             qfont = QFont(family or font_name or '')
@@ -4433,6 +5379,7 @@ class MainWindow(QMainWindow):
 
     def _init_translations(self):
         self.translations = {}
+        MainWindow._translation_cache = {}
         try:
             # 설정에서 저장된 언어 불러오기 (기본값 ko)
             self.language = str(self.settings.value('language', 'ko'))
@@ -4475,15 +5422,19 @@ class MainWindow(QMainWindow):
     def t(cls, key: str, **kwargs) -> str:
         """전역 번역 유틸리티 (MainWindow._instance 활용)"""
         if cls._instance:
-            # 1. 현재 선택된 언어 딕셔너리
-            lang_dict = cls._instance.translations.get(cls._instance.language, {})
-            # 2. 한국어 딕셔너리 (최종 폴백용)
-            fallback_ko = cls._instance.translations.get('ko', {})
-            # 3. 영어 딕셔너리 (차선 폴백용)
-            fallback_en = cls._instance.translations.get('en', {})
-            
-            # 순서대로 찾음: 현재 언어 -> 한국어 -> 영어 -> 키 자체
-            text = lang_dict.get(key, fallback_ko.get(key, fallback_en.get(key, key)))
+            cache_key = (cls._instance.language, key)
+            text = cls._translation_cache.get(cache_key)
+            if text is None:
+                # 1. 현재 선택된 언어 딕셔너리
+                lang_dict = cls._instance.translations.get(cls._instance.language, {})
+                # 2. 한국어 딕셔너리 (최종 폴백용)
+                fallback_ko = cls._instance.translations.get('ko', {})
+                # 3. 영어 딕셔너리 (차선 폴백용)
+                fallback_en = cls._instance.translations.get('en', {})
+                
+                # 순서대로 찾음: 현재 언어 -> 한국어 -> 영어 -> 키 자체
+                text = lang_dict.get(key, fallback_ko.get(key, fallback_en.get(key, key)))
+                cls._translation_cache[cache_key] = text
         else:
             # 인스턴스가 없을 때의 기본 폴백 (사실상 발생 안함)
             text = key
@@ -4761,6 +5712,10 @@ class MainWindow(QMainWindow):
         self.font_dump_verbose = getattr(self, 'font_dump_verbose', 1)
         self.font_log_action = tools_menu.addAction(self._font_log_action_text())
         self.font_log_action.triggered.connect(self.toggle_font_log_verbosity)
+
+        # 시스템 폰트 목록 재스캔 (번들 fontlist 무시)
+        rebuild_font_cache_action = tools_menu.addAction(self.t('action_rebuild_font_cache'))
+        rebuild_font_cache_action.triggered.connect(self.rebuild_font_cache)
         
         # 언어 메뉴 (i18n 폴더의 파일에 따라 동적 생성)
         language_menu = menubar.addMenu(self.t('language_menu'))
@@ -5135,9 +6090,11 @@ class MainWindow(QMainWindow):
             except Exception:
                 pass
 
-            # PDF 폰트 정보 추출
-            font_extractor = PdfFontExtractor(doc)
-            font_extractor.extract_fonts_from_document()
+            # PDF 폰트 정보 추출 (set_document에서 이미 추출한 결과 재사용)
+            font_extractor = getattr(self.pdf_viewer, 'pdf_font_extractor', None)
+            if font_extractor is None or font_extractor.doc is not doc:
+                font_extractor = PdfFontExtractor(doc)
+                font_extractor.extract_fonts_from_document()
             self.pdf_fonts = font_extractor.get_matched_fonts()
 
             print(f"Found {len(self.pdf_fonts)} fonts in PDF:")
@@ -5534,27 +6491,34 @@ class MainWindow(QMainWindow):
             return
             
         try:
-            page = page_to_render if page_to_render is not None else \
-                   self.pdf_viewer.doc.load_page(self.pdf_viewer.current_page_num)
-            
             # 절대 배율 시스템 사용 (zoom_factor 자체가 절대 배율임)
             self.current_base_scale = 1.0
             final_scale = self.zoom_factor
             
             self.pdf_viewer.pixmap_scale_factor = final_scale
             
-            # 렌더링
-            matrix = fitz.Matrix(final_scale, final_scale)
-            pix = page.get_pixmap(matrix=matrix, alpha=False)
-            
-            # QImage로 변환
-            image_format = QImage.Format.Format_RGB888
-            qimage = QImage(pix.samples, pix.width, pix.height, pix.stride, image_format)
-            pixmap = QPixmap.fromImage(qimage)
+            # 페이지 이동/배율 왕복 시 래스터화 생략 (편집 후 명시적 재렌더(page_to_render)는 항상 새로 그림)
+            page_num = page_to_render.number if page_to_render is not None else self.pdf_viewer.current_page_num
+            pixmap = None if page_to_render is not None else self.pdf_viewer.cached_page_pixmap(page_num, final_scale)
+            if pixmap is None:
+                page = page_to_render if page_to_render is not None else \
+                       self.pdf_viewer.doc.load_page(page_num)
+                
+                # 렌더링
+                matrix = fitz.Matrix(final_scale, final_scale)
+                pix = page.get_pixmap(matrix=matrix, alpha=False)
+                
+                # QImage로 변환
+                image_format = QImage.Format.Format_RGB888
+                qimage = QImage(pix.samples, pix.width, pix.height, pix.stride, image_format)
+                pixmap = QPixmap.fromImage(qimage)
+                self.pdf_viewer.store_page_pixmap(page_num, final_scale, pixmap)
             
             # 위젯 크기를 픽스맵 크기에 맞춤
             self.pdf_viewer.setFixedSize(pixmap.size())
             self.pdf_viewer.setPixmap(pixmap)
+            # 화면 표시 후 유휴 시점에 호버용 텍스트 인덱스 예열
+            self.pdf_viewer.warm_text_cache(page_num)
             # 줌 라벨 갱신
             self.update_zoom_label()
 
@@ -5815,6 +6779,8 @@ class MainWindow(QMainWindow):
             except Exception as pe:
                 print(f"  X 페이지 {page_num} 플래튼 중 오류: {pe}")
 
+        # 페이지에 텍스트가 직접 기록되었으므로 호버/더블클릭용 텍스트 캐시 폐기
+        self.pdf_viewer.invalidate_text_cache()
         print("OK 모든 오버레이 플래튼 완료")
 
     def _do_insert_text(self, page, ov, font_ref, s_mat, font_args, baseline_y, text_x, line_height_pt, tracking_percent, stretch, fm_measure, is_hwp, need_synth_bold):
@@ -5822,6 +6788,9 @@ class MainWindow(QMainWindow):
         text_to_insert = ov.text or ''
         font_size = float(ov.size)
         lines = text_to_insert.splitlines() if "\n" in text_to_insert else [text_to_insert]
+        bold_offsets = ()
+        if need_synth_bold:
+            bold_offsets = _synth_bold_offsets(font_size, float(getattr(ov, 'synth_bold_weight', 120)))
         
         for li, line in enumerate(lines):
             curr_y = baseline_y + li * line_height_pt
@@ -5837,17 +6806,10 @@ class MainWindow(QMainWindow):
                 
                 if ch.strip():
                     if need_synth_bold:
-                        synth_weight = float(getattr(ov, 'synth_bold_weight', 120))
-                        offset_factor = (synth_weight - 100.0) / 100.0 * 0.15
-                        total_bold_dx = font_size * offset_factor
-                        half_dx = total_bold_dx / 2.0
-                        step = 0.05
-                        sx = -half_dx
-                        while sx <= half_dx + 0.001:
+                        for sx in bold_offsets:
                             target_p = fitz.Point(curr_x + sx, curr_y)
                             page.insert_text(target_p, ch, fontname=font_ref, 
                                            morph=(target_p, s_mat), **font_args)
-                            sx += step
                     else:
                         target_p = fitz.Point(curr_x, curr_y)
                         page.insert_text(target_p, ch, fontname=font_ref, 
@@ -6312,6 +7274,7 @@ class MainWindow(QMainWindow):
 
                 if not preview:
                     page.draw_rect(patch_rect, color=bg_color, fill=bg_color, width=0)
+                    self.pdf_viewer.invalidate_text_cache(page.number)
 
                 if hasattr(self.pdf_viewer, 'add_background_patch'):
                     qcolor = QColor(int(bg_color[0] * 255), int(bg_color[1] * 255), int(bg_color[2] * 255))
@@ -6344,6 +7307,7 @@ class MainWindow(QMainWindow):
                 if not preview:
                     page.draw_rect(safe_rect, color=safe_color, fill=safe_color, width=0)
                     page.draw_rect(original_bbox, color=safe_color, fill=safe_color, width=0)
+                    self.pdf_viewer.invalidate_text_cache(page.number)
 
                 overlay_id = getattr(overlay, 'z_index', None) if overlay else None
                 page_index = overlay.page_num if overlay else self.pdf_viewer.current_page_num
@@ -6430,7 +7394,7 @@ class MainWindow(QMainWindow):
                 print(f"   OK 폰트 경로 발견: {font_path}")
             else:
                 print(f"   X 폰트 경로 없음, FontMatcher로 유사폰트 검색...")
-                matched_font = font_manager.font_matcher.find_best_match(selected_font_name)
+                matched_font = font_manager.font_matcher.find_best_match(selected_font_name) if font_manager.font_matcher else None
                 if matched_font:
                     print(f"   유사폰트 발견: '{selected_font_name}' → '{matched_font}'")
                     selected_font_name = matched_font
@@ -6817,6 +7781,7 @@ class MainWindow(QMainWindow):
             # 텍스트 위치 계산 및 삽입
             insert_point = fitz.Point(original_bbox.x0, original_bbox.y1 - 2)
             page.insert_text(insert_point, text_to_insert, **font_args)
+            self.pdf_viewer.invalidate_text_cache(page.number)
             print(f"Fallback 텍스트 삽입: '{text_to_insert}'")
             
             return None
@@ -7159,6 +8124,16 @@ class MainWindow(QMainWindow):
             self.font_log_action.setText(self._font_log_action_text())
         print(f"글꼴 로그 상세도 변경: {self._font_log_action_text()}")
 
+    def rebuild_font_cache(self):
+        fmgr = self.font_manager if hasattr(self, 'font_manager') else SystemFontManager()
+        QApplication.setOverrideCursor(Qt.CursorShape.WaitCursor)
+        try:
+            fmgr.rescan()
+            _wait_for_font_scan(QApplication.instance(), fmgr)
+        finally:
+            QApplication.restoreOverrideCursor()
+        self.statusBar().showMessage(self.t('msg_font_cache_rebuilt', count=len(fmgr.font_map)), 3000)
+
     def _ensure_font_ref(self, page, font_name, force_reload=False):
         """문서에 폰트를 한 번만 임베딩하고 참조명을 반환합니다. 
         force_reload=True일 경우 캐시를 무시하고 다시 시도합니다."""
@@ -7683,6 +8658,7 @@ if __name__ == "__main__":
     main_window: Optional[MainWindow] = None
 
     try:
+        _wait_for_font_scan(app, SystemFontManager())
         initial_path = sys.argv[1] if len(sys.argv) > 1 else None
         main_window = MainWindow(initial_path)
 